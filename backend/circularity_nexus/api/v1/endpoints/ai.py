@@ -7,7 +7,7 @@ from pydantic import BaseModel
 from typing import Dict, Any, List, Optional
 from loguru import logger
 
-from circularity_nexus.services.groq_service import groq_service
+from circularity_nexus.services.groq_service import get_groq_service
 from circularity_nexus.core.exceptions import AIProcessingError
 
 router = APIRouter()
@@ -29,6 +29,8 @@ async def validate_waste(submission_id: int) -> Dict[str, Any]:
     mock_description = "Plastic water bottle, clear PET material"
     mock_weight = 0.025  # 25 grams
     
+    groq_service = get_groq_service()
+    
     try:
         if groq_service:
             result = await groq_service.classify_waste_from_description(
@@ -64,6 +66,8 @@ async def validate_waste(submission_id: int) -> Dict[str, Any]:
 @router.post("/analyze")
 async def analyze_waste(request: WasteAnalysisRequest) -> Dict[str, Any]:
     """Analyze waste from description and/or image"""
+    groq_service = get_groq_service()
+    
     try:
         if not groq_service:
             raise HTTPException(status_code=503, detail="AI service not available")
@@ -91,6 +95,8 @@ async def analyze_waste(request: WasteAnalysisRequest) -> Dict[str, Any]:
 @router.get("/tips/{waste_type}")
 async def get_recycling_tips(waste_type: str) -> Dict[str, List[str]]:
     """Get recycling tips for specific waste type"""
+    groq_service = get_groq_service()
+    
     try:
         if not groq_service:
             # Fallback tips
@@ -112,6 +118,8 @@ async def get_recycling_tips(waste_type: str) -> Dict[str, List[str]]:
 @router.post("/carbon-impact")
 async def calculate_carbon_impact(waste_type: str, weight_kg: float) -> Dict[str, Any]:
     """Calculate carbon impact of recycling waste"""
+    groq_service = get_groq_service()
+    
     try:
         if not groq_service:
             # Fallback calculation
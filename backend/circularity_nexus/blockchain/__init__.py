@@ -5,8 +5,8 @@ This module provides Hedera blockchain integration including HTS token managemen
 HCS consensus service, and HCS-10 OpenConvAI agent communication.
 """
 
-from .hedera_client import HederaClient
-from .hts_service import HTSService
+from .hedera_client import HederaClient, HederaClientPool, get_hedera_client_pool
+from .hts_service import HTSService, TransferSpec, BatchResult, OptimisticSubmitter
 from .hcs_service import HCSService
 from .hcs10_agent import HCS10Agent
 from .token_manager import TokenManager
@@ -14,7 +14,12 @@ from .consensus_manager import ConsensusManager
 
 __all__ = [
     "HederaClient",
+    "HederaClientPool",
+    "get_hedera_client_pool",
     "HTSService",
+    "TransferSpec",
+    "BatchResult",
+    "OptimisticSubmitter",
     "HCSService", 
     "HCS10Agent",
     "TokenManager",
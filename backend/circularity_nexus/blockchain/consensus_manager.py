@@ -511,7 +511,9 @@ class ConsensusManager:
             processed_messages = []
             for message in messages:
                 try:
-                    content = json.loads(message["contents"])
+                    contents = message["contents"]
+                    # MessagePack payloads are already decoded by HCSService
+                    content = json.loads(contents) if isinstance(contents, (str, bytes)) else contents
                     
                     # Filter by message type if specified
                     if message_type and content.get("type") != message_type:
@@ -569,7 +571,9 @@ class ConsensusManager:
             # Wrapper to filter and process messages
             def filtered_handler(message):
                 try:
-                    content = json.loads(message["contents"])
+                    contents = message["contents"]
+                    # MessagePack payloads are already decoded by HCSService
+                    content = json.loads(contents) if isinstance(contents, (str, bytes)) else contents
                     
                     # Apply message type filter
                     if message_type_filter and content.get("type") != message_type_filter:
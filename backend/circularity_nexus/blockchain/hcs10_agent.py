@@ -5,19 +5,41 @@ Implementation of HCS-10 OpenConvAI standard for AI agent communication
 on Hedera Consensus Service.
 """
 
+import asyncio
+import inspect
+import itertools
 import json
 import logging
-from typing import Dict, List, Optional, Any, Callable
+import re
+import secrets
+import sys
+import time
+import orjson
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Callable, Set, Tuple
 from enum import Enum
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from .hedera_client import HederaClient
 from .hcs_service import HCSService
 from ..core.exceptions import BlockchainError
+from ..core.timestamps import utc_now_iso, to_iso
 
 logger = logging.getLogger(__name__)
 
-class AgentStatus(Enum):
+# HCS-10 operation memos
+MEMO_REGISTER = "hcs-10:op:0:0"
+MEMO_CONNECTION_REQUEST = "hcs-10:op:3:1"
+MEMO_CONNECTION_CREATED = "hcs-10:op:4:1"
+MEMO_MESSAGE = "hcs-10:op:6:3"
+MEMO_TRANSACTION = "hcs-10:op:7:3"
+MEMO_PROFILE = "hcs-11:profile:0"
+
+# Matches the "op": "register" field of registry messages before parsing
+_REGISTER_OP = re.compile(r'"op"\s*:\s*"register"')
+_REGISTER_OP_BYTES = re.compile(rb'"op"\s*:\s*"register"')
+
+class AgentStatus(str, Enum):
     """Agent status states."""
     INITIALIZING = "initializing"
     REGISTERED = "registered"
@@ -25,7 +47,7 @@ class AgentStatus(Enum):
     INACTIVE = "inactive"
     ERROR = "error"
 
-class MessageType(Enum):
+class MessageType(str, Enum):
     """HCS-10 message types."""
     REGISTER = "register"
     DELETE = "delete"
@@ -44,7 +66,10 @@ class AgentProfile:
     contact_info: Optional[Dict[str, str]] = None
     metadata: Optional[Dict[str, Any]] = None
 
-@dataclass
+# slots=True is only understood by dataclasses on Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class Connection:
     """Agent connection information."""
     connection_id: int
@@ -62,19 +87,63 @@ class HCS10Agent:
     and secure communication.
     """
     
+    __slots__ = (
+        "profile",
+        "registry_topic_id",
+        "message_handler",
+        "hedera_client",
+        "hcs_service",
+        "status",
+        "account_id",
+        "inbound_topic_id",
+        "outbound_topic_id",
+        "profile_topic_id",
+        "connections",
+        "message_listeners",
+        "ttl",
+        "protocol_version",
+        "_pooled_client",
+        "_connection_ids",
+        "_random_connection_ids",
+        "_used_connection_ids",
+        "_inbound_topic_cache",
+        "_conn_by_topic",
+        "_active_connections",
+        "_last_activity",
+        "_senders",
+        "_inbox",
+        "_listener_task",
+        "_loop",
+        "_outbound_memo",
+        "_profile_memo",
+        "__weakref__",
+    )
+    
+    # Largest registry payload submitted as one HCS message
+    REGISTRY_BATCH_BYTES = 1024
+    # Inbound message queue bound and per-dispatch batch size
+    INBOX_SIZE = 1024
+    INBOX_BATCH_SIZE = 32
+    # Connections kept before the least recently used one is evicted
+    MAX_CONNECTIONS = 10_000
+    
     def __init__(
         self,
         agent_profile: AgentProfile,
         registry_topic_id: Optional[str] = None,
-        message_handler: Optional[Callable] = None
+        message_handler: Optional[Callable] = None,
+        hedera_client: Optional[HederaClient] = None,
+        random_connection_ids: bool = False
     ):
         self.profile = agent_profile
         self.registry_topic_id = registry_topic_id
         self.message_handler = message_handler
         
-        # Initialize services
-        self.hedera_client = HederaClient()
-        self.hcs_service = HCSService()
+        # HCSService leases a shared client unless one is supplied, and
+        # returns it to the pool when it is closed
+        self._pooled_client = hedera_client is None
+        self.hcs_service = HCSService(hedera_client)
+        self.hedera_client = self.hcs_service.hedera_client
         
         # Agent state
         self.status = AgentStatus.INITIALIZING
@@ -82,12 +151,27 @@ class HCS10Agent:
         self.inbound_topic_id = None
         self.outbound_topic_id = None
         self.profile_topic_id = None
-        self.connections: Dict[str, Connection] = {}
+        self.connections: "OrderedDict[str, Connection]" = OrderedDict()
         self.message_listeners: Dict[str, Callable] = {}
+        self._connection_ids = itertools.count(10000)
+        # Several processes sharing an agent identity cannot coordinate a
+        # counter, so they draw random IDs and check them against those used
+        self._random_connection_ids = random_connection_ids
+        self._used_connection_ids: Set[int] = set()
+        self._inbound_topic_cache: Dict[str, Tuple[str, float]] = {}
+        self._conn_by_topic: Dict[str, Connection] = {}
+        self._active_connections = 0
+        self._last_activity: Optional[datetime] = None
+        self._senders: Dict[str, Tuple[Connection, Callable]] = {}
+        self._inbox: Optional[asyncio.Queue] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         # HCS-10 configuration
         self.ttl = 60  # Time to live in minutes
         self.protocol_version = "hcs-10:0"
+        self._outbound_memo = f"{self.protocol_version}:{self.ttl}:1"
+        self._profile_memo = f"hcs-11:0:{self.ttl}:profile"
         
     async def initialize(self) -> Dict[str, Any]:
         """
@@ -109,9 +193,8 @@ class HCS10Agent:
                 logger.info(f"Created agent account: {self.account_id}")
             
             # Step 2: Create outbound topic
-            outbound_memo = f"{self.protocol_version}:{self.ttl}:1"
             outbound_result = await self.hcs_service.create_topic(
-                memo=outbound_memo,
+                memo=self._outbound_memo,
                 submit_key=self.hedera_client.operator_private_key.getPublicKey()
             )
             self.outbound_topic_id = outbound_result["topic_id"]
@@ -125,9 +208,8 @@ class HCS10Agent:
             self.inbound_topic_id = inbound_result["topic_id"]
             
             # Step 4: Create HCS-11 profile topic
-            profile_memo = f"hcs-11:0:{self.ttl}:profile"
             profile_result = await self.hcs_service.create_topic(
-                memo=profile_memo,
+                memo=self._profile_memo,
                 submit_key=self.hedera_client.operator_private_key.getPublicKey()
             )
             self.profile_topic_id = profile_result["topic_id"]
@@ -145,8 +227,8 @@ class HCS10Agent:
                 "inbound_topic": self.inbound_topic_id,
                 "outbound_topic": self.outbound_topic_id,
                 "profile_topic": self.profile_topic_id,
-                "status": self.status.value,
-                "initialization_timestamp": datetime.utcnow().isoformat() + "Z"
+                "status": self.status,
+                "initialization_timestamp": utc_now_iso()
             }
             
             logger.info(f"Agent initialized successfully: {self.account_id}")
@@ -175,10 +257,12 @@ class HCS10Agent:
                 raise BlockchainError("No registry topic ID provided")
             
             # Create registration message
+            # The inbound topic lets discovering agents connect without a lookup
             register_message = {
                 "p": "hcs-10",
                 "op": "register",
                 "account_id": self.account_id,
+                "inbound_topic_id": self.inbound_topic_id,
                 "m": f"Registering AI agent: {self.profile.name}"
             }
             
@@ -186,7 +270,7 @@ class HCS10Agent:
             result = await self.hcs_service.submit_message(
                 topic_id=registry_topic_id,
                 message=json.dumps(register_message),
-                memo="hcs-10:op:0:0"
+                memo=MEMO_REGISTER
             )
             
             logger.info(f"Agent registered in registry: {registry_topic_id}")
@@ -196,12 +280,84 @@ class HCS10Agent:
             logger.error(f"Registry registration failed: {str(e)}")
             raise BlockchainError(f"Registry registration failed: {str(e)}")
     
-    async def discover_agents(self, registry_topic_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def register_many_in_registry(
+        self,
+        registrations: List[Dict[str, Any]],
+        registry_topic_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Register several entries in the HCS-10 registry with as few submits as possible.
+        
+        Registrations are packed into JSON arrays of at most
+        REGISTRY_BATCH_BYTES so each batch fits a single HCS message.
+        
+        Args:
+            registrations: Extra fields for each registration message
+            registry_topic_id: Registry topic ID (uses default if not provided)
+            
+        Returns:
+            Submission result for each batch
+        """
+        try:
+            if not registry_topic_id:
+                registry_topic_id = self.registry_topic_id
+            
+            if not registry_topic_id:
+                raise BlockchainError("No registry topic ID provided")
+            
+            batches: List[List[bytes]] = []
+            batch: List[bytes] = []
+            batch_size = 2  # Enclosing brackets
+            for registration in registrations:
+                register_message = {
+                    "p": "hcs-10",
+                    "op": "register",
+                    "account_id": self.account_id,
+                    "inbound_topic_id": self.inbound_topic_id,
+                    "m": f"Registering AI agent: {self.profile.name}",
+                    **registration
+                }
+                encoded = orjson.dumps(register_message)
+                if batch and batch_size + len(encoded) + 1 > self.REGISTRY_BATCH_BYTES:
+                    batches.append(batch)
+                    batch = []
+                    batch_size = 2
+                batch.append(encoded)
+                batch_size += len(encoded) + 1
+            if batch:
+                batches.append(batch)
+            
+            results = []
+            for batch in batches:
+                # A lone registration stays a plain HCS-10 object
+                payload = batch[0] if len(batch) == 1 else b"[" + b",".join(batch) + b"]"
+                results.append(await self.hcs_service.submit_message(
+                    topic_id=registry_topic_id,
+                    message=payload,
+                    memo=MEMO_REGISTER
+                ))
+            
+            logger.info(
+                f"Submitted {len(registrations)} registrations in {len(batches)} messages "
+                f"to registry: {registry_topic_id}"
+            )
+            return results
+            
+        except Exception as e:
+            logger.error(f"Registry registration failed: {str(e)}")
+            raise BlockchainError(f"Registry registration failed: {str(e)}")
+    
+    async def discover_agents(
+        self,
+        registry_topic_id: Optional[str] = None,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
         """
         Discover other agents in the registry.
         
         Args:
             registry_topic_id: Registry topic to query
+            limit: Maximum number of registry messages to scan
             
         Returns:
             List of discovered agents
@@ -216,25 +372,52 @@ class HCS10Agent:
             # Query registry messages
             messages = await self.hcs_service.get_topic_messages(
                 topic_id=registry_topic_id,
-                limit=100
+                limit=limit
             )
             
             agents = []
+            own_account_id = self.account_id
+            match_register = _REGISTER_OP.search
+            match_register_bytes = _REGISTER_OP_BYTES.search
             for message in messages:
-                try:
-                    content = json.loads(message["contents"])
-                    if (content.get("p") == "hcs-10" and 
-                        content.get("op") == "register" and
-                        content.get("account_id") != self.account_id):
+                raw = message["contents"]
+                if isinstance(raw, (str, bytes, bytearray, memoryview)):
+                    # Most registry traffic is not a registration, so reject it
+                    # with a precompiled scan of the raw payload before parsing.
+                    search = match_register if isinstance(raw, str) else match_register_bytes
+                    if search(raw) is None:
+                        continue
+                    
+                    try:
+                        content = orjson.loads(raw)
+                    except orjson.JSONDecodeError:
+                        continue
+                else:
+                    # MessagePack payloads arrive decoded; p/op are checked per entry
+                    content = raw
+                
+                # Batched registrations arrive as a JSON array
+                entries = content if isinstance(content, list) else (content,)
+                for entry in entries:
+                    if not isinstance(entry, dict):
+                        continue
+                    
+                    account_id = entry.get("account_id")
+                    if (account_id and
+                        entry.get("p") == "hcs-10" and
+                        entry.get("op") == "register" and
+                        account_id != own_account_id):
                         
                         agents.append({
-                            "account_id": content["account_id"],
-                            "message": content.get("m", ""),
+                            "account_id": account_id,
+                            "message": entry.get("m", ""),
                             "timestamp": message["consensus_timestamp"],
                             "sequence_number": message["sequence_number"]
                         })
-                except json.JSONDecodeError:
-                    continue
+                        
+                        inbound_topic_id = entry.get("inbound_topic_id")
+                        if inbound_topic_id:
+                            self._inbound_topic_cache[account_id] = (inbound_topic_id, time.monotonic())
             
             logger.info(f"Discovered {len(agents)} agents in registry")
             return agents
@@ -272,7 +455,7 @@ class HCS10Agent:
             result = await self.hcs_service.submit_message(
                 topic_id=target_inbound_topic,
                 message=json.dumps(request_message),
-                memo="hcs-10:op:3:1"
+                memo=MEMO_CONNECTION_REQUEST
             )
             
             logger.info(f"Connection requested to agent {target_agent_id}")
@@ -297,6 +480,7 @@ class HCS10Agent:
         Returns:
             Connection creation result
         """
+        connection_id = None
         try:
             # Generate connection ID
             connection_id = self._generate_connection_id()
@@ -331,7 +515,8 @@ class HCS10Agent:
             await self.hcs_service.submit_message(
                 topic_id=requesting_inbound_topic,
                 message=json.dumps(created_message),
-                memo="hcs-10:op:4:1"
+                memo=MEMO_CONNECTION_CREATED,
+                stringify=False
             )
             
             # Store connection
@@ -342,7 +527,7 @@ class HCS10Agent:
                 status="active",
                 created_at=datetime.utcnow()
             )
-            self.connections[requesting_agent_id] = connection
+            self._add_connection(connection)
             
             logger.info(f"Connection created with agent {requesting_agent_id}")
             return {
@@ -353,6 +538,8 @@ class HCS10Agent:
             }
             
         except Exception as e:
+            # The ID was never bound to a stored connection
+            self._used_connection_ids.discard(connection_id)
             logger.error(f"Connection creation failed: {str(e)}")
             raise BlockchainError(f"Connection creation failed: {str(e)}")
     
@@ -378,24 +565,16 @@ class HCS10Agent:
             if not connection:
                 raise BlockchainError(f"No active connection with agent {target_agent_id}")
             
-            # Create message
-            message = {
-                "p": "hcs-10",
-                "op": "message",
-                "operator_id": f"{self.inbound_topic_id}@{self.account_id}",
-                "data": message_data,
-                "m": f"{message_type} communication."
-            }
+            # Reuse the sender specialized for this connection
+            cached = self._senders.get(target_agent_id)
+            if cached is None or cached[0] is not connection:
+                cached = (connection, self._make_sender(connection))
+                self._senders[target_agent_id] = cached
             
-            # Submit to connection topic
-            result = await self.hcs_service.submit_message(
-                topic_id=connection.topic_id,
-                message=json.dumps(message),
-                memo="hcs-10:op:6:3"
-            )
+            result = await cached[1](message_data, message_type)
             
             # Update connection activity
-            connection.last_activity = datetime.utcnow()
+            self._update_activity(connection)
             
             logger.info(f"Message sent to agent {target_agent_id}")
             return result
@@ -408,7 +587,8 @@ class HCS10Agent:
         self,
         target_agent_id: str,
         transaction_data: Dict[str, Any],
-        schedule_id: Optional[str] = None
+        schedule_id: Optional[str] = None,
+        legacy_string_data: bool = False
     ) -> Dict[str, Any]:
         """
         Send transaction request requiring approval.
@@ -417,6 +597,7 @@ class HCS10Agent:
             target_agent_id: Target agent's account ID
             transaction_data: Transaction details
             schedule_id: Optional scheduled transaction ID
+            legacy_string_data: Send data as a JSON-encoded string for older peers
             
         Returns:
             Transaction request result
@@ -432,7 +613,7 @@ class HCS10Agent:
                 "op": "transaction",
                 "operator_id": f"{self.inbound_topic_id}@{self.account_id}",
                 "schedule_id": schedule_id or "pending",
-                "data": json.dumps(transaction_data),
+                "data": json.dumps(transaction_data) if legacy_string_data else transaction_data,
                 "m": "For your approval."
             }
             
@@ -440,9 +621,12 @@ class HCS10Agent:
             result = await self.hcs_service.submit_message(
                 topic_id=connection.topic_id,
                 message=json.dumps(message),
-                memo="hcs-10:op:7:3"
+                memo=MEMO_TRANSACTION
             )
             
+            # Update connection activity
+            self._update_activity(connection)
+            
             logger.info(f"Transaction request sent to agent {target_agent_id}")
             return result
             
@@ -454,7 +638,7 @@ class HCS10Agent:
         """Get current agent status and statistics."""
         return {
             "agent_id": self.account_id,
-            "status": self.status.value,
+            "status": self.status,
             "profile": {
                 "name": self.profile.name,
                 "description": self.profile.description,
@@ -467,13 +651,38 @@ class HCS10Agent:
                 "profile": self.profile_topic_id
             },
             "connections": {
-                "active": len([c for c in self.connections.values() if c.status == "active"]),
+                "active": self._active_connections,
                 "total": len(self.connections)
             },
-            "last_activity": max(
-                [c.last_activity for c in self.connections.values() if c.last_activity],
-                default=datetime.utcnow()
-            ).isoformat() + "Z"
+            "last_activity": to_iso(self._last_activity) if self._last_activity else utc_now_iso()
+        }
+    
+    def get_connection_by_topic(self, topic_id: str) -> Optional[Connection]:
+        """Get the connection bound to a connection topic, for inbound routing."""
+        return self._conn_by_topic.get(topic_id)
+    
+    async def close_connection(self, remote_agent_id: str) -> Dict[str, Any]:
+        """
+        Close the connection with a remote agent.
+        
+        Args:
+            remote_agent_id: Remote agent's account ID
+            
+        Returns:
+            Connection close result
+        """
+        connection = self.connections.pop(remote_agent_id, None)
+        if not connection:
+            raise BlockchainError(f"No active connection with agent {remote_agent_id}")
+        
+        self._release_connection(connection)
+        
+        logger.info(f"Connection closed with agent {remote_agent_id}")
+        return {
+            "connection_id": connection.connection_id,
+            "connection_topic": connection.topic_id,
+            "remote_agent": remote_agent_id,
+            "status": connection.status
         }
     
     # Private helper methods
@@ -491,38 +700,235 @@ class HCS10Agent:
                 "inbound": self.inbound_topic_id,
                 "outbound": self.outbound_topic_id
             },
-            "published_at": datetime.utcnow().isoformat() + "Z"
+            "published_at": utc_now_iso()
         }
         
         await self.hcs_service.submit_message(
             topic_id=self.profile_topic_id,
             message=json.dumps(profile_data),
-            memo="hcs-11:profile:0"
+            memo=MEMO_PROFILE,
+            stringify=False
         )
     
     async def _setup_message_listeners(self):
-        """Set up message listeners for inbound topic."""
+        """
+        Set up message listeners for inbound topic.
+        
+        The topic subscription only enqueues raw messages; a single background
+        task drains the inbox and hands messages to the handler in batches.
+        """
         if self.message_handler:
             self.message_listeners[self.inbound_topic_id] = self.message_handler
-            # In a real implementation, would set up continuous listening
+            
+            if self._listener_task is None:
+                self._loop = asyncio.get_running_loop()
+                self._inbox = asyncio.Queue(maxsize=self.INBOX_SIZE)
+                self._listener_task = asyncio.create_task(self._drain_inbox())
+            
+            await self.hcs_service.subscribe_to_topic(
+                topic_id=self.inbound_topic_id,
+                message_handler=self._enqueue_message
+            )
+    
+    def _enqueue_message(self, message: Dict[str, Any]):
+        """Queue an inbound message; safe to call from SDK callback threads."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._put_inbox, message)
+    
+    def _put_inbox(self, message: Dict[str, Any]):
+        """Put a message on the inbox, dropping it if the inbox is full."""
+        try:
+            self._inbox.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning(f"Agent inbox full, dropping message {message.get('sequence_number')}")
+    
+    async def _drain_inbox(self):
+        """Drain the inbox and dispatch messages in batches."""
+        while True:
+            batch = [await self._inbox.get()]
+            while not self._inbox.empty() and len(batch) < self.INBOX_BATCH_SIZE:
+                batch.append(self._inbox.get_nowait())
+            
+            try:
+                await self._dispatch_batch(batch)
+            except Exception as e:
+                logger.error(f"Message handler failed: {str(e)}")
+    
+    async def _dispatch_batch(self, batch: List[Dict[str, Any]]):
+        """Parse a batch of inbound messages and pass it to the message handler."""
+        parsed = []
+        for message in batch:
+            contents = message["contents"]
+            try:
+                message["content"] = (
+                    orjson.loads(contents)
+                    if isinstance(contents, (str, bytes, bytearray, memoryview))
+                    else contents
+                )
+            except orjson.JSONDecodeError:
+                logger.warning(f"Skipping malformed message {message.get('sequence_number')}")
+                continue
+            parsed.append(message)
+        
+        if parsed:
+            result = self.message_handler(parsed)
+            if inspect.isawaitable(result):
+                await result
+    
+    def _make_sender(self, connection: Connection) -> Callable:
+        """
+        Build a message sender bound to one connection.
+        
+        The fixed part of the HCS-10 message envelope is serialized once, so
+        each send only encodes the data and message type.
+        """
+        prefix = orjson.dumps({
+            "p": "hcs-10",
+            "op": "message",
+            "operator_id": f"{self.inbound_topic_id}@{self.account_id}"
+        })[:-1] + b',"data":'
+        topic_id = connection.topic_id
+        submit_message = self.hcs_service.submit_message
+        
+        async def send(message_data: str, message_type: str) -> Dict[str, Any]:
+            message = (
+                prefix + orjson.dumps(message_data) +
+                b',"m":' + orjson.dumps(f"{message_type} communication.") + b"}"
+            )
+            return await submit_message(
+                topic_id=topic_id,
+                message=message,
+                memo=MEMO_MESSAGE
+            )
+        
+        return send
+    
+    def _add_connection(self, connection: Connection):
+        """Store a connection and update the connection counters."""
+        previous = self.connections.get(connection.remote_agent_id)
+        if previous:
+            self._conn_by_topic.pop(previous.topic_id, None)
+            if previous.connection_id != connection.connection_id:
+                self._used_connection_ids.discard(previous.connection_id)
+            if previous.status == "active":
+                self._active_connections -= 1
+        
+        self.connections[connection.remote_agent_id] = connection
+        self.connections.move_to_end(connection.remote_agent_id)
+        self._conn_by_topic[connection.topic_id] = connection
+        if connection.status == "active":
+            self._active_connections += 1
+        if connection.last_activity and (
+            self._last_activity is None or connection.last_activity > self._last_activity
+        ):
+            self._last_activity = connection.last_activity
+        
+        # Evict least recently used connections beyond the cap
+        while len(self.connections) > self.MAX_CONNECTIONS:
+            evicted_id, evicted = self.connections.popitem(last=False)
+            self._release_connection(evicted)
+            logger.warning(f"Evicted idle connection with agent {evicted_id}")
+    
+    def _release_connection(self, connection: Connection):
+        """Drop indexes and counters for a connection removed from self.connections."""
+        self._conn_by_topic.pop(connection.topic_id, None)
+        self._senders.pop(connection.remote_agent_id, None)
+        self._used_connection_ids.discard(connection.connection_id)
+        if connection.status == "active":
+            self._active_connections -= 1
+        connection.status = "closed"
+    
+    def _update_activity(self, connection: Connection):
+        """Record activity on a connection and mark it most recently used."""
+        now = datetime.utcnow()
+        connection.last_activity = now
+        self._last_activity = now
+        if connection.remote_agent_id in self.connections:
+            self.connections.move_to_end(connection.remote_agent_id)
     
     async def _find_agent_inbound_topic(self, agent_id: str) -> Optional[str]:
-        """Find an agent's inbound topic ID."""
+        """Find an agent's inbound topic ID, cached for the HCS-10 TTL."""
+        now = time.monotonic()
+        entry = self._inbound_topic_cache.get(agent_id)
+        if entry and now - entry[1] < self.ttl * 60:
+            return entry[0]
+        
         # In a real implementation, would query the registry or agent's profile
         # For now, return a mock topic ID
-        return f"0.0.{hash(agent_id) % 1000000}"
+        topic_id = f"0.0.{hash(agent_id) % 1000000}"
+        self._inbound_topic_cache[agent_id] = (topic_id, now)
+        return topic_id
     
     def _generate_connection_id(self) -> int:
-        """Generate unique connection ID."""
-        import random
-        return random.randint(10000, 99999)
+        """
+        Generate unique connection ID.
+        
+        Uses the per-agent monotonic counter, or collision-checked random
+        32-bit IDs when the agent was created with random_connection_ids.
+        """
+        if not self._random_connection_ids:
+            return next(self._connection_ids)
+        
+        while True:
+            connection_id = secrets.randbits(32)
+            if connection_id not in self._used_connection_ids:
+                self._used_connection_ids.add(connection_id)
+                return connection_id
     
     async def _create_threshold_key(self, public_keys: List) -> Any:
         """Create threshold key for multi-party topic access."""
         # Simplified implementation - would create proper threshold key
         return public_keys[0] if public_keys else None
     
+    async def aclose(self):
+        """
+        Shut the agent down.
+        
+        Stops the inbox listener, dispatches any messages still queued,
+        unsubscribes from the inbound topic and closes the HCS service, which
+        releases its mirror node connections and the pooled Hedera client. A
+        client passed to the constructor is left open for its owner.
+        """
+        if self._listener_task is not None:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+            
+            remaining = []
+            while not self._inbox.empty():
+                remaining.append(self._inbox.get_nowait())
+            if remaining:
+                try:
+                    await self._dispatch_batch(remaining)
+                except Exception as e:
+                    logger.error(f"Message handler failed: {str(e)}")
+            
+            try:
+                await self.hcs_service.unsubscribe_from_topic(self.inbound_topic_id)
+            except Exception as e:
+                logger.warning(f"Inbound topic unsubscribe failed: {str(e)}")
+        
+        await self.hcs_service.aclose()
+        if self._pooled_client:
+            self.hedera_client = None
+    
+    async def __aenter__(self) -> "HCS10Agent":
+        """Initialize the agent on context entry; close it if that fails."""
+        try:
+            await self.initialize()
+        except BaseException:
+            await self.aclose()
+            raise
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the agent on context exit."""
+        await self.aclose()
+    
     def __del__(self):
-        """Cleanup on destruction."""
-        if hasattr(self, 'hedera_client'):
-            self.hedera_client.close()
+        """Warn when an agent is garbage collected without aclose()."""
+        if getattr(self, "_pooled_client", False) and getattr(self, "hedera_client", None) is not None:
+            logger.warning(f"HCS10Agent {getattr(self, 'account_id', None)} was not closed; use aclose()")
@@ -5,9 +5,14 @@ Provides HCS topic management, message submission, and consensus operations
 for the Circularity Nexus platform.
 """
 
-import json
+import asyncio
+import calendar
+import functools
 import logging
-from typing import Dict, List, Optional, Any, Union
+import time
+import httpx
+import orjson
+from typing import Callable, Dict, List, Optional, Any, Union, Literal, Tuple
 from datetime import datetime
 from hedera import (
     TopicCreateTransaction,
@@ -18,18 +23,250 @@ from hedera import (
     PublicKey,
     Timestamp
 )
-from .hedera_client import HederaClient
+from .hedera_client import HederaClient, get_hedera_client_pool, MIRROR_NODE_URLS, MIRROR_PAGE_SIZE
+from ..core.config import get_settings
 from ..core.exceptions import BlockchainError
+from ..core.timestamps import utc_now_iso
 
 logger = logging.getLogger(__name__)
 
+try:
+    # HIP-551 atomic batches; only present in newer SDK releases
+    from hedera import BatchTransaction
+except ImportError:
+    BatchTransaction = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    # SIMD decoder; same results as the stdlib for mirror node payloads
+    from pybase64 import b64decode
+except ImportError:
+    from base64 import b64decode
+
+try:
+    from fastapi.encoders import ENCODERS_BY_TYPE
+except ImportError:
+    ENCODERS_BY_TYPE = None
+
+# Leading byte of MessagePack-framed payloads. 0xC1 is never emitted by
+# MessagePack and is invalid in UTF-8, so it cannot collide with text payloads.
+MSGPACK_MAGIC = b"\xc1"
+
+# Standard zstd frame magic number. Its 0xB5 byte cannot follow "(" in UTF-8,
+# so compressed frames are distinguishable from text payloads.
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Payloads at or below this size are not worth compressing
+COMPRESSION_THRESHOLD = 256
+
+PayloadCodec = Literal["json", "msgpack"]
+
+
+@functools.lru_cache(maxsize=1024)
+def _topic_id(topic_id: str) -> TopicId:
+    """Parse a topic ID once per distinct string; TopicId is immutable."""
+    return TopicId.fromString(topic_id)
+
+
+def encode_payload(
+    message: Union[Dict[str, Any], List[Any]],
+    codec: PayloadCodec = "json"
+) -> bytes:
+    """Encode a dict or list-of-records payload for submission with the given codec."""
+    if codec == "json":
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+    if codec == "msgpack":
+        if msgpack is None:
+            raise BlockchainError("msgpack is not installed; install it to use the msgpack codec")
+        return MSGPACK_MAGIC + msgpack.packb(message, use_bin_type=True)
+    raise BlockchainError(f"Unsupported payload codec: {codec}")
+
+
+def to_payload_bytes(
+    message: Union[str, bytes, bytearray, memoryview, Dict[str, Any], List[Any]],
+    codec: PayloadCodec = "json"
+) -> Union[bytes, bytearray, memoryview]:
+    """Convert a message to bytes; bytes-like payloads pass through uncopied."""
+    if isinstance(message, (bytes, bytearray)):
+        return message
+    if isinstance(message, memoryview):
+        return message.cast("B")
+    if isinstance(message, (dict, list)):
+        return encode_payload(message, codec)
+    return message.encode('utf-8')
+
+
+def compress_payload(message_bytes: bytes) -> bytes:
+    """Compress an encoded payload into a zstd frame."""
+    if zstandard is None:
+        raise BlockchainError("zstandard is not installed; install it to compress payloads")
+    return zstandard.ZstdCompressor(level=3).compress(message_bytes)
+
+
+class RunningHash(bytes):
+    """
+    Topic running hash kept as raw bytes and only formatted as hex on demand.
+    
+    Compares and hashes as plain bytes; str() and JSON output give the hex
+    digest, so callers that never read the hash skip the conversion.
+    """
+    
+    __slots__ = ()
+    
+    def __str__(self) -> str:
+        return self.hex()
+    
+    def __repr__(self) -> str:
+        return f"RunningHash('{self.hex()}')"
+
+
+def json_default(value: Any) -> Any:
+    """orjson default hook that serializes RunningHash values as hex strings."""
+    if isinstance(value, RunningHash):
+        return value.hex()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+if ENCODERS_BY_TYPE is not None:
+    # jsonable_encoder would otherwise UTF-8 decode the digest as plain bytes
+    ENCODERS_BY_TYPE[RunningHash] = RunningHash.hex
+
+
+# Value types accepted for each checked schema field type; JSON has one
+# number type, so ints are valid floats, but bools are never numbers
+SCHEMA_FIELD_TYPES = {
+    int: (int,),
+    float: (float, int),
+    bool: (bool,),
+    str: (str,),
+}
+
+
+def _schema_type_error(schema: str, field_name: str, field_type: type, value: Any):
+    """Raise for a schema field value of the wrong type (called by generated encoders)."""
+    raise TypeError(
+        f"Schema {schema!r} field {field_name!r} expects {field_type.__name__}, "
+        f"got {type(value).__name__}"
+    )
+
+
+def compile_schema_encoder(
+    name: str,
+    fields: List[Tuple[str, type]]
+) -> Callable[[Dict[str, Any]], bytes]:
+    """
+    Generate a JSON encoder specialised for one message schema.
+    
+    The emitted function writes the "_schema" tag and the declared fields in a
+    fixed order with their keys pre-encoded, so encoding a message is a single
+    bytes join instead of a walk over the dict. Values are encoded by orjson.
+    Keys not declared in the schema are dropped; a missing field raises
+    KeyError and a value of the wrong type raises TypeError.
+    
+    Args:
+        name: Schema name, written as the "_schema" field
+        fields: (field name, type) pairs; int, float, bool and str fields are
+            type-checked (ints are accepted for float), other types are not
+        
+    Returns:
+        Function encoding a message dict to JSON bytes
+    """
+    namespace = {"_dumps": orjson.dumps, "_type_error": _schema_type_error}
+    parts = [repr(b'{"_schema":' + orjson.dumps(name))]
+    for i, (field_name, field_type) in enumerate(fields):
+        value = f"message[{field_name!r}]"
+        parts.append(repr(b"," + orjson.dumps(field_name) + b":"))
+        accepted = SCHEMA_FIELD_TYPES.get(field_type)
+        if accepted is None:
+            parts.append(f"_dumps({value})")
+            continue
+        # type() rather than isinstance, so True is not taken for an int
+        namespace[f"_accepted_{i}"] = accepted
+        namespace[f"_type_{i}"] = field_type
+        parts.append(
+            f"(_dumps({value}) if type({value}) in _accepted_{i} "
+            f"else _type_error({name!r}, {field_name!r}, _type_{i}, {value}))"
+        )
+    parts.append(repr(b"}"))
+    source = (
+        "def encode(message, _dumps=_dumps):\n"
+        f"    return b''.join(({', '.join(parts)},))\n"
+    )
+    exec(compile(source, f"<hcs schema {name}>", "exec"), namespace)
+    return namespace["encode"]
+
+
+def _mirror_timestamp(value: datetime) -> str:
+    """Format a datetime as a mirror node seconds.nanoseconds timestamp (naive = UTC)."""
+    return f"{calendar.timegm(value.utctimetuple())}.{value.microsecond * 1000:09d}"
+
+
+def decode_contents(contents: bytes) -> Any:
+    """Decode raw message contents: MessagePack frames to objects, anything else to text."""
+    if contents[:4] == ZSTD_MAGIC:
+        if zstandard is None:
+            raise BlockchainError("zstandard is not installed; cannot decode compressed payload")
+        contents = zstandard.ZstdDecompressor().decompress(contents)
+    if contents[:1] == MSGPACK_MAGIC:
+        if msgpack is None:
+            raise BlockchainError("msgpack is not installed; cannot decode msgpack payload")
+        return msgpack.unpackb(contents[1:], raw=False)
+    return contents.decode('utf-8')
+
+
 class HCSService:
     """Hedera Consensus Service integration for topic management and messaging."""
     
-    def __init__(self, hedera_client: Optional[HederaClient] = None):
-        self.hedera_client = hedera_client or HederaClient()
+    # Maximum chunk submissions in flight at once for large messages
+    CHUNK_CONCURRENCY = 16
+    
+    # Maximum inner transactions in one HIP-551 atomic batch
+    MAX_BATCH_SIZE = 50
+    
+    # Largest payload submit_small_json sends without chunking
+    SMALL_MESSAGE_BYTES = 1024
+    
+    def __init__(
+        self,
+        hedera_client: Optional[HederaClient] = None,
+        mirror_node_url: Optional[str] = None
+    ):
+        # Lease a warm client from the shared pool unless one is supplied
+        self._pooled_client = hedera_client is None
+        self.hedera_client = hedera_client or get_hedera_client_pool().acquire()
         self.subscribed_topics: Dict[str, bool] = {}
         self.message_handlers: Dict[str, callable] = {}
+        settings = get_settings()
+        self.mirror_node_url = (
+            mirror_node_url or
+            settings.HEDERA_MIRROR_NODE_URL or
+            MIRROR_NODE_URLS.get(settings.HEDERA_NETWORK)
+        )
+        self._mirror_http: Optional[httpx.AsyncClient] = None
+        self._schema_encoders: Dict[str, Callable[[Dict[str, Any]], bytes]] = {}
+    
+    def register_schema(self, name: str, fields: List[Tuple[str, type]]):
+        """
+        Register a message schema and precompile its JSON encoder.
+        
+        Dict messages submitted with the "json" codec whose "_schema" field
+        names a registered schema are encoded by the generated function.
+        
+        Args:
+            name: Schema name carried in the message's "_schema" field
+            fields: Ordered (field name, type) pairs making up the schema
+        """
+        self._schema_encoders[name] = compile_schema_encoder(name, fields)
+        logger.debug("Registered HCS message schema %s with %s fields", name, len(fields))
     
     async def create_topic(
         self,
@@ -70,8 +307,7 @@ class HCSService:
             # Freeze, sign, and execute
             transaction = transaction.freezeWith(self.hedera_client.client)
             signed_transaction = transaction.sign(self.hedera_client.operator_private_key)
-            response = await signed_transaction.execute(self.hedera_client.client)
-            receipt = await response.getReceipt(self.hedera_client.client)
+            response, receipt = await self._execute_with_receipt(signed_transaction)
             
             topic_id = receipt.topicId
             
@@ -86,81 +322,166 @@ class HCSService:
                 "status": "success"
             }
             
-            logger.info(f"Created HCS topic: {topic_id}")
+            logger.info("Created HCS topic: %s", topic_id)
             return result
             
         except Exception as e:
-            logger.error(f"Topic creation failed: {str(e)}")
+            logger.error("Topic creation failed: %s", e)
             raise BlockchainError(f"Topic creation failed: {str(e)}")
     
     async def submit_message(
         self,
         topic_id: str,
-        message: Union[str, bytes, Dict[str, Any]],
+        message: Union[str, bytes, bytearray, memoryview, Dict[str, Any], List[Any]],
         memo: Optional[str] = None,
-        chunk_size: int = 1024
+        chunk_size: int = 1024,
+        codec: PayloadCodec = "json",
+        compress: bool = False,
+        stringify: bool = True,
+        wait_for_receipt: bool = True
     ) -> Dict[str, Any]:
         """
         Submit message to HCS topic.
         
         Args:
             topic_id: Target topic ID
-            message: Message content (string, bytes, or dict)
+            message: Message content (string, bytes-like, dict, or list of records)
             memo: Transaction memo
             chunk_size: Chunk size for large messages
+            codec: Wire format for dict and list messages ("json" or "msgpack");
+                JSON dicts tagged with a registered "_schema" use its encoder
+            compress: zstd-compress payloads larger than COMPRESSION_THRESHOLD;
+                a frame that would still need chunking is not used, since
+                readers decode each message on its own
+            stringify: Convert SDK values in the result to strings; pass False
+                to get the raw SDK objects when the result is not inspected
+            wait_for_receipt: Wait for consensus before returning; when False a
+                single-transaction submit returns as "pending" and its receipt
+                is confirmed in the background
             
         Returns:
             Message submission result
         """
         try:
-            topic = TopicId.fromString(topic_id)
+            topic = _topic_id(topic_id)
             
-            # Convert message to bytes
-            if isinstance(message, dict):
-                message_bytes = json.dumps(message).encode('utf-8')
-            elif isinstance(message, str):
-                message_bytes = message.encode('utf-8')
-            else:
-                message_bytes = message
+            encoder = None
+            if codec == "json" and isinstance(message, dict) and self._schema_encoders:
+                encoder = self._schema_encoders.get(message.get("_schema"))
+            message_bytes = encoder(message) if encoder else to_payload_bytes(message, codec)
+            
+            original_size = len(message_bytes)
+            if compress and original_size > COMPRESSION_THRESHOLD:
+                compressed = compress_payload(message_bytes)
+                # A zstd frame split across messages cannot be decoded per message
+                if len(compressed) < original_size and len(compressed) <= chunk_size:
+                    message_bytes = compressed
+            compression_ratio = round(original_size / len(message_bytes), 2) if message_bytes else 1.0
             
             # Handle large messages by chunking
             if len(message_bytes) > chunk_size:
-                return await self._submit_chunked_message(
+                result = await self._submit_chunked_message(
                     topic, message_bytes, memo, chunk_size
                 )
+                result["compression_ratio"] = compression_ratio
+                return result
             
             # Submit single message
-            transaction = (
-                TopicMessageSubmitTransaction()
-                .setTopicId(topic)
-                .setMessage(message_bytes)
+            signed_transaction = self._signed_submit_transaction(topic, message_bytes, memo)
+            if wait_for_receipt:
+                response, receipt = await self._execute_with_receipt(signed_transaction)
+            else:
+                response = await signed_transaction.execute(self.hedera_client.client)
+                receipt = None
+                self.hedera_client.confirm_in_background(response, f"Message to topic {topic_id}")
+            
+            result = self._submission_result(
+                topic_id, message_bytes, compression_ratio, response, receipt, stringify
             )
             
-            if memo:
-                transaction.setTransactionMemo(memo)
+            logger.debug("Message submitted to topic %s: %s bytes", topic_id, len(message_bytes))
+            return result
             
-            # Freeze, sign, and execute
-            transaction = transaction.freezeWith(self.hedera_client.client)
-            signed_transaction = transaction.sign(self.hedera_client.operator_private_key)
-            response = await signed_transaction.execute(self.hedera_client.client)
-            receipt = await response.getReceipt(self.hedera_client.client)
+        except Exception as e:
+            logger.error("Message submission failed: %s", e)
+            raise BlockchainError(f"Message submission failed: {str(e)}")
+    
+    async def submit_small_json(self, topic_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Submit a small JSON dict as a single message with no memo.
+        
+        Fast path for high-rate telemetry that skips submit_message's option
+        handling; payloads that encode larger than SMALL_MESSAGE_BYTES are
+        handed to submit_message for chunking.
+        
+        Args:
+            topic_id: Target topic ID
+            payload: JSON-serializable message content
+            
+        Returns:
+            Message submission result
+        """
+        message_bytes = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        if len(message_bytes) > self.SMALL_MESSAGE_BYTES:
+            return await self.submit_message(topic_id, message_bytes, chunk_size=self.SMALL_MESSAGE_BYTES)
+        
+        try:
+            signed_transaction = self._signed_submit_transaction(_topic_id(topic_id), message_bytes, None)
+            response, receipt = await self._execute_with_receipt(signed_transaction)
+            return self._submission_result(topic_id, message_bytes, 1.0, response, receipt)
+            
+        except Exception as e:
+            logger.error("Message submission failed: %s", e)
+            raise BlockchainError(f"Message submission failed: {str(e)}")
+    
+    async def submit_messages_batch(
+        self,
+        topic_id: str,
+        messages: List[Union[str, bytes, Dict[str, Any]]],
+        memo: Optional[str] = None,
+        codec: PayloadCodec = "json"
+    ) -> Dict[str, Any]:
+        """
+        Submit several messages to a topic as one atomic batch transaction.
+        
+        Args:
+            topic_id: Target topic ID
+            messages: Message contents (string, bytes, or dict), one per HCS message
+            memo: Transaction memo applied to every inner submission
+            codec: Wire format for dict messages ("json" or "msgpack")
+            
+        Returns:
+            Batch submission result
+        """
+        try:
+            if BatchTransaction is None:
+                raise BlockchainError("Hedera SDK does not support batch transactions")
+            if not messages or len(messages) > self.MAX_BATCH_SIZE:
+                raise BlockchainError(f"Batch must contain 1 to {self.MAX_BATCH_SIZE} messages")
+            
+            topic = _topic_id(topic_id)
+            payloads = [to_payload_bytes(message, codec) for message in messages]
+            
+            response, receipt, inner_ids = await self._execute_batch(
+                topic, payloads, [memo] * len(payloads)
+            )
             
             result = {
                 "topic_id": topic_id,
-                "message_size": len(message_bytes),
+                "message_count": len(payloads),
+                "message_size": sum(len(payload) for payload in payloads),
                 "transaction_id": str(response.transactionId),
+                "inner_transaction_ids": [str(inner_id) for inner_id in inner_ids],
                 "consensus_timestamp": str(receipt.consensusTimestamp) if receipt.consensusTimestamp else None,
-                "sequence_number": receipt.topicSequenceNumber,
-                "running_hash": receipt.topicRunningHash.hex() if receipt.topicRunningHash else None,
                 "status": "success"
             }
             
-            logger.debug(f"Message submitted to topic {topic_id}: {len(message_bytes)} bytes")
+            logger.debug("Batch of %s messages submitted to topic %s", len(payloads), topic_id)
             return result
             
         except Exception as e:
-            logger.error(f"Message submission failed: {str(e)}")
-            raise BlockchainError(f"Message submission failed: {str(e)}")
+            logger.error("Batch message submission failed: %s", e)
+            raise BlockchainError(f"Batch message submission failed: {str(e)}")
     
     async def get_topic_info(self, topic_id: str) -> Dict[str, Any]:
         """
@@ -173,14 +494,14 @@ class HCSService:
             Topic information
         """
         try:
-            topic = TopicId.fromString(topic_id)
+            topic = _topic_id(topic_id)
             query = TopicInfoQuery().setTopicId(topic)
             info = await query.execute(self.hedera_client.client)
             
             result = {
                 "topic_id": topic_id,
                 "memo": info.topicMemo,
-                "running_hash": info.runningHash.hex() if info.runningHash else None,
+                "running_hash": RunningHash(info.runningHash) if info.runningHash else None,
                 "sequence_number": info.sequenceNumber,
                 "expiration_time": str(info.expirationTime) if info.expirationTime else None,
                 "admin_key": str(info.adminKey) if info.adminKey else None,
@@ -193,7 +514,7 @@ class HCSService:
             return result
             
         except Exception as e:
-            logger.error(f"Topic info query failed: {str(e)}")
+            logger.error("Topic info query failed: %s", e)
             raise BlockchainError(f"Topic info query failed: {str(e)}")
     
     async def get_topic_messages(
@@ -206,6 +527,9 @@ class HCSService:
         """
         Get messages from HCS topic.
         
+        Bounded historical reads (with a start_time) are served by the mirror
+        node REST API; open-ended reads fall back to a gRPC subscription.
+        
         Args:
             topic_id: Topic ID to query
             start_time: Start time for message range
@@ -216,7 +540,12 @@ class HCSService:
             List of topic messages
         """
         try:
-            topic = TopicId.fromString(topic_id)
+            if start_time and self.mirror_node_url:
+                messages = await self._fetch_mirror_messages(topic_id, start_time, end_time, limit)
+                logger.debug("Retrieved %s messages from topic %s via mirror node", len(messages), topic_id)
+                return messages
+            
+            topic = _topic_id(topic_id)
             query = TopicMessageQuery().setTopicId(topic)
             
             if start_time:
@@ -227,33 +556,36 @@ class HCSService:
             
             query.setLimit(limit)
             
-            messages = []
+            # The handler runs on an SDK thread, so it only records the raw
+            # message; decoding happens on the caller's side once collected.
+            raw_messages = []
+            await query.subscribe(self.hedera_client.client, raw_messages.append)
             
-            # Execute query and collect messages
-            def message_handler(message):
+            raw_messages.sort(key=lambda message: message.sequenceNumber)
+            messages = []
+            for message in raw_messages[:limit]:
                 try:
-                    content = message.contents.decode('utf-8')
-                    messages.append({
-                        "consensus_timestamp": str(message.consensusTimestamp),
-                        "sequence_number": message.sequenceNumber,
-                        "running_hash": message.runningHash.hex() if message.runningHash else None,
-                        "contents": content,
-                        "chunk_info": {
-                            "initial_transaction_id": str(message.initialTransactionId) if hasattr(message, 'initialTransactionId') else None,
-                            "chunk_number": getattr(message, 'chunkNumber', None),
-                            "total_chunks": getattr(message, 'totalChunks', None)
-                        }
-                    })
+                    content = decode_contents(message.contents)
                 except Exception as e:
-                    logger.warning(f"Failed to decode message: {str(e)}")
-            
-            await query.subscribe(self.hedera_client.client, message_handler)
+                    logger.warning("Failed to decode message: %s", e)
+                    continue
+                messages.append({
+                    "consensus_timestamp": str(message.consensusTimestamp),
+                    "sequence_number": message.sequenceNumber,
+                    "running_hash": RunningHash(message.runningHash) if message.runningHash else None,
+                    "contents": content,
+                    "chunk_info": {
+                        "initial_transaction_id": str(message.initialTransactionId) if hasattr(message, 'initialTransactionId') else None,
+                        "chunk_number": getattr(message, 'chunkNumber', None),
+                        "total_chunks": getattr(message, 'totalChunks', None)
+                    }
+                })
             
-            logger.debug(f"Retrieved {len(messages)} messages from topic {topic_id}")
+            logger.debug("Retrieved %s messages from topic %s", len(messages), topic_id)
             return messages
             
         except Exception as e:
-            logger.error(f"Topic message query failed: {str(e)}")
+            logger.error("Topic message query failed: %s", e)
             raise BlockchainError(f"Topic message query failed: {str(e)}")
     
     async def subscribe_to_topic(
@@ -274,14 +606,17 @@ class HCSService:
             Subscription result
         """
         try:
-            topic = TopicId.fromString(topic_id)
+            topic = _topic_id(topic_id)
             query = TopicMessageQuery().setTopicId(topic)
             
             if start_time:
                 query.setStartTime(Timestamp.fromDate(start_time))
+                started_at = start_time.isoformat() + "Z"
             else:
-                # Start from now
-                query.setStartTime(Timestamp.fromDate(datetime.utcnow()))
+                # Start from now, built from epoch nanoseconds without a datetime round-trip
+                seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+                query.setStartTime(Timestamp(seconds, nanos))
+                started_at = utc_now_iso()
             
             # Wrapper to handle message processing
             def wrapped_handler(message):
@@ -290,12 +625,12 @@ class HCSService:
                         "topic_id": topic_id,
                         "consensus_timestamp": str(message.consensusTimestamp),
                         "sequence_number": message.sequenceNumber,
-                        "contents": message.contents.decode('utf-8'),
-                        "running_hash": message.runningHash.hex() if message.runningHash else None
+                        "contents": decode_contents(message.contents),
+                        "running_hash": RunningHash(message.runningHash) if message.runningHash else None
                     }
                     message_handler(processed_message)
                 except Exception as e:
-                    logger.error(f"Message handler error: {str(e)}")
+                    logger.error("Message handler error: %s", e)
             
             # Start subscription
             await query.subscribe(self.hedera_client.client, wrapped_handler)
@@ -306,14 +641,14 @@ class HCSService:
             result = {
                 "topic_id": topic_id,
                 "subscription_status": "active",
-                "start_time": start_time.isoformat() + "Z" if start_time else datetime.utcnow().isoformat() + "Z"
+                "start_time": started_at
             }
             
-            logger.info(f"Subscribed to topic {topic_id}")
+            logger.info("Subscribed to topic %s", topic_id)
             return result
             
         except Exception as e:
-            logger.error(f"Topic subscription failed: {str(e)}")
+            logger.error("Topic subscription failed: %s", e)
             raise BlockchainError(f"Topic subscription failed: {str(e)}")
     
     async def unsubscribe_from_topic(self, topic_id: str) -> Dict[str, Any]:
@@ -336,55 +671,76 @@ class HCSService:
             result = {
                 "topic_id": topic_id,
                 "subscription_status": "inactive",
-                "unsubscribed_at": datetime.utcnow().isoformat() + "Z"
+                "unsubscribed_at": utc_now_iso()
             }
             
-            logger.info(f"Unsubscribed from topic {topic_id}")
+            logger.info("Unsubscribed from topic %s", topic_id)
             return result
             
         except Exception as e:
-            logger.error(f"Topic unsubscription failed: {str(e)}")
+            logger.error("Topic unsubscription failed: %s", e)
             raise BlockchainError(f"Topic unsubscription failed: {str(e)}")
     
     async def _submit_chunked_message(
         self,
         topic: TopicId,
-        message_bytes: bytes,
+        message_bytes: Union[bytes, bytearray, memoryview],
         memo: Optional[str],
         chunk_size: int
     ) -> Dict[str, Any]:
-        """Submit large message in chunks."""
-        chunks = [message_bytes[i:i + chunk_size] for i in range(0, len(message_bytes), chunk_size)]
+        """Submit large message in chunks, atomically batched when the SDK allows it."""
+        # memoryview slices share the payload buffer instead of copying each chunk
+        view = memoryview(message_bytes)
+        chunks = [view[i:i + chunk_size] for i in range(0, len(view), chunk_size)]
         total_chunks = len(chunks)
+        chunk_memos = [
+            f"{memo}:chunk:{i + 1}/{total_chunks}" if memo else None
+            for i in range(total_chunks)
+        ]
         
-        results = []
-        initial_transaction_id = None
+        # One atomic batch replaces N separate consensus submissions
+        if BatchTransaction is not None and total_chunks <= self.MAX_BATCH_SIZE:
+            response, _, inner_ids = await self._execute_batch(topic, chunks, chunk_memos)
+            return {
+                "topic_id": str(topic),
+                "message_size": len(message_bytes),
+                "total_chunks": total_chunks,
+                "initial_transaction_id": str(inner_ids[0]),
+                "batch_transaction_id": str(response.transactionId),
+                "chunks": [
+                    {"chunk_number": i + 1, "transaction_id": str(inner_id)}
+                    for i, inner_id in enumerate(inner_ids)
+                ],
+                "status": "success"
+            }
         
-        for i, chunk in enumerate(chunks):
-            transaction = (
-                TopicMessageSubmitTransaction()
-                .setTopicId(topic)
-                .setMessage(chunk)
-            )
-            
-            if memo:
-                chunk_memo = f"{memo}:chunk:{i + 1}/{total_chunks}"
-                transaction.setTransactionMemo(chunk_memo)
-            
-            # Freeze, sign, and execute
-            transaction = transaction.freezeWith(self.hedera_client.client)
-            signed_transaction = transaction.sign(self.hedera_client.operator_private_key)
-            response = await signed_transaction.execute(self.hedera_client.client)
-            receipt = await response.getReceipt(self.hedera_client.client)
-            
-            if i == 0:
-                initial_transaction_id = str(response.transactionId)
-            
-            results.append({
+        # Freezing and signing is local work; build every transaction up front
+        signed_transactions = [
+            self._signed_submit_transaction(topic, chunk, chunk_memo)
+            for chunk, chunk_memo in zip(chunks, chunk_memos)
+        ]
+        
+        # Consensus round-trips dominate, so keep up to CHUNK_CONCURRENCY chunks
+        # in flight; each slot frees as soon as its receipt arrives.
+        semaphore = asyncio.Semaphore(self.CHUNK_CONCURRENCY)
+        
+        async def submit_chunk(transaction):
+            async with semaphore:
+                return await self._execute_with_receipt(transaction)
+        
+        outcomes = await asyncio.gather(*(submit_chunk(tx) for tx in signed_transactions))
+        responses = [response for response, _ in outcomes]
+        receipts = [receipt for _, receipt in outcomes]
+        
+        initial_transaction_id = str(responses[0].transactionId)
+        results = [
+            {
                 "chunk_number": i + 1,
                 "transaction_id": str(response.transactionId),
                 "sequence_number": receipt.topicSequenceNumber
-            })
+            }
+            for i, (response, receipt) in enumerate(zip(responses, receipts))
+        ]
         
         return {
             "topic_id": str(topic),
@@ -395,6 +751,183 @@ class HCSService:
             "status": "success"
         }
     
+    @staticmethod
+    def _submission_result(
+        topic_id: str,
+        message_bytes: Union[bytes, bytearray, memoryview],
+        compression_ratio: float,
+        response: Any,
+        receipt: Optional[Any],
+        stringify: bool = True
+    ) -> Dict[str, Any]:
+        """Result dict for a single-message submission; no receipt means "pending"."""
+        consensus_timestamp = sequence_number = running_hash = None
+        if stringify:
+            transaction_id = str(response.transactionId)
+            if receipt is not None:
+                consensus_timestamp = str(receipt.consensusTimestamp) if receipt.consensusTimestamp else None
+                running_hash = RunningHash(receipt.topicRunningHash) if receipt.topicRunningHash else None
+        else:
+            # Skip the JPype string conversions for callers that discard them
+            transaction_id = response.transactionId
+            if receipt is not None:
+                consensus_timestamp = receipt.consensusTimestamp
+                running_hash = receipt.topicRunningHash
+        if receipt is not None:
+            sequence_number = receipt.topicSequenceNumber
+        
+        return {
+            "topic_id": topic_id,
+            "message_size": len(message_bytes),
+            "compression_ratio": compression_ratio,
+            "transaction_id": transaction_id,
+            "consensus_timestamp": consensus_timestamp,
+            "sequence_number": sequence_number,
+            "running_hash": running_hash,
+            "status": "success" if receipt is not None else "pending"
+        }
+    
+    async def _execute_with_receipt(self, transaction) -> Tuple[Any, Any]:
+        """Execute a signed transaction and wait for its receipt."""
+        client = self.hedera_client.client
+        response = await transaction.execute(client)
+        receipt = await response.getReceipt(client)
+        return response, receipt
+    
+    async def _execute_batch(
+        self,
+        topic: TopicId,
+        payloads: List[Union[bytes, bytearray, memoryview]],
+        memos: List[Optional[str]]
+    ) -> Tuple[Any, Any, List[Any]]:
+        """Wrap one submission per payload in a signed atomic batch and execute it."""
+        client = self.hedera_client.client
+        operator_key = self.hedera_client.operator_private_key
+        batch_key = operator_key.getPublicKey()
+        
+        batch = BatchTransaction()
+        for payload, memo in zip(payloads, memos):
+            transaction = (
+                TopicMessageSubmitTransaction()
+                .setTopicId(topic)
+                .setMessage(payload)
+            )
+            if memo:
+                transaction.setTransactionMemo(memo)
+            batch.addInnerTransaction(transaction.batchify(client, batch_key))
+        
+        batch = batch.freezeWith(client).sign(operator_key)
+        response, receipt = await self._execute_with_receipt(batch)
+        return response, receipt, list(batch.getInnerTransactionIds())
+    
+    def _signed_submit_transaction(
+        self,
+        topic: TopicId,
+        payload: Union[bytes, bytearray, memoryview],
+        memo: Optional[str]
+    ) -> TopicMessageSubmitTransaction:
+        """
+        Build, freeze, and sign a message submission ready to execute.
+        
+        The SDK freezes builders in place and has no clone, so a frozen
+        transaction cannot serve as a per-topic template; each submission
+        gets a fresh builder and only the parsed TopicId is shared.
+        """
+        transaction = (
+            TopicMessageSubmitTransaction()
+            .setTopicId(topic)
+            .setMessage(payload)
+        )
+        
+        if memo:
+            transaction.setTransactionMemo(memo)
+        
+        transaction = transaction.freezeWith(self.hedera_client.client)
+        return transaction.sign(self.hedera_client.operator_private_key)
+    
+    async def _fetch_mirror_messages(
+        self,
+        topic_id: str,
+        start_time: datetime,
+        end_time: Optional[datetime],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Read a bounded message range from the mirror node REST API.
+        
+        Topic sequence numbers are contiguous, so once the first page reveals
+        where the range starts the remaining pages are fetched concurrently.
+        """
+        if self._mirror_http is None:
+            self._mirror_http = httpx.AsyncClient(base_url=self.mirror_node_url, timeout=10.0)
+        
+        path = f"/api/v1/topics/{topic_id}/messages"
+        time_filters = [("timestamp", f"gte:{_mirror_timestamp(start_time)}")]
+        if end_time:
+            time_filters.append(("timestamp", f"lte:{_mirror_timestamp(end_time)}"))
+        
+        async def fetch_page(filters, page_limit):
+            response = await self._mirror_http.get(
+                path, params=filters + [("limit", page_limit), ("order", "asc")]
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content).get("messages", [])
+        
+        first_page = await fetch_page(time_filters, min(limit, MIRROR_PAGE_SIZE))
+        raw_messages = list(first_page)
+        
+        if len(first_page) == MIRROR_PAGE_SIZE and limit > MIRROR_PAGE_SIZE:
+            first_sequence = first_page[0]["sequence_number"]
+            pages = await asyncio.gather(*(
+                fetch_page(
+                    time_filters + [("sequencenumber", f"gte:{first_sequence + offset}")],
+                    min(MIRROR_PAGE_SIZE, limit - offset)
+                )
+                for offset in range(MIRROR_PAGE_SIZE, limit, MIRROR_PAGE_SIZE)
+            ))
+            for page in pages:
+                raw_messages.extend(page)
+        
+        messages = []
+        for message in raw_messages:
+            try:
+                content = decode_contents(b64decode(message["contents"]))
+            except Exception as e:
+                logger.warning("Failed to decode message: %s", e)
+                continue
+            running_hash = message.get("running_hash")
+            chunk_info = message.get("chunk_info") or {}
+            initial_tx = chunk_info.get("initial_transaction_id")
+            messages.append({
+                "consensus_timestamp": message["consensus_timestamp"],
+                "sequence_number": message["sequence_number"],
+                "running_hash": RunningHash(b64decode(running_hash)) if running_hash else None,
+                "contents": content,
+                "chunk_info": {
+                    "initial_transaction_id": (
+                        f"{initial_tx['account_id']}@{initial_tx['transaction_valid_start']}"
+                        if initial_tx else None
+                    ),
+                    "chunk_number": chunk_info.get("number"),
+                    "total_chunks": chunk_info.get("total")
+                }
+            })
+        
+        return messages
+    
+    def close(self):
+        """Return a pooled Hedera client to the shared pool."""
+        if self._pooled_client and self.hedera_client is not None:
+            get_hedera_client_pool().release(self.hedera_client)
+            self.hedera_client = None
+    
+    async def aclose(self):
+        """Close the mirror node HTTP client and release the Hedera client."""
+        if self._mirror_http is not None:
+            await self._mirror_http.aclose()
+            self._mirror_http = None
+        self.close()
+    
     def get_subscription_status(self) -> Dict[str, Any]:
         """Get current subscription status."""
         return {
@@ -4,8 +4,13 @@ Hedera Client
 Core Hedera network client providing connection management and basic operations.
 """
 
+import asyncio
+import contextlib
+import functools
 import logging
-from typing import Dict, List, Optional, Any
+import httpx
+import orjson
+from typing import Dict, List, Optional, Any, Callable, Iterator, Set
 from hedera import (
     Client, 
     AccountId, 
@@ -14,21 +19,52 @@ from hedera import (
     AccountCreateTransaction,
     AccountBalanceQuery,
     TransferTransaction,
-    Status
+    Status,
+    Duration
 )
 from ..core.config import get_settings
 from ..core.exceptions import BlockchainError
 
 logger = logging.getLogger(__name__)
 
+# Public mirror node REST endpoints per network
+MIRROR_NODE_URLS = {
+    "mainnet": "https://mainnet-public.mirrornode.hedera.com",
+    "testnet": "https://testnet.mirrornode.hedera.com",
+    "previewnet": "https://previewnet.mirrornode.hedera.com"
+}
+
+# Maximum rows the mirror node returns per page
+MIRROR_PAGE_SIZE = 100
+
+
+@functools.lru_cache(maxsize=1024)
+def _account_id(account_id: str) -> AccountId:
+    """Parse an account ID once per distinct string; AccountId is immutable."""
+    return AccountId.fromString(account_id)
+
+
 class HederaClient:
     """Core Hedera network client for blockchain operations."""
     
+    # gRPC channel tuning: keep channels warm and avoid address-book churn
+    GRPC_DEADLINE_SECONDS = 30
+    NETWORK_UPDATE_PERIOD_HOURS = 24
+    MAX_ATTEMPTS = 10
+    MAX_BACKOFF_SECONDS = 8
+    
     def __init__(self):
         self.settings = get_settings()
         self.client = None
         self.operator_account_id = None
         self.operator_private_key = None
+        self.receipt_failures = 0
+        self._pending_receipts: Set[asyncio.Task] = set()
+        self.mirror_node_url = (
+            self.settings.HEDERA_MIRROR_NODE_URL or
+            MIRROR_NODE_URLS.get(self.settings.HEDERA_NETWORK)
+        )
+        self._mirror_http: Optional[httpx.AsyncClient] = None
         self._initialize_client()
     
     def _initialize_client(self):
@@ -44,7 +80,7 @@ class HederaClient:
                 self.client = Client.forNetwork(self.settings.hedera_network_nodes)
             
             # Set operator account
-            self.operator_account_id = AccountId.fromString(self.settings.hedera_operator_id)
+            self.operator_account_id = _account_id(self.settings.hedera_operator_id)
             self.operator_private_key = PrivateKey.fromString(self.settings.hedera_operator_key)
             
             self.client.setOperator(
@@ -55,6 +91,12 @@ class HederaClient:
             # Set default transaction fee
             self.client.setDefaultMaxTransactionFee(Hbar.fromTinybars(100_000_000))  # 1 HBAR
             
+            # Reuse long-lived channels rather than re-resolving nodes frequently
+            self.client.setGrpcDeadline(Duration.ofSeconds(self.GRPC_DEADLINE_SECONDS))
+            self.client.setNetworkUpdatePeriod(Duration.ofHours(self.NETWORK_UPDATE_PERIOD_HOURS))
+            self.client.setMaxAttempts(self.MAX_ATTEMPTS)
+            self.client.setMaxBackoff(Duration.ofSeconds(self.MAX_BACKOFF_SECONDS))
+            
             logger.info(f"Hedera client initialized for {self.settings.hedera_network}")
             
         except Exception as e:
@@ -127,7 +169,7 @@ class HederaClient:
             Account balance information
         """
         try:
-            account = AccountId.fromString(account_id)
+            account = _account_id(account_id)
             
             query = AccountBalanceQuery().setAccountId(account)
             balance = await query.execute(self.client)
@@ -149,11 +191,75 @@ class HederaClient:
             logger.error(f"Balance query failed for {account_id}: {str(e)}")
             raise BlockchainError(f"Balance query failed: {str(e)}")
     
+    async def get_account_token_snapshot(self, account_id: str) -> Dict[str, Any]:
+        """
+        Get HBAR balance and token holdings, with decimals, from the mirror node.
+        
+        The account and its token relationships are read concurrently; token
+        pages are followed through the mirror node's links.next. Without a
+        mirror node this falls back to the network balance query, which does
+        not report decimals.
+        
+        Args:
+            account_id: Account ID to query
+            
+        Returns:
+            Snapshot with "hbar_balance" and "tokens" mapping each token ID to
+            its raw "balance" and "decimals"
+        """
+        if not self.mirror_node_url:
+            balance_info = await self.get_account_balance(account_id)
+            return {
+                "account_id": account_id,
+                "hbar_balance": balance_info["hbar_balance"],
+                "tokens": {
+                    token_id: {"balance": balance, "decimals": None}
+                    for token_id, balance in balance_info["tokens"].items()
+                }
+            }
+        
+        try:
+            if self._mirror_http is None:
+                self._mirror_http = httpx.AsyncClient(base_url=self.mirror_node_url, timeout=10.0)
+            
+            async def fetch(path, params=None):
+                response = await self._mirror_http.get(path, params=params)
+                response.raise_for_status()
+                return orjson.loads(response.content)
+            
+            account, page = await asyncio.gather(
+                fetch(f"/api/v1/accounts/{account_id}"),
+                fetch(f"/api/v1/accounts/{account_id}/tokens", {"limit": MIRROR_PAGE_SIZE})
+            )
+            
+            tokens = {}
+            while True:
+                for relationship in page.get("tokens", []):
+                    tokens[relationship["token_id"]] = {
+                        "balance": int(relationship["balance"]),
+                        "decimals": relationship.get("decimals")
+                    }
+                next_page = (page.get("links") or {}).get("next")
+                if not next_page:
+                    break
+                page = await fetch(next_page)
+            
+            return {
+                "account_id": account_id,
+                "hbar_balance": account["balance"]["balance"] / 100_000_000,  # Convert to HBAR
+                "tokens": tokens
+            }
+            
+        except Exception as e:
+            logger.error(f"Token snapshot query failed for {account_id}: {str(e)}")
+            raise BlockchainError(f"Token snapshot query failed: {str(e)}") from e
+    
     async def transfer_hbar(
         self,
         to_account_id: str,
         amount: float,
-        memo: Optional[str] = None
+        memo: Optional[str] = None,
+        wait_for_receipt: bool = True
     ) -> Dict[str, Any]:
         """
         Transfer HBAR between accounts.
@@ -162,12 +268,14 @@ class HederaClient:
             to_account_id: Recipient account ID
             amount: Amount in HBAR
             memo: Optional transaction memo
+            wait_for_receipt: Wait for consensus before returning; when False the
+                transfer returns as "pending" and is confirmed in the background
             
         Returns:
             Transfer transaction result
         """
         try:
-            to_account = AccountId.fromString(to_account_id)
+            to_account = _account_id(to_account_id)
             transfer_amount = Hbar.from(amount)
             
             transaction = (
@@ -183,6 +291,19 @@ class HederaClient:
             transaction = transaction.freezeWith(self.client)
             signed_transaction = transaction.sign(self.operator_private_key)
             response = await signed_transaction.execute(self.client)
+            
+            if not wait_for_receipt:
+                self.confirm_in_background(response, f"HBAR transfer to {to_account_id}")
+                return {
+                    "transaction_id": str(response.transactionId),
+                    "from_account": str(self.operator_account_id),
+                    "to_account": to_account_id,
+                    "amount": amount,
+                    "memo": memo,
+                    "status": "pending",
+                    "consensus_timestamp": None
+                }
+            
             receipt = await response.getReceipt(self.client)
             
             if receipt.status != Status.Success:
@@ -244,6 +365,32 @@ class HederaClient:
             logger.error(f"Transaction record query failed: {str(e)}")
             raise BlockchainError(f"Transaction record query failed: {str(e)}")
     
+    def confirm_in_background(self, response, description: str) -> asyncio.Task:
+        """
+        Poll a transaction receipt without blocking the caller.
+        
+        Failed confirmations are logged and counted in receipt_failures.
+        
+        Returns:
+            Task resolving to the receipt, or None if confirmation failed
+        """
+        task = asyncio.ensure_future(self._confirm_receipt(response, description))
+        self._pending_receipts.add(task)
+        task.add_done_callback(self._pending_receipts.discard)
+        return task
+    
+    async def _confirm_receipt(self, response, description: str):
+        """Wait for a transaction receipt and record failures."""
+        try:
+            receipt = await response.getReceipt(self.client)
+            if receipt.status != Status.Success:
+                raise BlockchainError(f"status {receipt.status}")
+            return receipt
+        except Exception as e:
+            self.receipt_failures += 1
+            logger.error(f"{description} ({response.transactionId}) failed to confirm: {str(e)}")
+            return None
+    
     def get_network_info(self) -> Dict[str, Any]:
         """Get current network information."""
         return {
@@ -251,7 +398,9 @@ class HederaClient:
             "operator_account": str(self.operator_account_id),
             "client_status": "connected" if self.client else "disconnected",
             "network_nodes": getattr(self.settings, 'hedera_network_nodes', {}),
-            "max_transaction_fee": "1 HBAR"
+            "max_transaction_fee": "1 HBAR",
+            "pending_receipts": len(self._pending_receipts),
+            "receipt_failures": self.receipt_failures
         }
     
     async def ping_network(self) -> bool:
@@ -262,8 +411,9 @@ class HederaClient:
             True if network is reachable
         """
         try:
-            # Simple balance query to test connectivity
-            await self.get_account_balance(str(self.operator_account_id))
+            # Balance queries are free; execute one directly rather than through
+            # get_account_balance, which also builds the full balance dict
+            await AccountBalanceQuery().setAccountId(self.operator_account_id).execute(self.client)
             return True
         except Exception as e:
             logger.warning(f"Network ping failed: {str(e)}")
@@ -275,6 +425,13 @@ class HederaClient:
             self.client.close()
             logger.info("Hedera client connection closed")
     
+    async def aclose(self):
+        """Close the mirror node HTTP client and the client connection."""
+        if self._mirror_http is not None:
+            await self._mirror_http.aclose()
+            self._mirror_http = None
+        self.close()
+    
     def __enter__(self):
         """Context manager entry."""
         return self
@@ -282,3 +439,75 @@ class HederaClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
+
+
+class HederaClientPool:
+    """
+    Bounded pool of shared HederaClient instances.
+    
+    Each HederaClient owns its gRPC channels and operator setup, so services
+    lease a client from the pool instead of constructing their own. Idle
+    clients are reused first, new ones are created up to max_clients, and
+    after that the least-leased client is shared.
+    """
+    
+    def __init__(
+        self,
+        max_clients: int = 4,
+        factory: Optional[Callable[[], HederaClient]] = None
+    ):
+        self.max_clients = max_clients
+        self._factory = factory or HederaClient
+        self._leases: Dict[HederaClient, int] = {}
+    
+    def acquire(self) -> HederaClient:
+        """Lease a client from the pool."""
+        client = min(self._leases, key=self._leases.get) if self._leases else None
+        
+        if client is None or (self._leases[client] and len(self._leases) < self.max_clients):
+            client = self._factory()
+            self._leases[client] = 0
+        
+        self._leases[client] += 1
+        return client
+    
+    def release(self, client: HederaClient):
+        """Return a leased client to the pool."""
+        if self._leases.get(client):
+            self._leases[client] -= 1
+    
+    @contextlib.contextmanager
+    def lease(self) -> Iterator[HederaClient]:
+        """Lease a client for the duration of a with block."""
+        client = self.acquire()
+        try:
+            yield client
+        finally:
+            self.release(client)
+    
+    def close(self):
+        """Close every pooled client."""
+        for client in self._leases:
+            client.close()
+        self._leases.clear()
+    
+    def get_pool_status(self) -> Dict[str, Any]:
+        """Get current pool usage."""
+        return {
+            "clients": len(self._leases),
+            "max_clients": self.max_clients,
+            "leases": sum(self._leases.values())
+        }
+
+
+@functools.lru_cache(maxsize=1)
+def get_hedera_client_pool() -> HederaClientPool:
+    """Return the process-wide client pool, sized from settings on first use."""
+    return HederaClientPool(max_clients=get_settings().HEDERA_CLIENT_POOL_SIZE)
+
+
+def __getattr__(name: str):
+    # `hedera_client_pool` stays reachable, but settings are only read on first use
+    if name == "hedera_client_pool":
+        return get_hedera_client_pool()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
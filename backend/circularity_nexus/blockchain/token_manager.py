@@ -5,16 +5,27 @@ High-level token management service that orchestrates HTS operations
 for waste tokens, carbon credits, and other tokenized assets.
 """
 
+import asyncio
+import itertools
+import json
 import logging
-from typing import Dict, List, Optional, Any, Union
+import zlib
+import orjson
+from types import MappingProxyType
+from typing import Dict, List, Optional, Any, Union, Mapping, Sequence
 from enum import Enum
-from datetime import datetime, timedelta
+from redis.asyncio import Redis
 from .hts_service import HTSService
 from .hedera_client import HederaClient
+from ..core.config import get_settings
 from ..core.exceptions import BlockchainError, ValidationError
+from ..core.timestamps import utc_now_iso
 
 logger = logging.getLogger(__name__)
 
+# Redis hash holding the token registry shared by every worker
+TOKEN_REGISTRY_KEY = "circ:token_registry"
+
 class TokenCategory(Enum):
     """Categories of tokens in the Circularity Nexus ecosystem."""
     WASTE_TOKEN = "waste_token"
@@ -34,6 +45,101 @@ class WasteTokenType(Enum):
     ORGANIC = "ORG"
     MIXED = "MIX"
 
+# Per-material waste token settings; "scale" is 10 ** decimals
+_WASTE_TOKEN_CONFIGS: Mapping[WasteTokenType, Dict[str, Any]] = MappingProxyType({
+    WasteTokenType.PET_PLASTIC: {
+        "name": "PET Plastic",
+        "decimals": 2,
+        "scale": 100,
+        "base_value_per_unit": 0.08,  # $0.08 per kg
+        "environmental_impact": "high"
+    },
+    WasteTokenType.ALUMINUM: {
+        "name": "Aluminum",
+        "decimals": 2,
+        "scale": 100,
+        "base_value_per_unit": 1.20,  # $1.20 per kg
+        "environmental_impact": "very_high"
+    },
+    WasteTokenType.CARDBOARD: {
+        "name": "Cardboard",
+        "decimals": 2,
+        "scale": 100,
+        "base_value_per_unit": 0.03,  # $0.03 per kg
+        "environmental_impact": "medium"
+    },
+    WasteTokenType.GLASS: {
+        "name": "Glass",
+        "decimals": 2,
+        "scale": 100,
+        "base_value_per_unit": 0.02,  # $0.02 per kg
+        "environmental_impact": "medium"
+    },
+    WasteTokenType.ELECTRONIC: {
+        "name": "Electronic Waste",
+        "decimals": 2,
+        "scale": 100,
+        "base_value_per_unit": 2.50,  # $2.50 per kg
+        "environmental_impact": "very_high"
+    },
+    WasteTokenType.TEXTILE: {
+        "name": "Textile",
+        "decimals": 2,
+        "scale": 100,
+        "base_value_per_unit": 0.015,  # $0.015 per kg
+        "environmental_impact": "low"
+    },
+    WasteTokenType.ORGANIC: {
+        "name": "Organic Waste",
+        "decimals": 2,
+        "scale": 100,
+        "base_value_per_unit": 0.01,  # $0.01 per kg
+        "environmental_impact": "medium"
+    },
+    WasteTokenType.MIXED: {
+        "name": "Mixed Waste",
+        "decimals": 2,
+        "scale": 100,
+        "base_value_per_unit": 0.025,  # $0.025 per kg
+        "environmental_impact": "medium"
+    }
+})
+
+# Token multiplier per waste quality grade; unknown grades count as FAIR
+_QUALITY_MULTIPLIERS: Mapping[str, float] = MappingProxyType({
+    "EXCELLENT": 1.0,
+    "GOOD": 0.8,
+    "FAIR": 0.6,
+    "POOR": 0.3
+})
+
+# Portfolio summary counter for each token category
+_CATEGORY_COUNTERS: Mapping[str, str] = MappingProxyType({
+    TokenCategory.WASTE_TOKEN.value: "waste_tokens",
+    TokenCategory.CARBON_CREDIT.value: "carbon_credits",
+    TokenCategory.RECYCLING_CERTIFICATE.value: "certificates"
+})
+
+# Certificate NFT attributes read from certificate_data: (trait, key, default)
+_CERT_ATTR_SPEC = (
+    ("Certificate Type", "type", "RECYCLING"),
+    ("Waste Type", "waste_type", "MIXED"),
+    ("Weight (kg)", "weight_kg", 0),
+    ("CO2 Saved (kg)", "co2_saved_kg", 0)
+)
+
+
+def compute_token_amounts(
+    weights: Sequence[float],
+    multipliers: Sequence[float],
+    base_value: float,
+    scale: int
+) -> List[int]:
+    """Raw waste token amounts for many (weight, quality multiplier) rows."""
+    # Same operand order as a single mint so both round identically
+    return [int(weight * base_value * multiplier * scale) for weight, multiplier in zip(weights, multipliers)]
+
+
 class TokenManager:
     """
     High-level token management service for the Circularity Nexus platform.
@@ -45,25 +151,43 @@ class TokenManager:
     def __init__(self):
         self.hts_service = HTSService()
         self.hedera_client = HederaClient()
+        # Local copy of the shared registry; misses fall through to Redis
         self.token_registry: Dict[str, Dict[str, Any]] = {}
-        self.waste_token_configs = self._load_waste_token_configs()
+        self.redis = Redis.from_url(get_settings().REDIS_URL, decode_responses=True)
+        self.waste_token_configs = _WASTE_TOKEN_CONFIGS
+        # Spreads treasury mints (no recipient to hash) over a token's shards
+        self._shard_counter = itertools.count()
     
     async def create_waste_token(
         self,
         waste_type: WasteTokenType,
         region: str = "GLOBAL",
-        max_supply: Optional[int] = None
+        max_supply: Optional[int] = None,
+        shards: int = 1
     ) -> Dict[str, Any]:
         """
         Create a new waste token for a specific material type.
         
+        With more than one shard, the logical token is backed by that many
+        HTS tokens (PET-GLOBAL-0, PET-GLOBAL-1, ...). Mints on one HTS token
+        serialize on its supply, so mints for a busy material are spread
+        over the shards, and portfolios add the shards back together.
+        
+        If some shard tokens fail to create, the ones that exist on-chain are
+        still registered as the logical token; the result then has status
+        "partial" and lists the rest under "failed_shards".
+        
         Args:
             waste_type: Type of waste material
             region: Geographic region for the token
-            max_supply: Maximum token supply
+            max_supply: Maximum token supply; split across shards so the
+                shard caps add up to it exactly, and must be at least the
+                number of shards
+            shards: Number of HTS tokens backing the logical token
             
         Returns:
-            Token creation result
+            Token creation result; the first created shard's ID identifies
+            the token
         """
         try:
             config = self.waste_token_configs[waste_type]
@@ -73,15 +197,38 @@ class TokenManager:
             name = f"{config['name']} Token ({region})"
             memo = f"Waste token for {config['name']} in {region} region"
             
-            # Create the token
-            result = await self.hts_service.create_fungible_token(
-                name=name,
-                symbol=symbol,
-                decimals=config['decimals'],
-                initial_supply=0,  # Start with 0, mint as needed
-                max_supply=max_supply,
-                memo=memo
-            )
+            # Create the token, or every shard token at once
+            shard_symbols = [symbol] if shards <= 1 else [f"{symbol}-{i}" for i in range(shards)]
+            shard_caps: List[Optional[int]] = [None] * len(shard_symbols)
+            if max_supply is not None:
+                if max_supply < len(shard_symbols):
+                    raise ValidationError(
+                        f"Max supply {max_supply} cannot be split over {len(shard_symbols)} shards"
+                    )
+                # The first max_supply % K shards take the remainder
+                base, extra = divmod(max_supply, len(shard_symbols))
+                shard_caps = [base + 1 if i < extra else base for i in range(len(shard_symbols))]
+            outcomes = await asyncio.gather(*(
+                self.hts_service.create_fungible_token(
+                    name=name,
+                    symbol=shard_symbol,
+                    decimals=config['decimals'],
+                    initial_supply=0,  # Start with 0, mint as needed
+                    max_supply=shard_cap,
+                    memo=memo
+                )
+                for shard_symbol, shard_cap in zip(shard_symbols, shard_caps)
+            ), return_exceptions=True)
+            
+            results = [outcome for outcome in outcomes if not isinstance(outcome, BaseException)]
+            failed_shards = [
+                {"symbol": shard_symbol, "error": str(outcome)}
+                for shard_symbol, outcome in zip(shard_symbols, outcomes)
+                if isinstance(outcome, BaseException)
+            ]
+            if not results:
+                raise outcomes[0]
+            result = results[0]
             
             # Register in token registry
             token_info = {
@@ -91,17 +238,40 @@ class TokenManager:
                 "region": region,
                 "base_value_per_unit": config['base_value_per_unit'],
                 "environmental_impact": config['environmental_impact'],
-                "created_at": datetime.utcnow().isoformat() + "Z"
+                "scale": config['scale'],
+                "created_at": utc_now_iso()
             }
             
-            self.token_registry[result["token_id"]] = token_info
+            if len(shard_symbols) == 1:
+                await self._register_token(result["token_id"], token_info)
+            else:
+                # Every shard points back at the first, which lists them all
+                logical_id = result["token_id"]
+                shard_infos = [
+                    {**token_info, **shard_result, "symbol": symbol, "shard_of": logical_id}
+                    for shard_result in results
+                ]
+                token_info = shard_infos[0]
+                token_info["shards"] = [shard_result["token_id"] for shard_result in results]
+                await asyncio.gather(*(
+                    self._register_token(shard_info["token_id"], shard_info)
+                    for shard_info in shard_infos
+                ))
+                if failed_shards:
+                    logger.error(
+                        f"Waste token {symbol}: {len(failed_shards)} of {len(shard_symbols)} "
+                        f"shards failed; registered {token_info['shards']}"
+                    )
+                    token_info = {**token_info, "status": "partial", "failed_shards": failed_shards}
             
             logger.info(f"Created waste token: {symbol} ({result['token_id']})")
             return token_info
             
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Waste token creation failed: {str(e)}")
-            raise BlockchainError(f"Waste token creation failed: {str(e)}")
+            raise BlockchainError(f"Waste token creation failed: {str(e)}") from e
     
     async def create_carbon_credit_token(
         self,
@@ -145,17 +315,20 @@ class TokenManager:
                 "project_type": project_type,
                 "region": region,
                 "verification_standard": "VCS",  # Verified Carbon Standard
-                "created_at": datetime.utcnow().isoformat() + "Z"
+                "scale": 10 ** 3,
+                "created_at": utc_now_iso()
             }
             
-            self.token_registry[result["token_id"]] = token_info
+            await self._register_token(result["token_id"], token_info)
             
             logger.info(f"Created carbon credit token: {symbol} ({result['token_id']})")
             return token_info
             
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Carbon credit token creation failed: {str(e)}")
-            raise BlockchainError(f"Carbon credit token creation failed: {str(e)}")
+            raise BlockchainError(f"Carbon credit token creation failed: {str(e)}") from e
     
     async def create_recycling_certificate_nft(
         self,
@@ -190,24 +363,28 @@ class TokenManager:
                 **result,
                 "category": TokenCategory.RECYCLING_CERTIFICATE.value,
                 "certificate_type": certificate_type,
-                "created_at": datetime.utcnow().isoformat() + "Z"
+                "scale": 1,
+                "created_at": utc_now_iso()
             }
             
-            self.token_registry[result["token_id"]] = token_info
+            await self._register_token(result["token_id"], token_info)
             
             logger.info(f"Created recycling certificate NFT: {symbol} ({result['token_id']})")
             return token_info
             
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Recycling certificate NFT creation failed: {str(e)}")
-            raise BlockchainError(f"Recycling certificate NFT creation failed: {str(e)}")
+            raise BlockchainError(f"Recycling certificate NFT creation failed: {str(e)}") from e
     
     async def mint_waste_tokens(
         self,
         token_id: str,
         waste_weight_kg: float,
         quality_grade: str = "GOOD",
-        recipient_account: Optional[str] = None
+        recipient_account: Optional[str] = None,
+        high_volume: bool = False
     ) -> Dict[str, Any]:
         """
         Mint waste tokens based on waste weight and quality.
@@ -217,62 +394,159 @@ class TokenManager:
             waste_weight_kg: Weight of waste in kg
             quality_grade: Quality grade (EXCELLENT, GOOD, FAIR, POOR)
             recipient_account: Account to receive tokens (None = treasury)
+            high_volume: Mint on high-volume throttles during bursts
             
         Returns:
             Minting result
         """
         try:
             # Get token info
-            token_info = self.token_registry.get(token_id)
-            if not token_info or token_info["category"] != TokenCategory.WASTE_TOKEN.value:
-                raise ValidationError(f"Invalid waste token ID: {token_id}")
+            token_info = await self._require_token(token_id, TokenCategory.WASTE_TOKEN)
             
             # Calculate token amount based on weight and quality
             base_value = token_info["base_value_per_unit"]
             quality_multiplier = self._get_quality_multiplier(quality_grade)
-            decimals = token_info["decimals"]
+            scale = self._token_scale(token_info)
             
             # Convert weight to token units (accounting for decimals)
-            token_amount = int(waste_weight_kg * base_value * quality_multiplier * (10 ** decimals))
+            token_amount = int(waste_weight_kg * base_value * quality_multiplier * scale)
             
-            # Mint tokens
-            result = await self.hts_service.mint_tokens(
-                token_id=token_id,
-                amount=token_amount
+            result = await self._issue_waste_tokens(
+                token_id, token_info, token_amount, recipient_account,
+                f"Waste token reward for {waste_weight_kg}kg {quality_grade} waste", high_volume
             )
-            
-            # Transfer to recipient if specified
-            if recipient_account:
-                await self.hts_service.transfer_tokens(
-                    token_id=token_id,
-                    from_account=token_info["treasury_account"],
-                    to_account=recipient_account,
-                    amount=token_amount,
-                    memo=f"Waste token reward for {waste_weight_kg}kg {quality_grade} waste"
-                )
-            
             result.update({
                 "waste_weight_kg": waste_weight_kg,
                 "quality_grade": quality_grade,
                 "quality_multiplier": quality_multiplier,
                 "token_amount_raw": token_amount,
-                "token_amount_formatted": token_amount / (10 ** decimals),
+                "token_amount_formatted": token_amount / scale,
                 "recipient_account": recipient_account
             })
             
             logger.info(f"Minted {token_amount} waste tokens for {waste_weight_kg}kg waste")
             return result
             
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Waste token minting failed: {str(e)}")
-            raise BlockchainError(f"Waste token minting failed: {str(e)}")
+            raise BlockchainError(f"Waste token minting failed: {str(e)}") from e
+    
+    async def mint_waste_tokens_batch(
+        self,
+        token_id: str,
+        weights_kg: Sequence[float],
+        quality_grades: Sequence[str],
+        recipient_accounts: Sequence[Optional[str]],
+        high_volume: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Mint waste tokens for many pickups of the same waste token.
+        
+        The token is validated and every amount computed once up front, then
+        the mints are submitted concurrently. A failed row does not stop the
+        others; it is reported with status "failed" and the error.
+        
+        Args:
+            token_id: Waste token ID
+            weights_kg: Weight of waste in kg, one per row
+            quality_grades: Quality grade, one per row
+            recipient_accounts: Account to receive tokens, one per row (None = treasury)
+            high_volume: Mint on high-volume throttles during bursts
+            
+        Returns:
+            Minting result per row, in input order
+        """
+        try:
+            if not len(weights_kg) == len(quality_grades) == len(recipient_accounts):
+                raise ValidationError("Weights, quality grades and recipients must have the same length")
+            
+            token_info = await self._require_token(token_id, TokenCategory.WASTE_TOKEN)
+            
+            multipliers = [self._get_quality_multiplier(grade) for grade in quality_grades]
+            scale = self._token_scale(token_info)
+            amounts = compute_token_amounts(weights_kg, multipliers, token_info["base_value_per_unit"], scale)
+            
+            outcomes = await asyncio.gather(
+                *(
+                    self._issue_waste_tokens(
+                        token_id, token_info, amount, recipient,
+                        f"Waste token reward for {weight}kg {grade} waste", high_volume
+                    )
+                    for weight, grade, recipient, amount
+                    in zip(weights_kg, quality_grades, recipient_accounts, amounts)
+                ),
+                return_exceptions=True
+            )
+            
+            results = []
+            for weight, grade, multiplier, recipient, amount, outcome in zip(
+                weights_kg, quality_grades, multipliers, recipient_accounts, amounts, outcomes
+            ):
+                if isinstance(outcome, Exception):
+                    logger.warning(f"Waste token minting failed for {recipient}: {str(outcome)}")
+                    outcome = {"token_id": token_id, "status": "failed", "error": str(outcome)}
+                outcome.update({
+                    "waste_weight_kg": weight,
+                    "quality_grade": grade,
+                    "quality_multiplier": multiplier,
+                    "token_amount_raw": amount,
+                    "token_amount_formatted": amount / scale,
+                    "recipient_account": recipient
+                })
+                results.append(outcome)
+            
+            logger.info(f"Minted waste tokens for {len(results)} pickups")
+            return results
+            
+        except ValidationError:
+            raise
+        except Exception as e:
+            logger.error(f"Batch waste token minting failed: {str(e)}")
+            raise BlockchainError(f"Batch waste token minting failed: {str(e)}") from e
+    
+    async def _issue_waste_tokens(
+        self,
+        token_id: str,
+        token_info: Dict[str, Any],
+        token_amount: int,
+        recipient_account: Optional[str],
+        memo: str,
+        high_volume: bool
+    ) -> Dict[str, Any]:
+        """Mint a computed waste token amount, straight to the recipient if specified."""
+        # Sharded tokens mint into one shard, the same one per recipient
+        shards = token_info.get("shards")
+        mint_token_id = shards[self._shard_index(recipient_account, len(shards))] if shards else token_id
+        
+        if recipient_account:
+            result = await self.hts_service.mint_and_transfer(
+                token_id=mint_token_id,
+                amount=token_amount,
+                from_account=token_info["treasury_account"],
+                to_account=recipient_account,
+                memo=memo,
+                high_volume=high_volume
+            )
+        else:
+            result = await self.hts_service.mint_tokens(
+                token_id=mint_token_id,
+                amount=token_amount,
+                high_volume=high_volume
+            )
+        
+        if shards:
+            result["logical_token_id"] = token_id
+        return result
     
     async def mint_carbon_credits(
         self,
         token_id: str,
         co2_saved_kg: float,
         verification_data: Dict[str, Any],
-        recipient_account: Optional[str] = None
+        recipient_account: Optional[str] = None,
+        high_volume: bool = False
     ) -> Dict[str, Any]:
         """
         Mint carbon credit tokens based on CO2 savings.
@@ -282,35 +556,34 @@ class TokenManager:
             co2_saved_kg: Amount of CO2 saved in kg
             verification_data: Verification and audit data
             recipient_account: Account to receive credits
+            high_volume: Mint on high-volume throttles during bursts
             
         Returns:
             Minting result
         """
         try:
             # Get token info
-            token_info = self.token_registry.get(token_id)
-            if not token_info or token_info["category"] != TokenCategory.CARBON_CREDIT.value:
-                raise ValidationError(f"Invalid carbon credit token ID: {token_id}")
+            token_info = await self._require_token(token_id, TokenCategory.CARBON_CREDIT)
             
             # Convert CO2 savings to carbon credits (1 credit = 1000kg CO2)
             credits = co2_saved_kg / 1000.0
-            decimals = token_info["decimals"]
-            token_amount = int(credits * (10 ** decimals))
+            token_amount = int(credits * self._token_scale(token_info))
             
-            # Mint carbon credits
-            result = await self.hts_service.mint_tokens(
-                token_id=token_id,
-                amount=token_amount
-            )
-            
-            # Transfer to recipient if specified
+            # Mint carbon credits, straight to the recipient if specified
             if recipient_account:
-                await self.hts_service.transfer_tokens(
+                result = await self.hts_service.mint_and_transfer(
                     token_id=token_id,
+                    amount=token_amount,
                     from_account=token_info["treasury_account"],
                     to_account=recipient_account,
+                    memo=f"Carbon credits for {co2_saved_kg}kg CO2 saved",
+                    high_volume=high_volume
+                )
+            else:
+                result = await self.hts_service.mint_tokens(
+                    token_id=token_id,
                     amount=token_amount,
-                    memo=f"Carbon credits for {co2_saved_kg}kg CO2 saved"
+                    high_volume=high_volume
                 )
             
             result.update({
@@ -325,15 +598,18 @@ class TokenManager:
             logger.info(f"Minted {credits} carbon credits for {co2_saved_kg}kg CO2 saved")
             return result
             
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Carbon credit minting failed: {str(e)}")
-            raise BlockchainError(f"Carbon credit minting failed: {str(e)}")
+            raise BlockchainError(f"Carbon credit minting failed: {str(e)}") from e
     
     async def mint_recycling_certificate(
         self,
         token_id: str,
         certificate_data: Dict[str, Any],
-        recipient_account: str
+        recipient_account: str,
+        high_volume: bool = False
     ) -> Dict[str, Any]:
         """
         Mint a recycling certificate NFT.
@@ -342,15 +618,14 @@ class TokenManager:
             token_id: Certificate NFT collection ID
             certificate_data: Certificate metadata
             recipient_account: Account to receive certificate
+            high_volume: Mint on high-volume throttles during bursts
             
         Returns:
             Minting result
         """
         try:
             # Get token info
-            token_info = self.token_registry.get(token_id)
-            if not token_info or token_info["category"] != TokenCategory.RECYCLING_CERTIFICATE.value:
-                raise ValidationError(f"Invalid recycling certificate token ID: {token_id}")
+            token_info = await self._require_token(token_id, TokenCategory.RECYCLING_CERTIFICATE)
             
             # Prepare metadata
             metadata_json = {
@@ -358,37 +633,28 @@ class TokenManager:
                 "description": certificate_data.get("description", "Recycling completion certificate"),
                 "image": certificate_data.get("image_url", ""),
                 "attributes": [
-                    {"trait_type": "Certificate Type", "value": certificate_data.get("type", "RECYCLING")},
-                    {"trait_type": "Waste Type", "value": certificate_data.get("waste_type", "MIXED")},
-                    {"trait_type": "Weight (kg)", "value": certificate_data.get("weight_kg", 0)},
-                    {"trait_type": "CO2 Saved (kg)", "value": certificate_data.get("co2_saved_kg", 0)},
-                    {"trait_type": "Issue Date", "value": datetime.utcnow().isoformat()},
+                    *({"trait_type": trait, "value": certificate_data.get(key, default)}
+                      for trait, key, default in _CERT_ATTR_SPEC),
+                    {"trait_type": "Issue Date", "value": utc_now_iso()},
                     {"trait_type": "Issuer", "value": "Circularity Nexus"}
                 ],
                 "external_url": certificate_data.get("external_url", ""),
                 "certificate_data": certificate_data
             }
             
-            metadata_bytes = json.dumps(metadata_json).encode('utf-8')
+            metadata_bytes = orjson.dumps(metadata_json, option=orjson.OPT_NON_STR_KEYS)
             
-            # Mint NFT
-            result = await self.hts_service.mint_tokens(
+            # Mint NFT and transfer it to the recipient
+            result = await self.hts_service.mint_and_transfer(
                 token_id=token_id,
                 amount=1,  # Always 1 for NFTs
-                metadata=[metadata_bytes]
+                from_account=token_info["treasury_account"],
+                to_account=recipient_account,
+                metadata=[metadata_bytes],
+                memo=f"Recycling certificate for {certificate_data.get('waste_type', 'waste')} recycling",
+                high_volume=high_volume
             )
             
-            # Transfer to recipient
-            serial_numbers = result.get("serial_numbers", [])
-            if serial_numbers:
-                await self.hts_service.transfer_tokens(
-                    token_id=token_id,
-                    from_account=token_info["treasury_account"],
-                    to_account=recipient_account,
-                    serial_numbers=serial_numbers,
-                    memo=f"Recycling certificate for {certificate_data.get('waste_type', 'waste')} recycling"
-                )
-            
             result.update({
                 "certificate_data": certificate_data,
                 "metadata": metadata_json,
@@ -398,9 +664,11 @@ class TokenManager:
             logger.info(f"Minted recycling certificate NFT for {recipient_account}")
             return result
             
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Recycling certificate minting failed: {str(e)}")
-            raise BlockchainError(f"Recycling certificate minting failed: {str(e)}")
+            raise BlockchainError(f"Recycling certificate minting failed: {str(e)}") from e
     
     async def get_account_portfolio(self, account_id: str) -> Dict[str, Any]:
         """
@@ -413,75 +681,159 @@ class TokenManager:
             Complete portfolio information
         """
         try:
-            # Get account balance
-            balance_info = await self.hedera_client.get_account_balance(account_id)
-            
-            portfolio = {
-                "account_id": account_id,
-                "hbar_balance": balance_info["hbar_balance"],
-                "tokens": {},
-                "summary": {
-                    "total_tokens": 0,
-                    "waste_tokens": 0,
-                    "carbon_credits": 0,
-                    "certificates": 0,
-                    "total_value_usd": 0.0
-                }
+            # HBAR balance plus every token balance and its decimals at once
+            snapshot = await self.hedera_client.get_account_token_snapshot(account_id)
+            held = {
+                token_id: holding
+                for token_id, holding in snapshot["tokens"].items()
+                if holding["balance"] > 0
             }
+            registry = await self._get_registries(list(held))
+            
+            # Tokens created here keep their metadata in the registry; only
+            # other tokens need a (cached) HTS lookup
+            unknown = [token_id for token_id in held if "token_type" not in registry.get(token_id, {})]
+            token_infos = dict(zip(unknown, await asyncio.gather(
+                *(self.hts_service.get_token_info(token_id) for token_id in unknown),
+                return_exceptions=True
+            )))
+            
+            # Totals are kept in locals and written to the summary once
+            tokens = {}
+            total_tokens = 0
+            total_value_usd = 0.0
+            category_counts = dict.fromkeys(_CATEGORY_COUNTERS.values(), 0)
             
             # Process each token
-            for token_id, balance in balance_info["tokens"].items():
-                if balance > 0:
-                    try:
-                        token_info = await self.hts_service.get_token_info(token_id)
-                        registry_info = self.token_registry.get(token_id, {})
-                        
-                        formatted_balance = balance / (10 ** token_info["decimals"]) if token_info["decimals"] > 0 else balance
-                        
-                        token_data = {
-                            "token_id": token_id,
-                            "symbol": token_info["symbol"],
-                            "name": token_info["name"],
-                            "balance_raw": balance,
-                            "balance_formatted": formatted_balance,
-                            "decimals": token_info["decimals"],
-                            "token_type": token_info["token_type"],
-                            "category": registry_info.get("category", "unknown"),
-                            "estimated_value_usd": self._estimate_token_value(token_id, formatted_balance, registry_info)
-                        }
-                        
-                        portfolio["tokens"][token_id] = token_data
-                        portfolio["summary"]["total_tokens"] += 1
-                        portfolio["summary"]["total_value_usd"] += token_data["estimated_value_usd"]
-                        
-                        # Categorize tokens
-                        category = registry_info.get("category")
-                        if category == TokenCategory.WASTE_TOKEN.value:
-                            portfolio["summary"]["waste_tokens"] += 1
-                        elif category == TokenCategory.CARBON_CREDIT.value:
-                            portfolio["summary"]["carbon_credits"] += 1
-                        elif category == TokenCategory.RECYCLING_CERTIFICATE.value:
-                            portfolio["summary"]["certificates"] += 1
-                            
-                    except Exception as e:
-                        logger.warning(f"Failed to process token {token_id}: {str(e)}")
+            for token_id, holding in held.items():
+                token_info = token_infos.get(token_id) or registry[token_id]
+                if isinstance(token_info, Exception):
+                    logger.warning(f"Failed to process token {token_id}: {str(token_info)}")
+                    continue
+                
+                try:
+                    registry_info = registry.get(token_id, {})
+                    balance = holding["balance"]
+                    decimals = holding["decimals"] if holding["decimals"] is not None else token_info["decimals"]
+                    
+                    scale = registry_info.get("scale") or 10 ** decimals
+                    formatted_balance = balance / scale if scale > 1 else balance
+                    estimated_value = self._estimate_token_value(token_id, formatted_balance, registry_info)
+                    
+                    # Shards of one waste token add up to a single entry
+                    logical_id = registry_info.get("shard_of", token_id)
+                    existing = tokens.get(logical_id)
+                    if existing is not None:
+                        existing["balance_raw"] += balance
+                        existing["balance_formatted"] += formatted_balance
+                        existing["estimated_value_usd"] += estimated_value
+                        total_value_usd += estimated_value
                         continue
+                    
+                    category = registry_info.get("category")
+                    tokens[logical_id] = {
+                        "token_id": logical_id,
+                        "symbol": registry_info["symbol"] if "shard_of" in registry_info else token_info["symbol"],
+                        "name": token_info["name"],
+                        "balance_raw": balance,
+                        "balance_formatted": formatted_balance,
+                        "decimals": decimals,
+                        "token_type": token_info["token_type"],
+                        "category": category or "unknown",
+                        "estimated_value_usd": estimated_value
+                    }
+                    total_tokens += 1
+                    total_value_usd += estimated_value
+                    
+                    # Categorize tokens
+                    counter = _CATEGORY_COUNTERS.get(category)
+                    if counter is not None:
+                        category_counts[counter] += 1
+                        
+                except Exception as e:
+                    logger.warning(f"Failed to process token {token_id}: {str(e)}")
+                    continue
             
-            return portfolio
+            return {
+                "account_id": account_id,
+                "hbar_balance": snapshot["hbar_balance"],
+                "tokens": tokens,
+                "summary": {
+                    "total_tokens": total_tokens,
+                    **category_counts,
+                    "total_value_usd": total_value_usd
+                }
+            }
             
+        except ValidationError:
+            raise
         except Exception as e:
             logger.error(f"Portfolio query failed: {str(e)}")
-            raise BlockchainError(f"Portfolio query failed: {str(e)}")
+            raise BlockchainError(f"Portfolio query failed: {str(e)}") from e
+    
+    async def _register_token(self, token_id: str, token_info: Dict[str, Any]):
+        """Record a token locally and in the registry shared with other workers."""
+        self.token_registry[token_id] = token_info
+        try:
+            await self.redis.hset(TOKEN_REGISTRY_KEY, token_id, json.dumps(token_info, default=str))
+        except Exception as e:
+            # The token exists on-chain either way; other workers just miss it
+            logger.warning(f"Failed to share token {token_id} in registry: {str(e)}")
+    
+    async def _get_registry(self, token_id: str) -> Optional[Dict[str, Any]]:
+        """Get a registered token, including tokens created by other workers."""
+        token_info = self.token_registry.get(token_id)
+        if token_info is not None:
+            return token_info
+        return (await self._get_registries([token_id])).get(token_id)
+    
+    async def _require_token(self, token_id: str, category: TokenCategory) -> Dict[str, Any]:
+        """Get a registered token of the given category, or raise ValidationError."""
+        token_info = await self._get_registry(token_id)
+        if token_info is None or token_info.get("category") != category.value:
+            label = "waste" if category is TokenCategory.WASTE_TOKEN else category.value.replace("_", " ")
+            raise ValidationError(f"Invalid {label} token ID: {token_id}")
+        return token_info
+    
+    async def _get_registries(self, token_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get registered tokens, fetching local misses from Redis in one round trip."""
+        found = {
+            token_id: self.token_registry[token_id]
+            for token_id in token_ids
+            if token_id in self.token_registry
+        }
+        missing = [token_id for token_id in token_ids if token_id not in found]
+        if not missing:
+            return found
+        
+        try:
+            shared = await self.redis.hmget(TOKEN_REGISTRY_KEY, missing)
+        except Exception as e:
+            logger.warning(f"Token registry lookup failed: {str(e)}")
+            return found
+        
+        for token_id, raw in zip(missing, shared):
+            if raw is not None:
+                found[token_id] = self.token_registry[token_id] = json.loads(raw)
+        return found
+    
+    def _shard_index(self, account_id: Optional[str], shard_count: int) -> int:
+        """Pick a shard: stable per recipient, round-robin for treasury mints."""
+        if account_id:
+            # crc32 rather than hash(), which differs between worker processes
+            return zlib.crc32(account_id.encode()) % shard_count
+        return next(self._shard_counter) % shard_count
+    
+    def _token_scale(self, token_info: Dict[str, Any]) -> int:
+        """Get the raw units per whole token, precomputed for registered tokens."""
+        scale = token_info.get("scale")
+        if scale is None:
+            scale = 10 ** token_info["decimals"]
+        return scale
     
     def _get_quality_multiplier(self, quality_grade: str) -> float:
         """Get quality multiplier for token calculation."""
-        multipliers = {
-            "EXCELLENT": 1.0,
-            "GOOD": 0.8,
-            "FAIR": 0.6,
-            "POOR": 0.3
-        }
-        return multipliers.get(quality_grade.upper(), 0.6)
+        return _QUALITY_MULTIPLIERS.get(quality_grade.upper(), 0.6)
     
     def _estimate_token_value(self, token_id: str, balance: float, registry_info: Dict[str, Any]) -> float:
         """Estimate USD value of tokens."""
@@ -498,56 +850,3 @@ class TokenManager:
             return balance * 10.0  # $10 per certificate
         else:
             return 0.0
-    
-    def _load_waste_token_configs(self) -> Dict[WasteTokenType, Dict[str, Any]]:
-        """Load waste token configurations."""
-        return {
-            WasteTokenType.PET_PLASTIC: {
-                "name": "PET Plastic",
-                "decimals": 2,
-                "base_value_per_unit": 0.08,  # $0.08 per kg
-                "environmental_impact": "high"
-            },
-            WasteTokenType.ALUMINUM: {
-                "name": "Aluminum",
-                "decimals": 2,
-                "base_value_per_unit": 1.20,  # $1.20 per kg
-                "environmental_impact": "very_high"
-            },
-            WasteTokenType.CARDBOARD: {
-                "name": "Cardboard",
-                "decimals": 2,
-                "base_value_per_unit": 0.03,  # $0.03 per kg
-                "environmental_impact": "medium"
-            },
-            WasteTokenType.GLASS: {
-                "name": "Glass",
-                "decimals": 2,
-                "base_value_per_unit": 0.02,  # $0.02 per kg
-                "environmental_impact": "medium"
-            },
-            WasteTokenType.ELECTRONIC: {
-                "name": "Electronic Waste",
-                "decimals": 2,
-                "base_value_per_unit": 2.50,  # $2.50 per kg
-                "environmental_impact": "very_high"
-            },
-            WasteTokenType.TEXTILE: {
-                "name": "Textile",
-                "decimals": 2,
-                "base_value_per_unit": 0.015,  # $0.015 per kg
-                "environmental_impact": "low"
-            },
-            WasteTokenType.ORGANIC: {
-                "name": "Organic Waste",
-                "decimals": 2,
-                "base_value_per_unit": 0.01,  # $0.01 per kg
-                "environmental_impact": "medium"
-            },
-            WasteTokenType.MIXED: {
-                "name": "Mixed Waste",
-                "decimals": 2,
-                "base_value_per_unit": 0.025,  # $0.025 per kg
-                "environmental_impact": "medium"
-            }
-        }
@@ -2,13 +2,20 @@
 Configuration settings for Circularity Nexus
 """
 
-from pydantic_settings import BaseSettings
-from pydantic import Field, validator
+from pydantic_settings import BaseSettings, NoDecode
+from pydantic import Field, field_validator
 from typing import List, Optional
+from typing_extensions import Annotated
+from functools import lru_cache
+import json
 import os
 from pathlib import Path
 
 
+# List settings that may be given as a comma-separated string
+CSVList = Annotated[List[str], NoDecode]
+
+
 class Settings(BaseSettings):
     """Application settings"""
     
@@ -25,10 +32,11 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     WORKERS: int = 4
+    GUNICORN_WORKERS: Optional[int] = None  # None = 2 * CPU cores + 1
     RELOAD: bool = False
     
     # Database
-    DATABASE_URL: str = Field(..., description="SQLite database URL")
+    DATABASE_URL: str = Field(..., description="Database URL (SQLite or PostgreSQL)")
     DATABASE_ECHO: bool = False
     DATABASE_POOL_SIZE: int = 20
     DATABASE_MAX_OVERFLOW: int = 0
@@ -47,6 +55,9 @@ class Settings(BaseSettings):
     HEDERA_ACCOUNT_ID: str = Field(..., description="Hedera account ID")
     HEDERA_PRIVATE_KEY: str = Field(..., description="Hedera private key")
     HEDERA_PUBLIC_KEY: str = Field(..., description="Hedera public key")
+    HEDERA_CLIENT_POOL_SIZE: int = 4
+    HEDERA_MIRROR_NODE_URL: Optional[str] = None
+    HEDERA_HIGH_VOLUME_FEE_CAP: float = 2.0  # Max Hbar per high-volume transaction
     
     # AI Configuration
     AI_MODEL_PATH: str = "./models/waste_classifier.h5"
@@ -68,7 +79,7 @@ class Settings(BaseSettings):
     # File Storage
     UPLOAD_DIR: str = "./uploads"
     MAX_FILE_SIZE: int = 10485760  # 10MB
-    ALLOWED_EXTENSIONS: List[str] = [".jpg", ".jpeg", ".png", ".gif", ".bmp"]
+    ALLOWED_EXTENSIONS: CSVList = [".jpg", ".jpeg", ".png", ".gif", ".bmp"]
     
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -83,10 +94,11 @@ class Settings(BaseSettings):
     HEALTH_CHECK_INTERVAL: int = 30
     
     # CORS
-    CORS_ORIGINS: List[str] = ["http://localhost:3000", "http://localhost:8080"]
+    CORS_ORIGINS: CSVList = ["http://localhost:3000", "http://localhost:8080"]
     CORS_CREDENTIALS: bool = True
-    CORS_METHODS: List[str] = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
+    CORS_METHODS: CSVList = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
     CORS_HEADERS: List[str] = ["*"]
+    CORS_MAX_AGE: int = 86400  # Seconds browsers may cache a preflight response
     
     # Rate Limiting
     RATE_LIMIT_ENABLED: bool = True
@@ -113,33 +125,36 @@ class Settings(BaseSettings):
     TEST_DATABASE_URL: Optional[str] = None
     TEST_REDIS_URL: Optional[str] = None
     
-    @validator("CORS_ORIGINS", pre=True)
-    def assemble_cors_origins(cls, v):
-        if isinstance(v, str):
-            return [i.strip() for i in v.split(",")]
-        return v
-    
-    @validator("CORS_METHODS", pre=True)
-    def assemble_cors_methods(cls, v):
-        if isinstance(v, str):
-            return [i.strip() for i in v.split(",")]
-        return v
-    
-    @validator("ALLOWED_EXTENSIONS", pre=True)
-    def assemble_allowed_extensions(cls, v):
+    @field_validator("CORS_ORIGINS", "CORS_METHODS", "ALLOWED_EXTENSIONS", mode="before")
+    @classmethod
+    def assemble_csv_list(cls, v):
         if isinstance(v, str):
+            if v.lstrip().startswith("["):
+                return json.loads(v)
             return [i.strip() for i in v.split(",")]
         return v
     
-    @validator("UPLOAD_DIR")
-    def create_upload_dir(cls, v):
-        Path(v).mkdir(parents=True, exist_ok=True)
-        return v
-    
     class Config:
         env_file = ".env"
         case_sensitive = True
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing the environment on first use"""
+    return Settings()
+
+
+def ensure_upload_dir(settings: Settings) -> Path:
+    """Create the upload directory if it does not exist yet"""
+    upload_dir = Path(settings.UPLOAD_DIR)
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    return upload_dir
+
+
+def __getattr__(name: str):
+    # `from circularity_nexus.core.config import settings` keeps working, but
+    # the environment is only parsed once something actually asks for it
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,13 +2,17 @@
 Database configuration and session management
 """
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import MetaData
-from typing import AsyncGenerator
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
+from sqlalchemy.orm import DeclarativeBase, configure_mappers
+from sqlalchemy import MetaData, event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import StaticPool
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, List, Type
+import enum
 from loguru import logger
 
-from circularity_nexus.core.config import settings
+from circularity_nexus.core.config import get_settings
 
 
 # Database metadata with naming convention
@@ -28,26 +32,83 @@ class Base(DeclarativeBase):
     metadata = metadata
 
 
-# Create async engine
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=settings.DATABASE_ECHO,
-    pool_size=settings.DATABASE_POOL_SIZE,
-    max_overflow=settings.DATABASE_MAX_OVERFLOW,
-    pool_pre_ping=True,
-)
+def enum_values(enum_class: Type[enum.Enum]) -> List[str]:
+    """Store enum members by value; pass as values_callable to sqlalchemy.Enum"""
+    return [member.value for member in enum_class]
+
 
-# Create async session factory
-AsyncSessionLocal = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
+# Applied to every SQLite connection. WAL lets readers run alongside the
+# single writer, and busy_timeout makes writers wait for the file lock
+# instead of failing with "database is locked".
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA busy_timeout=5000",
 )
 
 
+def engine_options(database_url: str) -> Dict[str, Any]:
+    """Connection pool options suited to the database backend."""
+    settings = get_settings()
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        if url.database in (None, "", ":memory:"):
+            # Each connection to an in-memory database is a separate database
+            return {"poolclass": StaticPool}
+        return {
+            "pool_size": settings.DATABASE_POOL_SIZE,
+            "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        }
+    
+    return {
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+    }
+
+
+def configure_sqlite(async_engine: AsyncEngine) -> None:
+    """Apply SQLITE_PRAGMAS to each new connection of a SQLite engine."""
+    if async_engine.dialect.name != "sqlite":
+        return
+    
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Create the async engine on first use"""
+    settings = get_settings()
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        echo=settings.DATABASE_ECHO,
+        **engine_options(settings.DATABASE_URL),
+    )
+    configure_sqlite(engine)
+    return engine
+
+
+@lru_cache(maxsize=1)
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Create the async session factory on first use"""
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Dependency to get database session"""
-    async with AsyncSessionLocal() as session:
+    async with get_session_factory()() as session:
         try:
             yield session
         except Exception:
@@ -60,7 +121,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 async def init_db() -> None:
     """Initialize database tables"""
     try:
-        async with engine.begin() as conn:
+        async with get_engine().begin() as conn:
             # Import all models to ensure they are registered
             from circularity_nexus.models import (
                 user, waste_token, carbon_token, transaction, 
@@ -75,7 +136,22 @@ async def init_db() -> None:
         raise
 
 
+async def warm_up_db() -> None:
+    """Configure ORM mappers and open a pooled connection before serving"""
+    try:
+        # Otherwise done lazily by the first request that touches a model
+        configure_mappers()
+        async with get_engine().connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        logger.info("Database warm-up complete")
+    except Exception as e:
+        logger.error(f"Error warming up database: {e}")
+        raise
+
+
 async def close_db() -> None:
     """Close database connections"""
-    await engine.dispose()
+    if get_engine.cache_info().currsize == 0:
+        return
+    await get_engine().dispose()
     logger.info("Database connections closed")
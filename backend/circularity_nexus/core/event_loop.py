@@ -0,0 +1,43 @@
+"""
+Event loop configuration for Circularity Nexus
+"""
+
+import asyncio
+
+from loguru import logger
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop as the asyncio event loop policy when it is available.
+    
+    Must run before the first event loop is created. Falls back to the
+    default asyncio loop where uvloop is not installed (e.g. Windows).
+    
+    Returns:
+        True if uvloop was installed
+    """
+    try:
+        import uvloop
+    except ImportError:
+        logger.debug("uvloop not available, using default asyncio event loop")
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+def http_parser() -> str:
+    """
+    Pick the uvicorn HTTP protocol implementation.
+    
+    Returns:
+        "httptools" when the C parser is installed, otherwise "h11"
+    """
+    try:
+        import httptools  # noqa: F401
+    except ImportError:
+        logger.debug("httptools not available, using h11 HTTP parser")
+        return "h11"
+    
+    return "httptools"
@@ -2,12 +2,31 @@
 Custom exceptions for Circularity Nexus
 """
 
-from typing import Optional
+from typing import Optional, Tuple
+
+import orjson
+from fastapi.responses import Response
 
 
 class CircularityNexusException(Exception):
     """Base exception for Circularity Nexus"""
     
+    # (detail, error_code, JSON body) of a no-argument instance, if any
+    _default_payload: Optional[Tuple[str, str, bytes]] = None
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._default_payload = None
+        try:
+            default = cls()
+        except TypeError:
+            return
+        cls._default_payload = (
+            default.detail,
+            default.error_code,
+            orjson.dumps({"detail": default.detail, "error_code": default.error_code}),
+        )
+    
     def __init__(
         self,
         detail: str,
@@ -18,6 +37,13 @@ class CircularityNexusException(Exception):
         self.status_code = status_code
         self.error_code = error_code or self.__class__.__name__
         super().__init__(detail)
+    
+    def json_body(self) -> bytes:
+        """Serialized error payload, prebuilt when the defaults were used"""
+        default = self._default_payload
+        if default is not None and default[0] == self.detail and default[1] == self.error_code:
+            return default[2]
+        return orjson.dumps({"detail": self.detail, "error_code": self.error_code})
 
 
 class ValidationError(CircularityNexusException):
@@ -81,3 +107,40 @@ class RateLimitError(CircularityNexusException):
     
     def __init__(self, detail: str = "Rate limit exceeded"):
         super().__init__(detail, status_code=429, error_code="RATE_LIMIT_ERROR")
+
+
+class ExceptionMapperMiddleware:
+    """
+    Pure ASGI middleware turning CircularityNexusException into JSON errors.
+    
+    Responds with {"detail", "error_code"} and the exception's status code.
+    Errors raised after the response has started are re-raised untouched.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_tracking_start(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_tracking_start)
+        except CircularityNexusException as exc:
+            if response_started:
+                raise
+            response = Response(
+                content=exc.json_body(),
+                status_code=exc.status_code,
+                media_type="application/json"
+            )
+            await response(scope, receive, send)
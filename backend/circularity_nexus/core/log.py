@@ -0,0 +1,65 @@
+"""
+Logging configuration and request access logging
+"""
+
+import sys
+import time
+from loguru import logger
+
+
+def configure_logging(settings) -> None:
+    """
+    Replace loguru's default handler with a queued stderr sink.
+    
+    Records are formatted and written by loguru's background thread, so
+    the event loop only pays for putting the record on a queue. Call once
+    per process, after any fork, since the writer thread is not inherited.
+    
+    Args:
+        settings: Application settings (LOG_LEVEL, LOG_FORMAT)
+    """
+    logger.remove()
+    logger.add(
+        sys.stderr,
+        level=settings.LOG_LEVEL,
+        enqueue=True,
+        serialize=settings.LOG_FORMAT == "json",
+    )
+
+
+class AccessLogMiddleware:
+    """
+    Minimal ASGI access log: method, path, status and duration per request.
+    
+    Replaces the uvicorn/Gunicorn access loggers in production, which format
+    full log lines on the request path.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        start = time.perf_counter()
+        status = 500
+        
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # Fields go into the text for plain output and into extra for JSON
+            logger.info(
+                "{method} {path} {status} {dur_ms}ms",
+                method=scope["method"],
+                path=scope["path"],
+                status=status,
+                dur_ms=round((time.perf_counter() - start) * 1000, 2),
+            )
@@ -0,0 +1,20 @@
+"""
+Response classes for Circularity Nexus
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson.
+    
+    Defined here rather than imported from FastAPI, whose ORJSONResponse is
+    deprecated in newer releases and warns on use.
+    """
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
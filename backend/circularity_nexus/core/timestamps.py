@@ -0,0 +1,32 @@
+"""
+UTC timestamp helpers for Circularity Nexus
+"""
+
+import time
+from datetime import datetime
+
+# (whole second, formatted "YYYY-MM-DDTHH:MM:SS" prefix) of the last call
+_second_prefix = (None, "")
+
+
+def utc_now_iso() -> str:
+    """
+    Current UTC time as an ISO 8601 string with microseconds and a "Z" suffix.
+    
+    The date/time prefix is only reformatted when the wall-clock second
+    changes, so hot paths pay for a single integer format per call.
+    """
+    global _second_prefix
+    
+    second, nanos = divmod(time.time_ns(), 1_000_000_000)
+    cached_second, prefix = _second_prefix
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+        _second_prefix = (second, prefix)
+    
+    return f"{prefix}.{nanos // 1000:06d}Z"
+
+
+def to_iso(value: datetime) -> str:
+    """Format a naive UTC datetime as an ISO 8601 string with a "Z" suffix."""
+    return value.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
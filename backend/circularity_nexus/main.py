@@ -4,40 +4,66 @@ Main FastAPI application entry point for Circularity Nexus
 """
 
 import uvicorn
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
+from functools import lru_cache
 from loguru import logger
 import sys
 import os
+from typing import Any, Dict
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from circularity_nexus.core.config import settings
-from circularity_nexus.core.database import init_db
+from circularity_nexus.core.config import get_settings, ensure_upload_dir
+from circularity_nexus.core.database import init_db, warm_up_db
 from circularity_nexus.api.v1.router import api_router
-from circularity_nexus.core.exceptions import CircularityNexusException
+from circularity_nexus.core.exceptions import ExceptionMapperMiddleware
+from circularity_nexus.core.responses import ORJSONResponse
+from circularity_nexus.core.event_loop import install_uvloop, http_parser
+from circularity_nexus.core.log import configure_logging, AccessLogMiddleware
+from circularity_nexus.services.groq_service import get_groq_service
+
+# Responses smaller than this are sent uncompressed (bytes)
+GZIP_MINIMUM_SIZE = 1000
+GZIP_COMPRESS_LEVEL = 5
+
+# Gunicorn worker lifecycle timeouts (seconds)
+GUNICORN_GRACEFUL_TIMEOUT = 30
+GUNICORN_KEEPALIVE = 30
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
+    settings = get_settings()
+    groq_service = get_groq_service()
+    
     # Startup
+    configure_logging(settings)
     logger.info("Starting Circularity Nexus API...")
+    ensure_upload_dir(settings)
     await init_db()
     logger.info("Database initialized")
+    await warm_up_db()
+    if groq_service is not None:
+        groq_service.start_batching()
     
     yield
     
     # Shutdown
     logger.info("Shutting down Circularity Nexus API...")
+    if groq_service is not None:
+        await groq_service.stop_batching()
+    await logger.complete()
 
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application"""
+    settings = get_settings()
     
     app = FastAPI(
         title=settings.APP_NAME,
@@ -47,15 +73,26 @@ def create_app() -> FastAPI:
         docs_url=f"{settings.API_V1_STR}/docs",
         redoc_url=f"{settings.API_V1_STR}/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
-    # Add middleware
+    # Add middleware; innermost first, so error responses still get CORS and gzip
+    app.add_middleware(ExceptionMapperMiddleware)
+    
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.CORS_ORIGINS,
         allow_credentials=settings.CORS_CREDENTIALS,
         allow_methods=settings.CORS_METHODS,
         allow_headers=settings.CORS_HEADERS,
+        max_age=settings.CORS_MAX_AGE,
+    )
+    
+    # Outermost, so CORS headers ride along on compressed responses
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=GZIP_MINIMUM_SIZE,
+        compresslevel=GZIP_COMPRESS_LEVEL,
     )
 
     if not settings.DEBUG:
@@ -63,21 +100,8 @@ def create_app() -> FastAPI:
             TrustedHostMiddleware,
             allowed_hosts=["localhost", "127.0.0.1", "*.circularitynexus.io"]
         )
-
-    # Exception handlers
-    @app.exception_handler(CircularityNexusException)
-    async def circularity_nexus_exception_handler(request, exc: CircularityNexusException):
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={"detail": exc.detail, "error_code": exc.error_code}
-        )
-
-    @app.exception_handler(HTTPException)
-    async def http_exception_handler(request, exc: HTTPException):
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={"detail": exc.detail}
-        )
+        # Stands in for the server access logs, which are off outside DEBUG
+        app.add_middleware(AccessLogMiddleware)
 
     # Health check endpoint
     @app.get("/health")
@@ -90,16 +114,32 @@ def create_app() -> FastAPI:
     return app
 
 
-# Create the app instance
-app = create_app()
+@lru_cache(maxsize=1)
+def get_app() -> FastAPI:
+    """Return the process-wide app instance, building it on first use"""
+    return create_app()
+
+
+def __getattr__(name: str):
+    # "circularity_nexus.main:app" keeps working for uvicorn, but settings
+    # are only read once the server actually loads the app
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def main():
     """Main entry point for running the application"""
+    settings = get_settings()
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Debug mode: {settings.DEBUG}")
     
+    # Passed explicitly so reload and worker processes make the same choice
+    loop = "uvloop" if install_uvloop() else "asyncio"
+    http = http_parser()
+    logger.info(f"Using {loop} event loop with {http} HTTP parser")
+    
     uvicorn.run(
         "circularity_nexus.main:app",
         host=settings.HOST,
@@ -107,9 +147,48 @@ def main():
         reload=settings.RELOAD and settings.DEBUG,
         workers=1 if settings.DEBUG else settings.WORKERS,
         log_level=settings.LOG_LEVEL.lower(),
-        access_log=True,
+        access_log=settings.DEBUG,
+        loop=loop,
+        http=http,
     )
 
 
+def gunicorn_options() -> Dict[str, Any]:
+    """Gunicorn settings for serving the app with uvicorn workers"""
+    settings = get_settings()
+    options = {
+        "bind": f"{settings.HOST}:{settings.PORT}",
+        "workers": settings.GUNICORN_WORKERS or 2 * (os.cpu_count() or 1) + 1,
+        "worker_class": "uvicorn_worker.UvicornWorker",
+        "graceful_timeout": GUNICORN_GRACEFUL_TIMEOUT,
+        "keepalive": GUNICORN_KEEPALIVE,
+        "loglevel": settings.LOG_LEVEL.lower(),
+    }
+    
+    # Worker heartbeats on tmpfs cannot stall on a slow or full disk
+    if os.path.isdir("/dev/shm"):
+        options["worker_tmp_dir"] = "/dev/shm"
+    
+    return options
+
+
+def serve():
+    """Production entry point: uvicorn workers managed by Gunicorn"""
+    from gunicorn.app.base import BaseApplication
+    
+    settings = get_settings()
+    
+    class GunicornApplication(BaseApplication):
+        def load_config(self):
+            for key, value in gunicorn_options().items():
+                self.cfg.set(key, value)
+        
+        def load(self):
+            return get_app()
+    
+    logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION} under Gunicorn")
+    GunicornApplication().run()
+
+
 if __name__ == "__main__":
     main()
@@ -2,10 +2,10 @@
 Recycling vault model for DeFi staking
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Index, text
 from sqlalchemy.sql import func
 import enum
-from circularity_nexus.core.database import Base
+from circularity_nexus.core.database import Base, enum_values
 
 
 class VaultType(str, enum.Enum):
@@ -27,15 +27,24 @@ class RecyclingVault(Base):
     """Recycling vault model for DeFi staking"""
     
     __tablename__ = "recycling_vaults"
+    __table_args__ = (
+        Index("ix_vault_user_status", "user_id", "status"),
+        # Active stakes are the ones read on every dashboard and reward run
+        Index(
+            "ix_vault_active_user_type", "user_id", "vault_type",
+            postgresql_where=text("status = 'ACTIVE'"),
+            sqlite_where=text("status = 'ACTIVE'"),
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    vault_type = Column(Enum(VaultType), nullable=False)
+    vault_type = Column(Enum(VaultType, name="vaulttype", values_callable=enum_values), nullable=False)
     token_type = Column(String(50), nullable=False)  # PET, ALUMINUM, etc.
     staked_amount = Column(Integer, nullable=False)  # Amount in grams
     apy_rate = Column(Float, nullable=False)  # Annual percentage yield
     rewards_earned = Column(Float, default=0.0)  # Rewards in USDC
-    status = Column(Enum(StakeStatus), default=StakeStatus.ACTIVE)
+    status = Column(Enum(StakeStatus, name="stakestatus", values_callable=enum_values), default=StakeStatus.ACTIVE)
     stake_date = Column(DateTime(timezone=True), server_default=func.now())
     unstake_date = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
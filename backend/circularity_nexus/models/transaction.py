@@ -2,10 +2,10 @@
 Transaction model
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.sql import func
 import enum
-from circularity_nexus.core.database import Base
+from circularity_nexus.core.database import Base, enum_values
 
 
 class TransactionType(str, enum.Enum):
@@ -21,10 +21,14 @@ class Transaction(Base):
     """Transaction model for tracking all token operations"""
     
     __tablename__ = "transactions"
+    __table_args__ = (
+        # A user's transaction history, newest first
+        Index("ix_tx_user_created", "user_id", "created_at"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    transaction_type = Column(Enum(TransactionType), nullable=False)
+    transaction_type = Column(Enum(TransactionType, name="transactiontype", values_callable=enum_values), nullable=False)
     token_type = Column(String(50), nullable=False)
     amount = Column(Float, nullable=False)
     hedera_transaction_id = Column(String(100), unique=True, index=True)
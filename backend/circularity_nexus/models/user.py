@@ -4,6 +4,7 @@ User model
 
 from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
 from sqlalchemy.sql import func
+from sqlalchemy.orm import relationship
 from circularity_nexus.core.database import Base
 
 
@@ -29,5 +30,8 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    # Relationships
+    waste_submissions = relationship("WasteSubmission", back_populates="user")
+    
     def __repr__(self):
         return f"<User(id={self.id}, email='{self.email}', name='{self.full_name}')>"
@@ -2,11 +2,12 @@
 Waste submission model
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text, ForeignKey, Enum, Index, JSON, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 import enum
-from circularity_nexus.core.database import Base
+from circularity_nexus.core.database import Base, enum_values
 
 
 class WasteType(str, enum.Enum):
@@ -34,17 +35,26 @@ class WasteSubmission(Base):
     """Waste submission model for tracking user waste submissions"""
     
     __tablename__ = "waste_submissions"
+    __table_args__ = (
+        Index("ix_ws_user_status_created", "user_id", "status", "created_at"),
+        # Oldest-first sweep of the processing queue
+        Index(
+            "ix_ws_pending_created", "created_at",
+            postgresql_where=text("status = 'PENDING'"),
+            sqlite_where=text("status = 'PENDING'"),
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    waste_type = Column(Enum(WasteType), nullable=False)
+    waste_type = Column(Enum(WasteType, name="wastetype", values_callable=enum_values), nullable=False)
     estimated_weight_kg = Column(Float, nullable=False)
     verified_weight_kg = Column(Float)
     location_lat = Column(Float)
     location_lng = Column(Float)
     description = Column(Text)
-    image_urls = Column(Text)  # JSON array of image URLs
-    status = Column(Enum(SubmissionStatus), default=SubmissionStatus.PENDING)
+    image_urls = Column(JSON().with_variant(JSONB(), "postgresql"))  # List of image URLs
+    status = Column(Enum(SubmissionStatus, name="submissionstatus", values_callable=enum_values), default=SubmissionStatus.PENDING)
     ai_confidence_score = Column(Float)
     ai_detected_type = Column(String(50))
     smart_bin_id = Column(String(50))
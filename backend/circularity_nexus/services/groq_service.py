@@ -2,10 +2,14 @@
 Groq AI service for waste classification and processing
 """
 
-from typing import Dict, Any, Optional, List
-import base64
-import json
+from typing import Dict, Any, Optional, List, Tuple
+import asyncio
+from functools import lru_cache, partial
+import hashlib
+import orjson
+from cachetools import TTLCache
 from loguru import logger
+from redis.asyncio import Redis
 
 try:
     from groq import Groq
@@ -13,22 +17,92 @@ except ImportError:
     logger.warning("Groq library not installed. AI features will be disabled.")
     Groq = None
 
-from circularity_nexus.core.config import settings
+from circularity_nexus.core.config import get_settings
 from circularity_nexus.core.exceptions import AIProcessingError
 
 
+# Redis key prefix for classifications shared between workers
+CLASSIFICATION_CACHE_PREFIX = "circ:groq:classify:"
+
+_CLASSIFICATION_INSTRUCTIONS = """You are an expert waste classification AI for the Circularity Nexus platform. 
+            Your job is to classify waste materials and estimate their recyclability.
+            
+            Supported waste types: PET, ALUMINUM, GLASS, PAPER, CARDBOARD, EWASTE, ORGANIC, MIXED_PLASTIC
+            """
+
+_CLASSIFICATION_FIELDS = """
+            - detected_type: one of the supported waste types
+            - confidence: float between 0.0 and 1.0
+            - estimated_weight_kg: refined weight estimate
+            - recyclability_score: float between 0.0 and 1.0
+            - carbon_impact_kg: estimated CO2 reduction from recycling this waste
+            - recommendations: array of recycling tips
+            """
+
+CLASSIFICATION_SYSTEM_PROMPT = (
+    _CLASSIFICATION_INSTRUCTIONS +
+    """
+            Respond with a JSON object containing:""" +
+    _CLASSIFICATION_FIELDS
+)
+
+BATCH_CLASSIFICATION_SYSTEM_PROMPT = (
+    _CLASSIFICATION_INSTRUCTIONS +
+    """
+            Respond with a JSON array holding one object per numbered item, in
+            the same order, each containing:""" +
+    _CLASSIFICATION_FIELDS
+)
+
+# Groq JSON mode; only for prompts whose answer is a single JSON object
+JSON_OBJECT_FORMAT = {"type": "json_object"}
+
+# kg CO2 saved per kg recycled, used when the carbon answer is unparsable
+CARBON_FACTORS = {
+    "PET": 1.5,
+    "ALUMINUM": 2.1,
+    "GLASS": 0.8,
+    "PAPER": 1.2,
+    "EWASTE": 3.5
+}
+
+DEFAULT_RECYCLING_TIPS = (
+    "Clean the item before recycling",
+    "Check local recycling guidelines",
+    "Sort by material type"
+)
+
+# (description, estimated weight, location) of one classification request
+ClassificationRequest = Tuple[str, float, Optional[Dict[str, float]]]
+
+
 class GroqService:
     """Service for interacting with Groq API for AI processing"""
     
+    # Tips and carbon figures depend only on their arguments
+    RESPONSE_CACHE_SIZE = 4096
+    RESPONSE_CACHE_TTL_SECONDS = 3600
+    # Classifications are shared between workers through Redis
+    CLASSIFICATION_CACHE_TTL_SECONDS = 600
+    
     def __init__(self):
         if not Groq:
             raise AIProcessingError("Groq library not installed")
         
+        settings = get_settings()
         if not settings.GROQ_API_KEY:
             raise AIProcessingError("Groq API key not configured")
         
         self.client = Groq(api_key=settings.GROQ_API_KEY)
         self.model = settings.GROQ_MODEL
+        self.redis = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+        self._tips_cache: TTLCache = TTLCache(
+            maxsize=self.RESPONSE_CACHE_SIZE, ttl=self.RESPONSE_CACHE_TTL_SECONDS
+        )
+        self._carbon_cache: TTLCache = TTLCache(
+            maxsize=self.RESPONSE_CACHE_SIZE, ttl=self.RESPONSE_CACHE_TTL_SECONDS
+        )
+        self.batcher: Optional[BatchedGroqClient] = None
     
     async def classify_waste_from_description(
         self, 
@@ -39,46 +113,21 @@ class GroqService:
         """
         Classify waste type from text description using Groq
         """
+        cache_key = self._classification_key(description, estimated_weight, location)
+        cached = await self._get_cached_classification(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            system_prompt = """You are an expert waste classification AI for the Circularity Nexus platform. 
-            Your job is to classify waste materials and estimate their recyclability.
-            
-            Supported waste types: PET, ALUMINUM, GLASS, PAPER, CARDBOARD, EWASTE, ORGANIC, MIXED_PLASTIC
-            
-            Respond with a JSON object containing:
-            - detected_type: one of the supported waste types
-            - confidence: float between 0.0 and 1.0
-            - estimated_weight_kg: refined weight estimate
-            - recyclability_score: float between 0.0 and 1.0
-            - carbon_impact_kg: estimated CO2 reduction from recycling this waste
-            - recommendations: array of recycling tips
-            """
+            # Concurrent requests share one Groq call while batching runs
+            if self.batcher is not None:
+                result = await self.batcher.classify(description, estimated_weight, location)
+            else:
+                result = await self._request_classification(description, estimated_weight, location)
             
-            user_prompt = f"""
-            Classify this waste submission:
-            Description: {description}
-            Estimated weight: {estimated_weight} kg
-            Location: {location or 'Not provided'}
-            
-            Provide classification and analysis.
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.1,
-                max_tokens=500
-            )
-            
-            result_text = response.choices[0].message.content
-            
-            # Try to parse JSON response
-            try:
-                result = json.loads(result_text)
-            except json.JSONDecodeError:
+            if result is not None:
+                await self._set_cached_classification(cache_key, result)
+            else:
                 # Fallback if JSON parsing fails
                 result = {
                     "detected_type": "MIXED_PLASTIC",
@@ -96,6 +145,96 @@ class GroqService:
             logger.error(f"Error in waste classification: {e}")
             raise AIProcessingError(f"Failed to classify waste: {str(e)}")
     
+    def start_batching(self, max_batch: int = 16, max_wait_ms: float = 25):
+        """Start coalescing concurrent classifications into batched Groq calls"""
+        if self.batcher is None:
+            self.batcher = BatchedGroqClient(self, max_batch=max_batch, max_wait_ms=max_wait_ms)
+            self.batcher.start()
+    
+    async def stop_batching(self):
+        """Stop batching; queued classifications are failed"""
+        if self.batcher is not None:
+            batcher, self.batcher = self.batcher, None
+            await batcher.stop()
+    
+    async def _create_completion(self, **kwargs: Any) -> Any:
+        """Run a blocking Groq chat completion off the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, partial(self.client.chat.completions.create, **kwargs))
+    
+    async def _request_classification(
+        self,
+        description: str,
+        estimated_weight: float,
+        location: Optional[Dict[str, float]]
+    ) -> Optional[Dict[str, Any]]:
+        """Classify one submission; None if the response is not valid JSON"""
+        user_prompt = f"""
+            Classify this waste submission:
+            Description: {description}
+            Estimated weight: {estimated_weight} kg
+            Location: {location or 'Not provided'}
+            
+            Provide classification and analysis.
+            """
+        
+        response = await self._create_completion(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": CLASSIFICATION_SYSTEM_PROMPT},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0.1,
+            max_tokens=500,
+            response_format=JSON_OBJECT_FORMAT
+        )
+        
+        try:
+            return orjson.loads(response.choices[0].message.content)
+        except orjson.JSONDecodeError:
+            return None
+    
+    async def _request_classifications(
+        self,
+        requests: List[ClassificationRequest]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Classify several submissions in one Groq call.
+        
+        If the reply is not a JSON array with one object per submission the
+        submissions are classified one by one instead.
+        """
+        if len(requests) == 1:
+            return [await self._request_classification(*requests[0])]
+        
+        items = "\n".join(
+            f"{number}) Description: {description}; Estimated weight: {weight} kg; "
+            f"Location: {location or 'Not provided'}"
+            for number, (description, weight, location) in enumerate(requests, 1)
+        )
+        response = await self._create_completion(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": BATCH_CLASSIFICATION_SYSTEM_PROMPT},
+                {"role": "user", "content": f"Classify these waste submissions:\n{items}"}
+            ],
+            temperature=0.1,
+            max_tokens=500 * len(requests)
+        )
+        
+        try:
+            results = orjson.loads(response.choices[0].message.content)
+        except orjson.JSONDecodeError:
+            results = None
+        
+        if not isinstance(results, list) or len(results) != len(requests):
+            logger.warning(f"Batched classification of {len(requests)} items unusable, retrying one by one")
+            return list(await asyncio.gather(
+                *(self._request_classification(*request) for request in requests)
+            ))
+        
+        return [result if isinstance(result, dict) else None for result in results]
+    
     async def analyze_waste_image(self, image_url: str) -> Dict[str, Any]:
         """
         Analyze waste from image URL (placeholder - Groq doesn't support vision yet)
@@ -118,6 +257,10 @@ class GroqService:
         """
         Generate recycling tips for specific waste type
         """
+        tips = self._tips_cache.get(waste_type)
+        if tips is not None:
+            return list(tips)
+        
         try:
             prompt = f"""
             Generate 3-5 practical recycling tips for {waste_type} waste.
@@ -126,7 +269,7 @@ class GroqService:
             Return as a JSON array of strings.
             """
             
-            response = self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.3,
@@ -136,18 +279,17 @@ class GroqService:
             result_text = response.choices[0].message.content
             
             try:
-                tips = json.loads(result_text)
-                return tips if isinstance(tips, list) else [result_text]
-            except json.JSONDecodeError:
-                return [result_text]
+                tips = orjson.loads(result_text)
+                tips = tips if isinstance(tips, list) else [result_text]
+            except orjson.JSONDecodeError:
+                tips = [result_text]
+            
+            self._tips_cache[waste_type] = tips
+            return list(tips)
                 
         except Exception as e:
             logger.error(f"Error generating recycling tips: {e}")
-            return [
-                "Clean the item before recycling",
-                "Check local recycling guidelines",
-                "Sort by material type"
-            ]
+            return list(DEFAULT_RECYCLING_TIPS)
     
     async def calculate_carbon_impact(
         self, 
@@ -157,6 +299,11 @@ class GroqService:
         """
         Calculate carbon impact of recycling specific waste
         """
+        cache_key = (waste_type, weight_kg)
+        result = self._carbon_cache.get(cache_key)
+        if result is not None:
+            return dict(result)
+        
         try:
             prompt = f"""
             Calculate the carbon impact of recycling {weight_kg} kg of {waste_type}.
@@ -170,28 +317,23 @@ class GroqService:
             Use realistic environmental data.
             """
             
-            response = self.client.chat.completions.create(
+            response = await self._create_completion(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=0.1,
-                max_tokens=400
+                max_tokens=400,
+                response_format=JSON_OBJECT_FORMAT
             )
             
             result_text = response.choices[0].message.content
             
             try:
-                result = json.loads(result_text)
-                return result
-            except json.JSONDecodeError:
+                result = orjson.loads(result_text)
+                self._carbon_cache[cache_key] = result
+                return dict(result)
+            except orjson.JSONDecodeError:
                 # Fallback calculation
-                carbon_factors = {
-                    "PET": 1.5,
-                    "ALUMINUM": 2.1,
-                    "GLASS": 0.8,
-                    "PAPER": 1.2,
-                    "EWASTE": 3.5
-                }
-                factor = carbon_factors.get(waste_type, 1.0)
+                factor = CARBON_FACTORS.get(waste_type, 1.0)
                 
                 return {
                     "co2_saved_kg": weight_kg * factor,
@@ -203,7 +345,137 @@ class GroqService:
         except Exception as e:
             logger.error(f"Error calculating carbon impact: {e}")
             raise AIProcessingError(f"Failed to calculate carbon impact: {str(e)}")
+    
+    def _classification_key(
+        self,
+        description: str,
+        estimated_weight: float,
+        location: Optional[Dict[str, float]]
+    ) -> str:
+        """Redis key for a classification request; case and spacing of the description don't matter"""
+        request = orjson.dumps(
+            [description.strip().lower(), round(estimated_weight, 2), location],
+            option=orjson.OPT_SORT_KEYS
+        )
+        return CLASSIFICATION_CACHE_PREFIX + hashlib.sha256(request).hexdigest()
+    
+    async def _get_cached_classification(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a classification cached by any worker"""
+        try:
+            raw = await self.redis.get(key)
+        except Exception as e:
+            logger.warning(f"Classification cache lookup failed: {e}")
+            return None
+        return orjson.loads(raw) if raw is not None else None
+    
+    async def _set_cached_classification(self, key: str, result: Dict[str, Any]):
+        """Share a classification with other workers"""
+        try:
+            await self.redis.set(key, orjson.dumps(result), ex=self.CLASSIFICATION_CACHE_TTL_SECONDS)
+        except Exception as e:
+            logger.warning(f"Failed to cache classification: {e}")
+
+
+class BatchedGroqClient:
+    """
+    Coalesces concurrent classification requests into batched Groq calls.
+    
+    Requests are queued; a background task takes up to max_batch of them,
+    waiting at most max_wait_ms after the first for others to arrive, and
+    resolves each caller's future from the one batched reply.
+    """
+    
+    def __init__(self, service: GroqService, max_batch: int = 16, max_wait_ms: float = 25):
+        self.service = service
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        """Start the background batching task on the running event loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop batching and fail any queued requests"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        
+        queued = []
+        while not self._queue.empty():
+            queued.append(self._queue.get_nowait())
+        self._fail_stopped(queued)
+    
+    async def classify(
+        self,
+        description: str,
+        estimated_weight: float,
+        location: Optional[Dict[str, float]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Queue a classification and wait for its batch to complete"""
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((description, estimated_weight, location, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                deadline = loop.time() + self.max_wait
+                while len(batch) < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                
+                await self._dispatch(batch)
+            except asyncio.CancelledError:
+                # Requests already taken off the queue would otherwise hang
+                self._fail_stopped(batch)
+                raise
+    
+    @staticmethod
+    def _fail_stopped(batch: List[Tuple[str, float, Optional[Dict[str, float]], asyncio.Future]]):
+        """Fail the unresolved futures of requests cut off by stop()"""
+        for *_, future in batch:
+            if not future.done():
+                future.set_exception(AIProcessingError("Classification batching stopped"))
+    
+    async def _dispatch(self, batch: List[Tuple[str, float, Optional[Dict[str, float]], asyncio.Future]]):
+        """Send one batch and hand each caller its result"""
+        try:
+            results = await self.service._request_classifications(
+                [(description, weight, location) for description, weight, location, _ in batch]
+            )
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for (*_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+@lru_cache(maxsize=1)
+def get_groq_service() -> Optional[GroqService]:
+    """Return the process-wide service, or None if Groq is not configured"""
+    return GroqService() if Groq and get_settings().GROQ_API_KEY else None
 
 
-# Global service instance
-groq_service = GroqService() if Groq and settings.GROQ_API_KEY else None
+def __getattr__(name: str):
+    # `groq_service` stays importable, but the client is only built on first use
+    if name == "groq_service":
+        return get_groq_service()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -61,6 +61,7 @@ setup(
     entry_points={
         "console_scripts": [
             "circularity-api=circularity_nexus.main:main",
+            "circularity-api-gunicorn=circularity_nexus.main:serve",
         ],
     },
     include_package_data=True,
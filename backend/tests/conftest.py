@@ -86,7 +86,8 @@ async def async_client(override_get_db) -> AsyncGenerator[AsyncClient, None]:
 @pytest.fixture
 def mock_groq_service():
     """Mock Groq service for testing"""
-    with patch('circularity_nexus.services.groq_service.groq_service') as mock:
+    with patch('circularity_nexus.api.v1.endpoints.ai.get_groq_service') as get_service:
+        mock = get_service.return_value
         # Configure mock responses
         mock.classify_waste_from_description.return_value = {
             "detected_type": "PET",
@@ -3,7 +3,7 @@ Integration tests for Groq AI service
 """
 
 import pytest
-from unittest.mock import patch, Mock
+from unittest.mock import patch, Mock, AsyncMock
 from circularity_nexus.services.groq_service import GroqService
 from circularity_nexus.core.exceptions import AIProcessingError
 
@@ -17,13 +17,16 @@ class TestGroqIntegration:
     def groq_service_with_real_client(self):
         """Create GroqService with real client (mocked for testing)"""
         with patch('circularity_nexus.services.groq_service.Groq') as mock_groq:
-            with patch('circularity_nexus.services.groq_service.settings') as mock_settings:
+            with patch('circularity_nexus.services.groq_service.get_settings') as get_settings:
+                mock_settings = get_settings.return_value
                 mock_settings.GROQ_API_KEY = "test-api-key"
                 mock_settings.GROQ_MODEL = "llama3-8b-8192"
+                mock_settings.REDIS_URL = "redis://localhost:6379/0"
                 
                 # Create service instance
                 service = GroqService()
                 service.client = mock_groq.return_value
+                service.redis = Mock(get=AsyncMock(return_value=None), set=AsyncMock())
                 
                 yield service, mock_groq.return_value
     
@@ -316,7 +319,8 @@ class TestGroqIntegration:
     
     async def test_service_initialization_without_api_key(self):
         """Test service behavior without API key"""
-        with patch('circularity_nexus.services.groq_service.settings') as mock_settings:
+        with patch('circularity_nexus.services.groq_service.get_settings') as get_settings:
+            mock_settings = get_settings.return_value
             mock_settings.GROQ_API_KEY = None
             
             with pytest.raises(AIProcessingError) as exc_info:
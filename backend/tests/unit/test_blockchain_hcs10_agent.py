@@ -2,6 +2,8 @@
 Unit tests for HCS-10 OpenConvAI Agent
 """
 
+import asyncio
+import json
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
@@ -27,17 +29,16 @@ class TestHCS10Agent:
     @pytest.fixture
     def mock_hedera_client(self):
         """Mock HederaClient"""
-        with patch('circularity_nexus.blockchain.hcs10_agent.HederaClient') as mock_client:
-            mock_instance = Mock()
-            mock_client.return_value = mock_instance
-            mock_instance.operator_private_key.getPublicKey.return_value = Mock()
-            yield mock_instance
+        mock_instance = Mock()
+        mock_instance.operator_private_key.getPublicKey.return_value = Mock()
+        return mock_instance
     
     @pytest.fixture
     def mock_hcs_service(self):
         """Mock HCSService"""
         with patch('circularity_nexus.blockchain.hcs10_agent.HCSService') as mock_hcs:
             mock_instance = Mock()
+            mock_instance.aclose = AsyncMock()
             mock_hcs.return_value = mock_instance
             yield mock_instance
     
@@ -93,6 +94,84 @@ class TestHCS10Agent:
         assert mock_hcs_service.create_topic.call_count == 3
         mock_hcs_service.submit_message.assert_called_once()  # Profile publishing
     
+    @pytest.mark.asyncio
+    async def test_message_listener_dispatches_batches(self, hcs10_agent, mock_hcs_service):
+        """Test inbound messages are queued and delivered to the handler in batches"""
+        received = []
+        hcs10_agent.message_handler = received.append
+        hcs10_agent.inbound_topic_id = "0.0.inbound"
+        mock_hcs_service.subscribe_to_topic = AsyncMock(return_value={"subscription_status": "active"})
+        
+        await hcs10_agent._setup_message_listeners()
+        
+        handler = mock_hcs_service.subscribe_to_topic.call_args[1]["message_handler"]
+        handler({"contents": '{"op": "message", "data": "a"}', "sequence_number": 1})
+        handler({"contents": "not json", "sequence_number": 2})
+        handler({"contents": '{"op": "message", "data": "b"}', "sequence_number": 3})
+        
+        mock_hcs_service.unsubscribe_from_topic = AsyncMock()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        await hcs10_agent.aclose()
+        
+        assert len(received) == 1
+        assert [message["content"]["data"] for message in received[0]] == ["a", "b"]
+        assert hcs10_agent._listener_task is None
+        mock_hcs_service.unsubscribe_from_topic.assert_awaited_once_with("0.0.inbound")
+    
+    @pytest.mark.asyncio
+    async def test_dispatch_batch_accepts_decoded_contents(self, hcs10_agent):
+        """Test MessagePack messages reach the handler without re-parsing"""
+        received = []
+        hcs10_agent.message_handler = received.append
+        
+        await hcs10_agent._dispatch_batch([
+            {"contents": {"op": "message", "data": "a"}, "sequence_number": 1},
+            {"contents": b'{"op": "message", "data": "b"}', "sequence_number": 2}
+        ])
+        
+        assert [message["content"]["data"] for message in received[0]] == ["a", "b"]
+    
+    @pytest.mark.asyncio
+    async def test_async_context_manager(self, hcs10_agent):
+        """Test the agent initializes on entry and closes on exit"""
+        with patch.object(HCS10Agent, 'initialize', new_callable=AsyncMock) as mock_init, \
+             patch.object(HCS10Agent, 'aclose', new_callable=AsyncMock) as mock_close:
+            async with hcs10_agent as agent:
+                assert agent is hcs10_agent
+                mock_init.assert_awaited_once()
+                mock_close.assert_not_awaited()
+            
+            mock_close.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_async_context_manager_closes_on_failed_initialize(self, hcs10_agent):
+        """Test a failed initialize closes the agent before the error propagates"""
+        with patch.object(HCS10Agent, 'initialize', AsyncMock(side_effect=BlockchainError("boom"))), \
+             patch.object(HCS10Agent, 'aclose', new_callable=AsyncMock) as mock_close:
+            with pytest.raises(BlockchainError, match="boom"):
+                async with hcs10_agent:
+                    pass
+        
+        mock_close.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_aclose_closes_hcs_service(self, agent_profile):
+        """Test closing the agent closes its HCS service, releasing the pooled client once"""
+        with patch('circularity_nexus.blockchain.hcs_service.get_hedera_client_pool') as get_pool:
+            mock_pool = get_pool.return_value
+            agent = HCS10Agent(agent_profile=agent_profile)
+            client = agent.hedera_client
+            mirror_http = agent.hcs_service._mirror_http = AsyncMock()
+            
+            await agent.aclose()
+            await agent.aclose()
+        
+        assert client is mock_pool.acquire.return_value
+        mock_pool.release.assert_called_once_with(client)
+        mirror_http.aclose.assert_awaited_once()
+        assert agent.hedera_client is None
+    
     @pytest.mark.asyncio
     async def test_register_in_registry_success(self, hcs10_agent, mock_hcs_service):
         """Test successful registry registration"""
@@ -123,6 +202,71 @@ class TestHCS10Agent:
         assert message_content["op"] == "register"
         assert message_content["account_id"] == "0.0.123456"
     
+    @pytest.mark.asyncio
+    async def test_register_many_in_registry_batches(self, hcs10_agent, mock_hcs_service):
+        """Test registrations are packed into as few messages as fit"""
+        hcs10_agent.account_id = "0.0.123456"
+        mock_hcs_service.submit_message = AsyncMock(return_value={"status": "success"})
+        
+        registrations = [{"m": f"capability update {i}"} for i in range(20)]
+        results = await hcs10_agent.register_many_in_registry(registrations, "0.0.registry")
+        
+        calls = mock_hcs_service.submit_message.call_args_list
+        assert len(results) == len(calls)
+        assert 1 < len(calls) < len(registrations)
+        
+        import json
+        submitted = []
+        for call in calls:
+            payload = call[1]["message"]
+            assert len(payload) <= hcs10_agent.REGISTRY_BATCH_BYTES
+            assert call[1]["memo"] == "hcs-10:op:0:0"
+            submitted.extend(json.loads(payload))
+        assert [entry["m"] for entry in submitted] == [r["m"] for r in registrations]
+        assert all(entry["op"] == "register" for entry in submitted)
+    
+    @pytest.mark.asyncio
+    async def test_discover_agents_batched_registrations(self, hcs10_agent, mock_hcs_service):
+        """Test discovery unpacks batched registry messages"""
+        hcs10_agent.account_id = "0.0.123456"
+        
+        mock_hcs_service.get_topic_messages = AsyncMock(return_value=[
+            {
+                "contents": '[{"p": "hcs-10", "op": "register", "account_id": "0.0.789012"},'
+                            ' {"p": "hcs-10", "op": "register", "account_id": "0.0.345678"}]',
+                "consensus_timestamp": "1234567890.123456789",
+                "sequence_number": 1
+            }
+        ])
+        
+        agents = await hcs10_agent.discover_agents("0.0.registry", limit=10)
+        
+        assert [agent["account_id"] for agent in agents] == ["0.0.789012", "0.0.345678"]
+        assert mock_hcs_service.get_topic_messages.call_args[1]["limit"] == 10
+    
+    @pytest.mark.asyncio
+    async def test_discover_agents_decoded_msgpack_contents(self, hcs10_agent, mock_hcs_service):
+        """Test discovery accepts registrations already decoded from MessagePack"""
+        hcs10_agent.account_id = "0.0.123456"
+        
+        mock_hcs_service.get_topic_messages = AsyncMock(return_value=[
+            {
+                "contents": {"p": "hcs-10", "op": "register", "account_id": "0.0.789012", "m": "Agent A"},
+                "consensus_timestamp": "1234567890.123456789",
+                "sequence_number": 1
+            },
+            {
+                "contents": [{"p": "hcs-10", "op": "delete", "account_id": "0.0.345678"}],
+                "consensus_timestamp": "1234567891.123456789",
+                "sequence_number": 2
+            }
+        ])
+        
+        agents = await hcs10_agent.discover_agents("0.0.registry")
+        
+        assert [agent["account_id"] for agent in agents] == ["0.0.789012"]
+        assert agents[0]["message"] == "Agent A"
+    
     @pytest.mark.asyncio
     async def test_discover_agents_success(self, hcs10_agent, mock_hcs_service):
         """Test successful agent discovery"""
@@ -164,7 +308,7 @@ class TestHCS10Agent:
         hcs10_agent.inbound_topic_id = "0.0.inbound"
         
         # Mock finding target agent's inbound topic
-        with patch.object(hcs10_agent, '_find_agent_inbound_topic') as mock_find:
+        with patch.object(HCS10Agent, '_find_agent_inbound_topic') as mock_find:
             mock_find.return_value = "0.0.target_inbound"
             
             # Mock message submission
@@ -191,6 +335,42 @@ class TestHCS10Agent:
             assert message_content["op"] == "connection_request"
             assert message_content["operator_id"] == "0.0.inbound@0.0.123456"
     
+    @pytest.mark.asyncio
+    async def test_find_agent_inbound_topic_uses_discovery_cache(
+        self, hcs10_agent, agent_profile, mock_hedera_client, mock_hcs_service
+    ):
+        """Test inbound topics from register_in_registry are reused after discovery"""
+        hcs10_agent.account_id = "0.0.123456"
+        other_agent = HCS10Agent(agent_profile=agent_profile, hedera_client=mock_hedera_client)
+        other_agent.account_id = "0.0.789012"
+        other_agent.inbound_topic_id = "0.0.555"
+        
+        mock_hcs_service.submit_message = AsyncMock(return_value={"status": "success"})
+        await other_agent.register_in_registry("0.0.registry")
+        
+        mock_hcs_service.get_topic_messages = AsyncMock(return_value=[
+            {
+                "contents": mock_hcs_service.submit_message.call_args.kwargs["message"],
+                "consensus_timestamp": "1234567890.123456789",
+                "sequence_number": 1
+            }
+        ])
+        
+        await hcs10_agent.discover_agents("0.0.registry")
+        
+        assert await hcs10_agent._find_agent_inbound_topic("0.0.789012") == "0.0.555"
+    
+    @pytest.mark.asyncio
+    async def test_find_agent_inbound_topic_expires(self, hcs10_agent):
+        """Test cached inbound topics expire after the agent TTL"""
+        hcs10_agent._inbound_topic_cache["0.0.789012"] = ("0.0.stale", 0.0)
+        
+        with patch('circularity_nexus.blockchain.hcs10_agent.time.monotonic', return_value=hcs10_agent.ttl * 60 + 1):
+            topic_id = await hcs10_agent._find_agent_inbound_topic("0.0.789012")
+        
+        assert topic_id != "0.0.stale"
+        assert hcs10_agent._inbound_topic_cache["0.0.789012"][0] == topic_id
+    
     @pytest.mark.asyncio
     async def test_create_connection_success(self, hcs10_agent, mock_hcs_service):
         """Test successful connection creation"""
@@ -208,7 +388,7 @@ class TestHCS10Agent:
         }
         
         # Mock threshold key creation
-        with patch.object(hcs10_agent, '_create_threshold_key') as mock_threshold:
+        with patch.object(HCS10Agent, '_create_threshold_key') as mock_threshold:
             mock_threshold.return_value = Mock()
             
             # Test connection creation
@@ -277,6 +457,36 @@ class TestHCS10Agent:
         # Verify connection activity updated
         assert connection.last_activity is not None
     
+    @pytest.mark.asyncio
+    async def test_send_message_reuses_connection_sender(self, hcs10_agent, mock_hcs_service):
+        """Test the per-connection sender is built once and encodes each message"""
+        hcs10_agent.account_id = "0.0.123456"
+        hcs10_agent.inbound_topic_id = "0.0.inbound"
+        hcs10_agent._add_connection(Connection(
+            connection_id=12345,
+            remote_agent_id="0.0.789012",
+            topic_id="0.0.connection",
+            status="active",
+            created_at=datetime.utcnow()
+        ))
+        mock_hcs_service.submit_message = AsyncMock(return_value={"status": "success"})
+        
+        with patch.object(HCS10Agent, '_make_sender', autospec=True, side_effect=HCS10Agent._make_sender) as mock_make:
+            await hcs10_agent.send_message("0.0.789012", 'first "quoted"', "greeting")
+            await hcs10_agent.send_message("0.0.789012", "second")
+        
+        assert mock_make.call_count == 1
+        first, second = [json.loads(call[1]["message"]) for call in mock_hcs_service.submit_message.call_args_list]
+        assert first == {
+            "p": "hcs-10",
+            "op": "message",
+            "operator_id": "0.0.inbound@0.0.123456",
+            "data": 'first "quoted"',
+            "m": "greeting communication."
+        }
+        assert second["data"] == "second"
+        assert second["m"] == "standard communication."
+    
     @pytest.mark.asyncio
     async def test_send_transaction_request_success(self, hcs10_agent, mock_hcs_service):
         """Test successful transaction request"""
@@ -325,6 +535,29 @@ class TestHCS10Agent:
         assert message_content["p"] == "hcs-10"
         assert message_content["op"] == "transaction"
         assert message_content["schedule_id"] == "0.0.schedule123"
+        assert message_content["data"] == transaction_data
+    
+    @pytest.mark.asyncio
+    async def test_send_transaction_request_legacy_string_data(self, hcs10_agent, mock_hcs_service):
+        """Test transaction data can still be sent as an encoded string"""
+        hcs10_agent.connections["0.0.789012"] = Connection(
+            connection_id=12345,
+            remote_agent_id="0.0.789012",
+            topic_id="0.0.connection",
+            status="active",
+            created_at=datetime.utcnow()
+        )
+        mock_hcs_service.submit_message = AsyncMock(return_value={"status": "success"})
+        transaction_data = {"type": "token_transfer", "amount": 100}
+        
+        await hcs10_agent.send_transaction_request(
+            target_agent_id="0.0.789012",
+            transaction_data=transaction_data,
+            legacy_string_data=True
+        )
+        
+        message_content = json.loads(mock_hcs_service.submit_message.call_args[1]["message"])
+        assert message_content["schedule_id"] == "pending"
         assert json.loads(message_content["data"]) == transaction_data
     
     @pytest.mark.asyncio
@@ -349,21 +582,21 @@ class TestHCS10Agent:
         hcs10_agent.profile_topic_id = "0.0.profile"
         
         # Add some connections
-        hcs10_agent.connections["0.0.789012"] = Connection(
+        hcs10_agent._add_connection(Connection(
             connection_id=1,
             remote_agent_id="0.0.789012",
             topic_id="0.0.conn1",
             status="active",
             created_at=datetime.utcnow(),
             last_activity=datetime.utcnow()
-        )
-        hcs10_agent.connections["0.0.345678"] = Connection(
+        ))
+        hcs10_agent._add_connection(Connection(
             connection_id=2,
             remote_agent_id="0.0.345678",
             topic_id="0.0.conn2",
             status="inactive",
             created_at=datetime.utcnow()
-        )
+        ))
         
         # Test status retrieval
         status = await hcs10_agent.get_agent_status()
@@ -371,6 +604,7 @@ class TestHCS10Agent:
         # Assertions
         assert status["agent_id"] == "0.0.123456"
         assert status["status"] == AgentStatus.ACTIVE.value
+        assert json.loads(json.dumps(status["status"])) == "active"
         assert status["profile"]["name"] == agent_profile.name
         assert status["profile"]["capabilities"] == agent_profile.capabilities
         assert status["topics"]["inbound"] == "0.0.inbound"
@@ -380,6 +614,79 @@ class TestHCS10Agent:
         assert status["connections"]["total"] == 2
         assert "last_activity" in status
     
+    @pytest.mark.asyncio
+    async def test_close_connection_updates_status(self, hcs10_agent):
+        """Test closing a connection updates the active count"""
+        hcs10_agent._add_connection(Connection(
+            connection_id=1,
+            remote_agent_id="0.0.789012",
+            topic_id="0.0.conn1",
+            status="active",
+            created_at=datetime.utcnow()
+        ))
+        
+        assert hcs10_agent.get_connection_by_topic("0.0.conn1").remote_agent_id == "0.0.789012"
+        
+        result = await hcs10_agent.close_connection("0.0.789012")
+        status = await hcs10_agent.get_agent_status()
+        
+        assert result["status"] == "closed"
+        assert "0.0.789012" not in hcs10_agent.connections
+        assert status["connections"]["active"] == 0
+        assert status["connections"]["total"] == 0
+        assert hcs10_agent.get_connection_by_topic("0.0.conn1") is None
+        
+        with pytest.raises(BlockchainError):
+            await hcs10_agent.close_connection("0.0.789012")
+    
+    def test_generate_random_connection_id_skips_used(self, agent_profile, mock_hedera_client, mock_hcs_service):
+        """Test random connection IDs never reuse an issued ID"""
+        agent = HCS10Agent(agent_profile=agent_profile, random_connection_ids=True)
+        
+        with patch('circularity_nexus.blockchain.hcs10_agent.secrets.randbits', side_effect=[7, 7, 7, 42]):
+            assert agent._generate_connection_id() == 7
+            assert agent._generate_connection_id() == 42
+    
+    @patch.object(HCS10Agent, 'MAX_CONNECTIONS', 1)
+    def test_random_connection_ids_released_with_connections(self, agent_profile, mock_hedera_client, mock_hcs_service):
+        """Test issued IDs are forgotten when their connection is evicted or closed"""
+        agent = HCS10Agent(agent_profile=agent_profile, random_connection_ids=True)
+        
+        with patch('circularity_nexus.blockchain.hcs10_agent.secrets.randbits', side_effect=[7, 42]):
+            for i in range(2):
+                agent._add_connection(Connection(
+                    connection_id=agent._generate_connection_id(),
+                    remote_agent_id=f"0.0.100{i}",
+                    topic_id=f"0.0.conn{i}",
+                    status="active",
+                    created_at=datetime.utcnow()
+                ))
+        
+        # The first connection was evicted by the cap
+        assert agent._used_connection_ids == {42}
+        
+        agent._release_connection(agent.connections.pop("0.0.1001"))
+        assert agent._used_connection_ids == set()
+    
+    @patch.object(HCS10Agent, 'MAX_CONNECTIONS', 2)
+    def test_connections_evict_least_recently_used(self, hcs10_agent):
+        """Test the connection table is capped with LRU eviction"""
+        for i in range(3):
+            if i == 2:
+                # Touch the first connection so the second becomes the oldest
+                hcs10_agent._update_activity(hcs10_agent.connections["0.0.1000"])
+            hcs10_agent._add_connection(Connection(
+                connection_id=i,
+                remote_agent_id=f"0.0.100{i}",
+                topic_id=f"0.0.conn{i}",
+                status="active",
+                created_at=datetime.utcnow()
+            ))
+        
+        assert list(hcs10_agent.connections) == ["0.0.1000", "0.0.1002"]
+        assert hcs10_agent.get_connection_by_topic("0.0.conn1") is None
+        assert hcs10_agent._active_connections == 2
+    
     def test_generate_connection_id(self, hcs10_agent):
         """Test connection ID generation"""
         conn_id = hcs10_agent._generate_connection_id()
@@ -387,6 +694,13 @@ class TestHCS10Agent:
         assert isinstance(conn_id, int)
         assert 10000 <= conn_id <= 99999
     
+    def test_generate_connection_id_unique(self, hcs10_agent):
+        """Test connection IDs never repeat within an agent"""
+        conn_ids = [hcs10_agent._generate_connection_id() for _ in range(1000)]
+        
+        assert len(set(conn_ids)) == len(conn_ids)
+        assert conn_ids == sorted(conn_ids)
+    
     @pytest.mark.asyncio
     async def test_initialization_error_handling(self, hcs10_agent, mock_hedera_client):
         """Test error handling during initialization"""
@@ -435,6 +749,42 @@ class TestHCS10Agent:
         assert len(agents) == 1
         assert agents[0]["account_id"] == "0.0.789012"
     
+    @pytest.mark.asyncio
+    async def test_discover_agents_skips_non_register_messages(self, hcs10_agent, mock_hcs_service):
+        """Test agent discovery ignores non-registration traffic"""
+        hcs10_agent.account_id = "0.0.123456"
+        
+        mock_hcs_service.get_topic_messages = AsyncMock(return_value=[
+            {
+                "contents": '{"p": "hcs-10", "op": "delete", "uid": "abc"}',
+                "consensus_timestamp": "1234567890.123456789",
+                "sequence_number": 1
+            },
+            {
+                "contents": '{"p": "hcs-11", "op": "register", "account_id": "0.0.111111"}',
+                "consensus_timestamp": "1234567891.123456789",
+                "sequence_number": 2
+            },
+            {
+                "contents": b'{"p":"hcs-10","op":"register","account_id":"0.0.789012"}',
+                "consensus_timestamp": "1234567892.123456789",
+                "sequence_number": 3
+            }
+        ])
+        
+        agents = await hcs10_agent.discover_agents("0.0.registry")
+        
+        assert len(agents) == 1
+        assert agents[0]["account_id"] == "0.0.789012"
+        assert agents[0]["message"] == ""
+    
+    def test_agent_uses_slots(self, hcs10_agent):
+        """Test agent instances have no per-instance __dict__"""
+        assert not hasattr(hcs10_agent, "__dict__")
+        
+        with pytest.raises(AttributeError):
+            hcs10_agent.undeclared_attribute = True
+    
     def test_agent_profile_dataclass(self):
         """Test AgentProfile dataclass"""
         profile = AgentProfile(
@@ -2,10 +2,24 @@
 Unit tests for Hedera Consensus Service (HCS) Integration
 """
 
+import asyncio
+import base64
+import httpx
+import random
+import orjson
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
 from datetime import datetime
-from circularity_nexus.blockchain.hcs_service import HCSService
+from circularity_nexus.blockchain.hcs_service import (
+    HCSService,
+    MSGPACK_MAGIC,
+    ZSTD_MAGIC,
+    encode_payload,
+    decode_contents,
+    json_default,
+    RunningHash,
+    _topic_id
+)
 from circularity_nexus.core.exceptions import BlockchainError, ValidationError
 
 
@@ -15,9 +29,10 @@ class TestHCSService:
     @pytest.fixture
     def mock_hedera_client(self):
         """Mock HederaClient"""
-        with patch('circularity_nexus.blockchain.hcs_service.HederaClient') as mock_client:
+        with patch('circularity_nexus.blockchain.hcs_service.get_hedera_client_pool') as get_pool:
+            mock_pool = get_pool.return_value
             mock_instance = Mock()
-            mock_client.return_value = mock_instance
+            mock_pool.acquire.return_value = mock_instance
             
             # Mock client properties
             mock_instance.client = Mock()
@@ -446,3 +461,583 @@ class TestHCSService:
         
         # Should return original string if decoding fails
         assert decoded == invalid_base64
+
+
+class TestHCSServiceSubmission:
+    """Test cases for HCSService message submission"""
+    
+    @pytest.fixture
+    def mock_hedera_client(self):
+        """Mock HederaClient with an operator key"""
+        client = Mock()
+        client.client = Mock()
+        client.operator_private_key = Mock()
+        return client
+    
+    @pytest.fixture
+    def mock_submit_transaction(self):
+        """Mock TopicMessageSubmitTransaction whose execution resolves asynchronously"""
+        _topic_id.cache_clear()
+        with patch('circularity_nexus.blockchain.hcs_service.TopicId') as mock_topic_id, \
+             patch('circularity_nexus.blockchain.hcs_service.TopicMessageSubmitTransaction') as mock_cls:
+            transaction = Mock()
+            transaction.setTopicId.return_value = transaction
+            transaction.setMessage.return_value = transaction
+            transaction.freezeWith.return_value = transaction
+            transaction.sign.return_value = transaction
+            
+            receipt = Mock()
+            receipt.topicSequenceNumber = 42
+            receipt.topicRunningHash = b"\x01\x02"
+            receipt.consensusTimestamp = None
+            response = Mock()
+            response.transactionId = "0.0.123456@1234567890.123456789"
+            response.getReceipt = AsyncMock(return_value=receipt)
+            transaction.execute = AsyncMock(return_value=response)
+            
+            mock_cls.return_value = transaction
+            transaction.topic_id_cls = mock_topic_id
+            yield transaction
+    
+    @pytest.fixture
+    def hcs_service(self, mock_hedera_client):
+        """HCSService bound to the mock client"""
+        return HCSService(mock_hedera_client)
+    
+    @pytest.fixture
+    def no_batch_support(self):
+        """Simulate an SDK without HIP-551 batch transactions"""
+        with patch('circularity_nexus.blockchain.hcs_service.BatchTransaction', None):
+            yield
+    
+    @pytest.fixture
+    def mock_batch_transaction(self, mock_submit_transaction):
+        """Mock BatchTransaction executing through the submit transaction's response"""
+        with patch('circularity_nexus.blockchain.hcs_service.BatchTransaction') as mock_cls:
+            batch = mock_cls.return_value
+            batch.freezeWith.return_value = batch
+            batch.sign.return_value = batch
+            batch.execute = mock_submit_transaction.execute
+            batch.getInnerTransactionIds.side_effect = lambda: [
+                f"0.0.123456@1234567890.{i}" for i in range(batch.addInnerTransaction.call_count)
+            ]
+            yield batch
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_dict_payload(self, hcs_service, mock_submit_transaction):
+        """Test dict payloads are serialized to compact JSON bytes"""
+        result = await hcs_service.submit_message(
+            topic_id="0.0.100001",
+            message={"type": "waste", 1: "non-str key"}
+        )
+        
+        payload = mock_submit_transaction.setMessage.call_args[0][0]
+        assert payload == b'{"type":"waste","1":"non-str key"}'
+        assert result["message_size"] == len(payload)
+        assert result["sequence_number"] == 42
+        assert result["status"] == "success"
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_running_hash_is_lazy(self, hcs_service, mock_submit_transaction):
+        """Test the running hash stays bytes and is only formatted as hex on output"""
+        from fastapi.encoders import jsonable_encoder
+        
+        result = await hcs_service.submit_message(topic_id="0.0.100001", message="ping")
+        running_hash = result["running_hash"]
+        
+        assert isinstance(running_hash, RunningHash)
+        assert running_hash == b"\x01\x02"
+        assert hash(running_hash) == hash(b"\x01\x02")
+        assert running_hash != "0102"
+        assert str(running_hash) == "0102"
+        assert orjson.dumps(result, default=json_default).count(b'"running_hash":"0102"') == 1
+        assert jsonable_encoder(result)["running_hash"] == "0102"
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_raw_result(self, hcs_service, mock_submit_transaction):
+        """Test stringify=False returns SDK values without converting them"""
+        response = mock_submit_transaction.execute.return_value
+        receipt = response.getReceipt.return_value
+        
+        result = await hcs_service.submit_message(
+            topic_id="0.0.100001",
+            message="ping",
+            stringify=False
+        )
+        
+        assert result["transaction_id"] is response.transactionId
+        assert result["running_hash"] is receipt.topicRunningHash
+        assert result["sequence_number"] == 42
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_without_waiting_for_receipt(self, hcs_service, mock_submit_transaction, mock_hedera_client):
+        """Test fire-and-forget submissions return before consensus"""
+        response = mock_submit_transaction.execute.return_value
+        
+        result = await hcs_service.submit_message(
+            topic_id="0.0.100001",
+            message="telemetry",
+            wait_for_receipt=False
+        )
+        
+        assert result["status"] == "pending"
+        assert result["sequence_number"] is None
+        assert result["transaction_id"] == str(response.transactionId)
+        response.getReceipt.assert_not_awaited()
+        mock_hedera_client.confirm_in_background.assert_called_once_with(
+            response, "Message to topic 0.0.100001"
+        )
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_bytes_like_passthrough(self, hcs_service, mock_submit_transaction):
+        """Test bytes-like payloads reach the transaction without being copied"""
+        payload = bytearray(b"sensor-frame")
+        await hcs_service.submit_message(topic_id="0.0.100001", message=payload)
+        assert mock_submit_transaction.setMessage.call_args[0][0] is payload
+        
+        view = memoryview(b"\x00\x01\x02\x03").cast("H")
+        result = await hcs_service.submit_message(topic_id="0.0.100001", message=view)
+        sent = mock_submit_transaction.setMessage.call_args[0][0]
+        assert sent.obj is view.obj
+        assert result["message_size"] == 4
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_msgpack_codec(self, hcs_service, mock_submit_transaction):
+        """Test msgpack payloads are framed with the magic byte and round-trip"""
+        pytest.importorskip("msgpack")
+        message = {"type": "waste", "weight_kg": 12.5, "tags": ["pet", "hdpe"]}
+        
+        result = await hcs_service.submit_message(
+            topic_id="0.0.100001",
+            message=message,
+            codec="msgpack"
+        )
+        
+        payload = mock_submit_transaction.setMessage.call_args[0][0]
+        assert payload[:1] == MSGPACK_MAGIC
+        assert len(payload) < len(encode_payload(message, "json"))
+        assert decode_contents(payload) == message
+        assert result["message_size"] == len(payload)
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_compressed(self, hcs_service, mock_submit_transaction):
+        """Test large payloads are zstd-compressed and decode back transparently"""
+        pytest.importorskip("zstandard")
+        message = {"readings": [{"bin": i, "fill_level": 0.5} for i in range(100)]}
+        
+        result = await hcs_service.submit_message(
+            topic_id="0.0.100001",
+            message=message,
+            compress=True
+        )
+        
+        payload = mock_submit_transaction.setMessage.call_args[0][0]
+        assert payload[:4] == ZSTD_MAGIC
+        assert "total_chunks" not in result
+        assert result["compression_ratio"] > 1
+        assert decode_contents(payload) == encode_payload(message).decode('utf-8')
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_small_payload_not_compressed(self, hcs_service, mock_submit_transaction):
+        """Test payloads under the threshold are sent as-is"""
+        result = await hcs_service.submit_message(
+            topic_id="0.0.100001",
+            message="short",
+            compress=True
+        )
+        
+        assert mock_submit_transaction.setMessage.call_args[0][0] == b"short"
+        assert result["compression_ratio"] == 1.0
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_not_compressed_when_chunked(self, hcs_service, mock_submit_transaction, no_batch_support):
+        """Test payloads that still need chunking after compression are sent as-is"""
+        pytest.importorskip("zstandard")
+        # Compresses, but not into a single 300 byte message
+        rng = random.Random(0)
+        message = bytes(rng.getrandbits(8) for _ in range(600)) + bytes(600)
+        
+        result = await hcs_service.submit_message(
+            topic_id="0.0.100001",
+            message=message,
+            chunk_size=300,
+            compress=True
+        )
+        
+        payloads = [bytes(c[0][0]) for c in mock_submit_transaction.setMessage.call_args_list]
+        assert result["total_chunks"] == 4
+        assert result["compression_ratio"] == 1.0
+        assert all(payload[:4] != ZSTD_MAGIC for payload in payloads)
+        assert b"".join(payloads) == message
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_unknown_codec(self, hcs_service, mock_submit_transaction):
+        """Test unsupported codecs are rejected"""
+        with pytest.raises(BlockchainError, match="Unsupported payload codec"):
+            await hcs_service.submit_message(
+                topic_id="0.0.100001",
+                message={"type": "waste"},
+                codec="protobuf"
+            )
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_registered_schema(self, hcs_service, mock_submit_transaction):
+        """Test messages tagged with a registered schema use its generated encoder"""
+        hcs_service.register_schema("waste_event", [
+            ("bin_id", str),
+            ("weight_g", int),
+            ("fill_level", float),
+            ("contaminated", bool),
+            ("tags", list)
+        ])
+        message = {
+            "_schema": "waste_event",
+            "bin_id": "bin-\"7\"",
+            "weight_g": 1250,
+            "fill_level": 0.5,
+            "contaminated": False,
+            "tags": ["pet"]
+        }
+        
+        await hcs_service.submit_message(topic_id="0.0.100001", message=message)
+        
+        payload = mock_submit_transaction.setMessage.call_args[0][0]
+        assert payload == encode_payload(message)
+        assert orjson.loads(payload) == message
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_registered_schema_missing_field(self, hcs_service, mock_submit_transaction):
+        """Test schema-tagged messages missing a declared field are rejected"""
+        hcs_service.register_schema("sensor_ping", [("sensor_id", str), ("battery", int)])
+        
+        with pytest.raises(BlockchainError, match="Message submission failed"):
+            await hcs_service.submit_message(
+                topic_id="0.0.100001",
+                message={"_schema": "sensor_ping", "sensor_id": "s-1"}
+            )
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_registered_schema_wrong_type(self, hcs_service, mock_submit_transaction):
+        """Test schema-tagged values of the wrong type are rejected, not coerced"""
+        hcs_service.register_schema("reading", [("n", int), ("f", float), ("b", bool)])
+        
+        for message in (
+            {"_schema": "reading", "n": 3.7, "f": 1.0, "b": False},
+            {"_schema": "reading", "n": True, "f": 1.0, "b": False},
+            {"_schema": "reading", "n": 3, "f": "1.0", "b": False},
+            {"_schema": "reading", "n": 3, "f": 1.0, "b": "no"},
+        ):
+            with pytest.raises(BlockchainError, match="expects"):
+                await hcs_service.submit_message(topic_id="0.0.100001", message=message)
+        
+        mock_submit_transaction.setMessage.assert_not_called()
+        
+        await hcs_service.submit_message(
+            topic_id="0.0.100001",
+            message={"_schema": "reading", "n": 3, "f": 1, "b": False}
+        )
+        assert mock_submit_transaction.setMessage.call_args[0][0] == b'{"_schema":"reading","n":3,"f":1,"b":false}'
+    
+    def test_decode_contents_text(self):
+        """Test non-framed contents decode as UTF-8 text"""
+        assert decode_contents('{"a":1}'.encode('utf-8')) == '{"a":1}'
+    
+    @pytest.mark.asyncio
+    async def test_submit_chunked_message_pipelines_chunks(self, hcs_service, mock_submit_transaction, no_batch_support):
+        """Test large messages submit their chunks concurrently and in order"""
+        in_flight = 0
+        max_in_flight = 0
+        response = mock_submit_transaction.execute.return_value
+        
+        async def execute(client):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return response
+        
+        mock_submit_transaction.execute = AsyncMock(side_effect=execute)
+        
+        result = await hcs_service.submit_message(
+            topic_id="0.0.100001",
+            message=b"x" * 40,
+            memo="batch",
+            chunk_size=10
+        )
+        
+        assert result["total_chunks"] == 4
+        assert [c["chunk_number"] for c in result["chunks"]] == [1, 2, 3, 4]
+        assert result["initial_transaction_id"] == str(response.transactionId)
+        assert mock_submit_transaction.execute.await_count == 4
+        assert max_in_flight == 4
+        mock_submit_transaction.setTransactionMemo.assert_any_call("batch:chunk:4/4")
+    
+    @pytest.mark.asyncio
+    async def test_submit_chunked_message_bounds_in_flight(self, hcs_service, mock_submit_transaction, no_batch_support):
+        """Test chunk submissions never exceed CHUNK_CONCURRENCY in flight"""
+        in_flight = 0
+        max_in_flight = 0
+        response = mock_submit_transaction.execute.return_value
+        receipt = response.getReceipt.return_value
+        
+        async def execute(client):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            return response
+        
+        async def get_receipt(client):
+            nonlocal in_flight
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return receipt
+        
+        mock_submit_transaction.execute = AsyncMock(side_effect=execute)
+        response.getReceipt = AsyncMock(side_effect=get_receipt)
+        hcs_service.CHUNK_CONCURRENCY = 2
+        
+        result = await hcs_service.submit_message(
+            topic_id="0.0.100001",
+            message=b"x" * 50,
+            chunk_size=10
+        )
+        
+        assert result["total_chunks"] == 5
+        assert max_in_flight == 2
+        assert response.getReceipt.await_count == 5
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_record_list_chunked(self, hcs_service, mock_submit_transaction, no_batch_support):
+        """Test list-of-records payloads are encoded once and chunked without copies"""
+        records = [{"bin": i, "fill": 0.5} for i in range(10)]
+        
+        result = await hcs_service.submit_message(topic_id="0.0.100001", message=records, chunk_size=64)
+        
+        chunks = [c[0][0] for c in mock_submit_transaction.setMessage.call_args_list]
+        assert b"".join(bytes(chunk) for chunk in chunks) == orjson.dumps(records)
+        assert len({id(chunk.obj) for chunk in chunks}) == 1
+        assert result["total_chunks"] == len(chunks)
+    
+    @pytest.mark.asyncio
+    async def test_submit_chunked_message_uses_batch(self, hcs_service, mock_submit_transaction, mock_batch_transaction):
+        """Test chunks go out as one atomic batch when the SDK supports it"""
+        result = await hcs_service.submit_message(
+            topic_id="0.0.100001",
+            message=b"x" * 30,
+            memo="batch",
+            chunk_size=10
+        )
+        
+        assert mock_batch_transaction.addInnerTransaction.call_count == 3
+        assert mock_submit_transaction.batchify.call_count == 3
+        assert mock_submit_transaction.execute.await_count == 1
+        assert result["total_chunks"] == 3
+        assert result["initial_transaction_id"] == "0.0.123456@1234567890.0"
+        assert [c["chunk_number"] for c in result["chunks"]] == [1, 2, 3]
+    
+    @pytest.mark.asyncio
+    async def test_submit_chunked_message_slices_without_copying(self, hcs_service, mock_submit_transaction, no_batch_support):
+        """Test chunks are zero-copy views over the original payload"""
+        payload = b"0123456789abcdefghij"
+        
+        await hcs_service.submit_message(topic_id="0.0.100001", message=payload, chunk_size=8)
+        
+        chunks = [c[0][0] for c in mock_submit_transaction.setMessage.call_args_list]
+        assert all(isinstance(chunk, memoryview) and chunk.obj is payload for chunk in chunks)
+        assert [bytes(chunk) for chunk in chunks] == [b"01234567", b"89abcdef", b"ghij"]
+    
+    @pytest.mark.asyncio
+    async def test_submit_small_json(self, hcs_service, mock_submit_transaction):
+        """Test the small JSON fast path submits one compact message"""
+        result = await hcs_service.submit_small_json("0.0.100001", {"bin": 7, "fill": 0.8})
+        
+        mock_submit_transaction.setMessage.assert_called_once_with(b'{"bin":7,"fill":0.8}')
+        mock_submit_transaction.setTransactionMemo.assert_not_called()
+        assert result["sequence_number"] == 42
+        assert result["message_size"] == 20
+        # Same result shape as submit_message
+        assert result.keys() == (
+            await hcs_service.submit_message("0.0.100001", {"bin": 7, "fill": 0.8})
+        ).keys()
+    
+    @pytest.mark.asyncio
+    async def test_submit_small_json_oversized_falls_back(self, hcs_service, mock_submit_transaction):
+        """Test payloads above the fast-path limit are chunked by submit_message"""
+        hcs_service.SMALL_MESSAGE_BYTES = 16
+        
+        with patch.object(hcs_service, 'submit_message', AsyncMock(return_value={"total_chunks": 2})) as mock_submit:
+            result = await hcs_service.submit_small_json("0.0.100001", {"bin": 7, "fill": 0.8})
+        
+        mock_submit.assert_awaited_once_with("0.0.100001", b'{"bin":7,"fill":0.8}', chunk_size=16)
+        assert result == {"total_chunks": 2}
+    
+    @pytest.mark.asyncio
+    async def test_submit_messages_batch(self, hcs_service, mock_submit_transaction, mock_batch_transaction):
+        """Test several messages are submitted in a single batch transaction"""
+        result = await hcs_service.submit_messages_batch(
+            topic_id="0.0.100001",
+            messages=[{"type": "waste"}, "plain", b"raw"]
+        )
+        
+        payloads = [c[0][0] for c in mock_submit_transaction.setMessage.call_args_list]
+        assert payloads == [b'{"type":"waste"}', b"plain", b"raw"]
+        assert result["message_count"] == 3
+        assert len(result["inner_transaction_ids"]) == 3
+        assert result["status"] == "success"
+    
+    @pytest.mark.asyncio
+    async def test_submit_messages_batch_unsupported(self, hcs_service, no_batch_support):
+        """Test batch submission fails clearly on SDKs without batch support"""
+        with pytest.raises(BlockchainError, match="does not support batch"):
+            await hcs_service.submit_messages_batch("0.0.100001", ["a"])
+    
+    @pytest.mark.asyncio
+    async def test_submit_message_reuses_parsed_topic_id(self, hcs_service, mock_submit_transaction):
+        """Test repeated submissions to a topic parse its ID only once"""
+        for _ in range(3):
+            await hcs_service.submit_message(topic_id="0.0.100001", message="ping")
+        await hcs_service.submit_message(topic_id="0.0.100002", message="ping")
+        
+        assert mock_submit_transaction.topic_id_cls.fromString.call_count == 2
+    
+    def test_default_client_leased_from_pool(self):
+        """Test services without an explicit client share the pooled client"""
+        with patch('circularity_nexus.blockchain.hcs_service.get_hedera_client_pool') as get_pool:
+            mock_pool = get_pool.return_value
+            service = HCSService()
+            
+            assert service.hedera_client is mock_pool.acquire.return_value
+            service.close()
+            
+            mock_pool.release.assert_called_once_with(mock_pool.acquire.return_value)
+            assert service.hedera_client is None
+    
+    def test_close_keeps_supplied_client(self, hcs_service, mock_hedera_client):
+        """Test closing does not release clients the caller supplied"""
+        with patch('circularity_nexus.blockchain.hcs_service.get_hedera_client_pool') as get_pool:
+            mock_pool = get_pool.return_value
+            hcs_service.close()
+            
+            mock_pool.release.assert_not_called()
+            assert hcs_service.hedera_client is mock_hedera_client
+
+
+class TestHCSServiceMessageQuery:
+    """Test cases for HCSService topic message queries"""
+    
+    @staticmethod
+    def _message(sequence_number, contents):
+        message = Mock()
+        message.sequenceNumber = sequence_number
+        message.contents = contents
+        message.consensusTimestamp = f"1700000000.{sequence_number}"
+        message.runningHash = None
+        return message
+    
+    @pytest.fixture
+    def hcs_service(self):
+        """HCSService bound to a mock client"""
+        client = Mock()
+        client.client = Mock()
+        return HCSService(client)
+    
+    @pytest.mark.asyncio
+    async def test_get_topic_messages_orders_and_limits(self, hcs_service):
+        """Test collected messages are decoded in sequence order up to the limit"""
+        delivered = [
+            self._message(3, b"third"),
+            self._message(1, b"first"),
+            self._message(2, b"\xff\xfe"),
+            self._message(4, b"fourth")
+        ]
+        
+        async def subscribe(client, handler):
+            for message in delivered:
+                handler(message)
+        
+        with patch('circularity_nexus.blockchain.hcs_service.TopicMessageQuery') as mock_query_cls:
+            query = mock_query_cls.return_value.setTopicId.return_value
+            query.subscribe = AsyncMock(side_effect=subscribe)
+            
+            messages = await hcs_service.get_topic_messages("0.0.100001", limit=3)
+        
+        assert [m["sequence_number"] for m in messages] == [1, 3]
+        assert [m["contents"] for m in messages] == ["first", "third"]
+    
+    @staticmethod
+    def _mirror_service(hcs_service, total_messages):
+        """Point the service at a fake mirror node holding sequence numbers 1..total_messages"""
+        requests = []
+        
+        def handler(request):
+            requests.append(request)
+            params = request.url.params
+            first = 1
+            for value in params.get_list("sequencenumber"):
+                first = int(value.split(":")[1])
+            last = min(total_messages, first + int(params["limit"]) - 1)
+            messages = [
+                {
+                    "contents": base64.b64encode(f"msg-{n}".encode()).decode(),
+                    "consensus_timestamp": f"1704110400.{n:09d}",
+                    "sequence_number": n,
+                    "running_hash": base64.b64encode(b"\x01").decode(),
+                    "chunk_info": None
+                }
+                for n in range(first, last + 1)
+            ]
+            return httpx.Response(200, json={"messages": messages, "links": {"next": None}})
+        
+        hcs_service.mirror_node_url = "https://mirror.test"
+        hcs_service._mirror_http = httpx.AsyncClient(
+            base_url="https://mirror.test", transport=httpx.MockTransport(handler)
+        )
+        return requests
+    
+    @pytest.mark.asyncio
+    async def test_get_topic_messages_from_mirror_node(self, hcs_service):
+        """Test bounded historical reads go to the mirror node REST API"""
+        requests = self._mirror_service(hcs_service, total_messages=3)
+        
+        messages = await hcs_service.get_topic_messages(
+            "0.0.100001", start_time=datetime(2024, 1, 1, 12, 0, 0), limit=10
+        )
+        
+        assert [m["contents"] for m in messages] == ["msg-1", "msg-2", "msg-3"]
+        assert str(messages[0]["running_hash"]) == "01"
+        assert len(requests) == 1
+        assert requests[0].url.path == "/api/v1/topics/0.0.100001/messages"
+        assert requests[0].url.params.get_list("timestamp") == ["gte:1704110400.000000000"]
+        await hcs_service.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_get_topic_messages_mirror_pages_fetched_concurrently(self, hcs_service):
+        """Test pages after the first are requested by sequence number range"""
+        requests = self._mirror_service(hcs_service, total_messages=1000)
+        
+        messages = await hcs_service.get_topic_messages(
+            "0.0.100001", start_time=datetime(2024, 1, 1), limit=250
+        )
+        
+        assert [m["sequence_number"] for m in messages] == list(range(1, 251))
+        assert len(requests) == 3
+        assert requests[2].url.params.get_list("sequencenumber") == ["gte:201"]
+        assert requests[2].url.params["limit"] == "50"
+        await hcs_service.aclose()
+    
+    @pytest.mark.asyncio
+    async def test_subscribe_to_topic_starts_now(self, hcs_service):
+        """Test live subscriptions start from the current epoch time"""
+        with patch('circularity_nexus.blockchain.hcs_service.TopicMessageQuery') as mock_query_cls, \
+             patch('circularity_nexus.blockchain.hcs_service.Timestamp') as mock_timestamp, \
+             patch('circularity_nexus.blockchain.hcs_service.time.time_ns', return_value=1_704_110_400_123_456_789):
+            query = mock_query_cls.return_value.setTopicId.return_value
+            query.subscribe = AsyncMock()
+            
+            result = await hcs_service.subscribe_to_topic("0.0.100001", Mock())
+        
+        mock_timestamp.assert_called_once_with(1_704_110_400, 123_456_789)
+        query.setStartTime.assert_called_once_with(mock_timestamp.return_value)
+        assert result["subscription_status"] == "active"
+        assert result["start_time"].endswith("Z")
@@ -2,9 +2,11 @@
 Unit tests for Hedera Client
 """
 
+import asyncio
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
-from circularity_nexus.blockchain.hedera_client import HederaClient
+from circularity_nexus.blockchain import hedera_client as hedera_client_module
+from circularity_nexus.blockchain.hedera_client import HederaClient, HederaClientPool
 from circularity_nexus.core.exceptions import BlockchainError
 
 
@@ -23,7 +25,8 @@ class TestHederaClient:
             AccountCreateTransaction=Mock(),
             AccountBalanceQuery=Mock(),
             TransferTransaction=Mock(),
-            Status=Mock()
+            Status=Mock(),
+            Duration=Mock()
         ) as mocks:
             yield mocks
     
@@ -64,6 +67,18 @@ class TestHederaClient:
             client = HederaClient()
             mock_init.assert_called_once()
     
+    def test_initialize_client_tunes_grpc_channels(self, mock_hedera_imports, mock_settings):
+        """Test the SDK client is configured for long-lived gRPC channels"""
+        client = HederaClient()
+        sdk_client = hedera_client_module.Client.forTestnet.return_value
+        duration = hedera_client_module.Duration
+        
+        sdk_client.setGrpcDeadline.assert_called_once_with(duration.ofSeconds.return_value)
+        sdk_client.setNetworkUpdatePeriod.assert_called_once_with(duration.ofHours.return_value)
+        sdk_client.setMaxAttempts.assert_called_once_with(HederaClient.MAX_ATTEMPTS)
+        duration.ofHours.assert_called_once_with(HederaClient.NETWORK_UPDATE_PERIOD_HOURS)
+        assert client.client is sdk_client
+    
     @pytest.mark.asyncio
     async def test_create_account_success(self, hedera_client, mock_hedera_imports):
         """Test successful account creation"""
@@ -267,6 +282,32 @@ class TestHederaClient:
         assert result["status"] == "SUCCESS"
         assert "transfers" in result
     
+    @pytest.mark.asyncio
+    async def test_confirm_in_background_counts_failures(self, hedera_client):
+        """Test background receipt confirmation records failed receipts"""
+        response = Mock()
+        response.getReceipt = AsyncMock(side_effect=Exception("Receipt timeout"))
+        
+        hedera_client.confirm_in_background(response, "HBAR transfer")
+        assert hedera_client.get_network_info()["pending_receipts"] == 1
+        
+        await asyncio.gather(*hedera_client._pending_receipts)
+        
+        assert hedera_client.receipt_failures == 1
+        assert hedera_client.get_network_info()["pending_receipts"] == 0
+    
+    @pytest.mark.asyncio
+    async def test_confirm_in_background_returns_receipt(self, hedera_client):
+        """Test the background confirmation task resolves to the receipt"""
+        receipt = Mock(status=hedera_client_module.Status.Success)
+        response = Mock()
+        response.getReceipt = AsyncMock(return_value=receipt)
+        
+        task = hedera_client.confirm_in_background(response, "Token mint")
+        
+        assert await task is receipt
+        assert hedera_client.receipt_failures == 0
+    
     def test_get_network_info(self, hedera_client):
         """Test network information retrieval"""
         hedera_client.settings.hedera_network = "testnet"
@@ -282,20 +323,24 @@ class TestHederaClient:
     @pytest.mark.asyncio
     async def test_ping_network_success(self, hedera_client):
         """Test successful network ping"""
+        query = hedera_client_module.AccountBalanceQuery.return_value.setAccountId.return_value
+        query.execute = AsyncMock(return_value=Mock())
+        
         with patch.object(hedera_client, 'get_account_balance') as mock_balance:
-            mock_balance.return_value = {"hbar_balance": 10.0}
-            
             result = await hedera_client.ping_network()
+            
             assert result is True
+            query.execute.assert_awaited_once_with(hedera_client.client)
+            mock_balance.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_ping_network_failure(self, hedera_client):
         """Test network ping failure"""
-        with patch.object(hedera_client, 'get_account_balance') as mock_balance:
-            mock_balance.side_effect = Exception("Network error")
-            
-            result = await hedera_client.ping_network()
-            assert result is False
+        query = hedera_client_module.AccountBalanceQuery.return_value.setAccountId.return_value
+        query.execute = AsyncMock(side_effect=Exception("Network error"))
+        
+        result = await hedera_client.ping_network()
+        assert result is False
     
     def test_close_connection(self, hedera_client):
         """Test client connection closure"""
@@ -323,3 +368,51 @@ class TestHederaClient:
         
         assert "Account creation failed" in str(exc_info.value)
         assert "SDK error" in str(exc_info.value)
+
+
+class TestHederaClientPool:
+    """Test cases for HederaClientPool"""
+    
+    @pytest.fixture
+    def pool(self):
+        """Pool with a mock client factory"""
+        return HederaClientPool(max_clients=2, factory=Mock)
+    
+    def test_acquire_reuses_idle_client(self, pool):
+        """Test released clients are handed out again"""
+        client = pool.acquire()
+        pool.release(client)
+        
+        assert pool.acquire() is client
+        assert pool.get_pool_status()["clients"] == 1
+    
+    def test_acquire_grows_then_shares(self, pool):
+        """Test pool grows to max_clients then shares the least-leased client"""
+        first = pool.acquire()
+        second = pool.acquire()
+        third = pool.acquire()
+        
+        assert first is not second
+        assert third in (first, second)
+        assert pool.get_pool_status() == {"clients": 2, "max_clients": 2, "leases": 3}
+    
+    def test_lease_releases_on_exit(self, pool):
+        """Test leases taken with lease() are returned when the block exits"""
+        with pytest.raises(RuntimeError):
+            with pool.lease() as client:
+                assert pool.get_pool_status()["leases"] == 1
+                raise RuntimeError("operation failed")
+        
+        assert pool.get_pool_status()["leases"] == 0
+        assert pool.acquire() is client
+    
+    def test_close_closes_all_clients(self, pool):
+        """Test closing the pool closes every client"""
+        first = pool.acquire()
+        second = pool.acquire()
+        
+        pool.close()
+        
+        first.close.assert_called_once()
+        second.close.assert_called_once()
+        assert pool.get_pool_status()["clients"] == 0
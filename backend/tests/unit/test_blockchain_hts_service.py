@@ -2,21 +2,40 @@
 Unit tests for Hedera Token Service (HTS) Integration
 """
 
+import asyncio
+import threading
 import pytest
+from decimal import Decimal
 from unittest.mock import Mock, patch, AsyncMock
-from circularity_nexus.blockchain.hts_service import HTSService
+from circularity_nexus.blockchain.hts_service import (
+    HTSService,
+    HTSBatch,
+    TransferSpec,
+    OptimisticSubmitter,
+    _token_id,
+    _account_id
+)
+from circularity_nexus.blockchain.hedera_client import HederaClientPool
 from circularity_nexus.core.exceptions import BlockchainError, ValidationError
 
 
+@pytest.fixture(autouse=True)
+def clear_id_caches():
+    """Parsed IDs are cached per process; keep patched SDK classes from leaking"""
+    _token_id.cache_clear()
+    _account_id.cache_clear()
+
+
 class TestHTSService:
     """Test cases for HTSService"""
     
     @pytest.fixture
     def mock_hedera_client(self):
         """Mock HederaClient"""
-        with patch('circularity_nexus.blockchain.hts_service.HederaClient') as mock_client:
+        with patch('circularity_nexus.blockchain.hts_service.get_hedera_client_pool') as get_pool:
+            mock_pool = get_pool.return_value
             mock_instance = Mock()
-            mock_client.return_value = mock_instance
+            mock_pool.acquire.return_value = mock_instance
             
             # Mock client properties
             mock_instance.client = Mock()
@@ -283,3 +302,841 @@ class TestHTSService:
                 )
             
             assert "Token creation failed" in str(exc_info.value)
+
+
+class TestHTSServiceBatching:
+    """Test cases for HIP-551 batched token operations"""
+    
+    @pytest.fixture
+    def mock_hedera_client(self):
+        """Mock HederaClient with an operator key"""
+        client = Mock()
+        client.client = Mock()
+        client.operator_private_key = Mock()
+        return client
+    
+    @pytest.fixture
+    def hts_service(self, mock_hedera_client):
+        """HTSService whose token lookups report a fungible token"""
+        service = HTSService(hedera_client=mock_hedera_client)
+        service._get_token_type = AsyncMock(return_value="fungible")
+        return service
+    
+    @pytest.fixture
+    def mock_batch_transaction(self):
+        """Patch BatchTransaction with a batch that executes successfully"""
+        with patch('circularity_nexus.blockchain.hts_service.BatchTransaction') as batch_cls:
+            batch = batch_cls.return_value
+            batch.setInnerTransactions.return_value = batch
+            batch.freezeWith.return_value = batch
+            batch.sign.return_value = batch
+            response = Mock()
+            response.transactionId = "0.0.123456@1700000000.0"
+            response.getReceipt = AsyncMock(return_value=Mock())
+            batch.execute = AsyncMock(return_value=response)
+            batch.getInnerTransactionIds.return_value = ["0.0.123456@1.1", "0.0.123456@1.2"]
+            yield batch
+    
+    @pytest.mark.asyncio
+    async def test_batch_context_flushes_once(self, hts_service, mock_hedera_client, mock_batch_transaction):
+        """Test operations queued in batch() execute as a single atomic batch"""
+        with patch('circularity_nexus.blockchain.hts_service.TokenId'), \
+             patch('circularity_nexus.blockchain.hts_service.AccountId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction') as mint_cls, \
+             patch('circularity_nexus.blockchain.hts_service.TokenTransferTransaction') as transfer_cls:
+            mint = mint_cls.return_value.setTokenId.return_value
+            transfer = transfer_cls.return_value
+            
+            async with hts_service.batch() as batch_ctx:
+                queued = await hts_service.mint_tokens("0.0.1001", 500, batch_ctx=batch_ctx)
+                await hts_service.transfer_tokens(
+                    "0.0.1001", "0.0.123456", "0.0.789012", amount=100, batch_ctx=batch_ctx
+                )
+                assert len(batch_ctx) == 2
+                mock_batch_transaction.execute.assert_not_awaited()
+            
+            assert queued["status"] == "queued"
+            mint.execute.assert_not_called()
+            transfer.execute.assert_not_called()
+            
+            batch_key = mock_hedera_client.operator_private_key.getPublicKey.return_value
+            mint.batchify.assert_called_once_with(mock_hedera_client.client, batch_key)
+            transfer.batchify.assert_called_once_with(mock_hedera_client.client, batch_key)
+            mock_batch_transaction.setInnerTransactions.assert_called_once_with(
+                [mint.batchify.return_value, transfer.batchify.return_value]
+            )
+            mock_batch_transaction.sign.assert_called_once_with(mock_hedera_client.operator_private_key)
+            mock_batch_transaction.execute.assert_awaited_once()
+            
+            assert batch_ctx.result["transaction_count"] == 2
+            assert batch_ctx.result["batch_transaction_id"] == "0.0.123456@1700000000.0"
+            assert batch_ctx.result["inner_transaction_ids"] == ["0.0.123456@1.1", "0.0.123456@1.2"]
+            assert batch_ctx.result["status"] == "success"
+    
+    @pytest.mark.asyncio
+    async def test_mint_and_transfer_is_one_batch(self, hts_service, mock_batch_transaction):
+        """Test a fungible mint-to-recipient settles as a single atomic batch"""
+        with patch('circularity_nexus.blockchain.hts_service.TokenId'), \
+             patch('circularity_nexus.blockchain.hts_service.AccountId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction') as mint_cls, \
+             patch('circularity_nexus.blockchain.hts_service.TokenTransferTransaction') as transfer_cls:
+            result = await hts_service.mint_and_transfer("0.0.1001", 500, "0.0.123456", "0.0.789012")
+        
+        mint = mint_cls.return_value.setTokenId.return_value
+        transfer = transfer_cls.return_value
+        mock_batch_transaction.setInnerTransactions.assert_called_once_with(
+            [mint.batchify.return_value, transfer.batchify.return_value]
+        )
+        mock_batch_transaction.execute.assert_awaited_once()
+        assert result["transaction_id"] == "0.0.123456@1700000000.0"
+        assert result["to_account"] == "0.0.789012"
+    
+    @pytest.mark.asyncio
+    async def test_mint_and_transfer_nft_uses_minted_serials(self, hts_service):
+        """Test NFTs are transferred by the serial numbers the mint returned"""
+        hts_service._get_token_type = AsyncMock(return_value="nft")
+        hts_service.mint_tokens = AsyncMock(return_value={"serial_numbers": [7], "status": "success"})
+        hts_service.transfer_tokens = AsyncMock()
+        
+        result = await hts_service.mint_and_transfer(
+            "0.0.2002", 1, "0.0.123456", "0.0.789012", metadata=[b"cert"]
+        )
+        
+        hts_service.mint_tokens.assert_awaited_once_with(
+            "0.0.2002", 1, metadata=[b"cert"], high_volume=False
+        )
+        hts_service.transfer_tokens.assert_awaited_once_with(
+            "0.0.2002", "0.0.123456", "0.0.789012", serial_numbers=[7], memo=None
+        )
+        assert result["to_account"] == "0.0.789012"
+    
+    @pytest.mark.asyncio
+    async def test_freeze_and_sign_run_off_event_loop(self, hts_service, mock_hedera_client):
+        """Test blocking SDK freeze/sign calls are made on the SDK thread pool"""
+        loop_thread = threading.get_ident()
+        sdk_threads = []
+        
+        with patch('circularity_nexus.blockchain.hts_service.TokenId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction') as mint_cls:
+            mint = mint_cls.return_value.setTokenId.return_value
+            signed = mint.freezeWith.return_value.sign.return_value
+            mint.freezeWith.side_effect = lambda client: (
+                sdk_threads.append(threading.get_ident()) or mint.freezeWith.return_value
+            )
+            response = Mock()
+            response.getReceipt = AsyncMock(return_value=Mock(totalSupply=1500))
+            signed.execute = AsyncMock(return_value=response)
+            
+            result = await hts_service.mint_tokens("0.0.1001", 500)
+        
+        assert result["new_total_supply"] == 1500
+        assert sdk_threads and sdk_threads[0] != loop_thread
+        mint.freezeWith.return_value.sign.assert_called_once_with(mock_hedera_client.operator_private_key)
+    
+    @pytest.mark.asyncio
+    async def test_mint_without_waiting_for_receipt(self, hts_service, mock_hedera_client):
+        """Test fire-and-forget mints return before consensus with a receipt task"""
+        with patch('circularity_nexus.blockchain.hts_service.TokenId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction') as mint_cls:
+            signed = mint_cls.return_value.setTokenId.return_value.freezeWith.return_value.sign.return_value
+            response = Mock(transactionId="0.0.123456@1700000000.0")
+            response.getReceipt = AsyncMock()
+            signed.execute = AsyncMock(return_value=response)
+            
+            result = await hts_service.mint_tokens("0.0.1001", 500, wait_for_receipt=False)
+        
+        assert result["status"] == "pending"
+        assert result["transaction_id"] == "0.0.123456@1700000000.0"
+        assert result["receipt"] is mock_hedera_client.confirm_in_background.return_value
+        mock_hedera_client.confirm_in_background.assert_called_once_with(response, "Mint of 0.0.1001")
+        response.getReceipt.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_associate_token_executes_with_receipt(self, hts_service, mock_hedera_client):
+        """Test single operations freeze, sign, execute and wait for the receipt"""
+        with patch('circularity_nexus.blockchain.hts_service.TokenId'), \
+             patch('circularity_nexus.blockchain.hts_service.AccountId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenAssociateTransaction') as associate_cls:
+            transaction = associate_cls.return_value.setAccountId.return_value.setTokenIds.return_value
+            signed = transaction.freezeWith.return_value.sign.return_value
+            response = Mock(transactionId="0.0.123456@1700000000.0")
+            response.getReceipt = AsyncMock()
+            signed.execute = AsyncMock(return_value=response)
+            
+            result = await hts_service.associate_token("0.0.789012", "0.0.1001")
+        
+        assert result["token_ids"] == ["0.0.1001"]
+        assert result["transaction_id"] == "0.0.123456@1700000000.0"
+        transaction.freezeWith.assert_called_once_with(mock_hedera_client.client)
+        signed.execute.assert_awaited_once_with(mock_hedera_client.client)
+        response.getReceipt.assert_awaited_once_with(mock_hedera_client.client)
+    
+    @pytest.mark.asyncio
+    async def test_associate_token_without_waiting_for_receipt(self, hts_service, mock_hedera_client):
+        """Test fire-and-forget associations skip the receipt fetch"""
+        with patch('circularity_nexus.blockchain.hts_service.TokenId'), \
+             patch('circularity_nexus.blockchain.hts_service.AccountId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenAssociateTransaction') as associate_cls:
+            transaction = associate_cls.return_value.setAccountId.return_value.setTokenIds.return_value
+            signed = transaction.freezeWith.return_value.sign.return_value
+            response = Mock(transactionId="0.0.123456@1700000000.0")
+            response.getReceipt = AsyncMock()
+            signed.execute = AsyncMock(return_value=response)
+            
+            result = await hts_service.associate_token("0.0.789012", "0.0.1001", wait_for_receipt=False)
+        
+        assert result["status"] == "pending"
+        assert result["receipt"] is mock_hedera_client.confirm_in_background.return_value
+        response.getReceipt.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_batch_burn(self, hts_service, mock_batch_transaction):
+        """Test batch_burn packs every burn into one batch"""
+        with patch('circularity_nexus.blockchain.hts_service.TokenId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenBurnTransaction') as burn_cls:
+            burn = burn_cls.return_value.setTokenId.return_value
+            
+            result = await hts_service.batch_burn([
+                {"token_id": "0.0.1001", "amount": 10},
+                {"token_id": "0.0.1002", "amount": 20}
+            ])
+            
+            assert result["transaction_count"] == 2
+            assert burn.setAmount.call_count == 2
+            mock_batch_transaction.execute.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_batch_not_flushed_on_error(self, hts_service, mock_batch_transaction):
+        """Test an exception inside batch() discards the queued transactions"""
+        with patch('circularity_nexus.blockchain.hts_service.TokenId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction'):
+            with pytest.raises(RuntimeError):
+                async with hts_service.batch() as batch_ctx:
+                    await hts_service.mint_tokens("0.0.1001", 500, batch_ctx=batch_ctx)
+                    raise RuntimeError("abort")
+        
+        mock_batch_transaction.execute.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_batch_execute_limits(self, hts_service):
+        """Test batch_execute rejects empty and oversized batches"""
+        with patch('circularity_nexus.blockchain.hts_service.BatchTransaction'):
+            with pytest.raises(BlockchainError, match="at least one"):
+                await hts_service.batch_execute([])
+            with pytest.raises(BlockchainError, match="exceeds the limit"):
+                await hts_service.batch_execute([Mock()] * (HTSService.MAX_BATCH_SIZE + 1))
+    
+    @pytest.mark.asyncio
+    async def test_batch_execute_unsupported_sdk(self, hts_service):
+        """Test batching fails clearly when the SDK lacks BatchTransaction"""
+        with patch('circularity_nexus.blockchain.hts_service.BatchTransaction', None):
+            with pytest.raises(BlockchainError, match="not supported"):
+                await hts_service.batch_execute([Mock()])
+
+
+class TestHTSServiceHighVolume:
+    """Test cases for HIP-1313 high-volume submission"""
+    
+    @pytest.fixture
+    def hts_service(self):
+        """HTSService whose executions are mocked"""
+        service = HTSService(hedera_client=Mock())
+        service._execute = AsyncMock(return_value=("response", "receipt"))
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_high_volume_caps_fee(self, hts_service):
+        """Test high-volume transactions are flagged and fee-capped"""
+        transaction = Mock()
+        rebuild = AsyncMock()
+        
+        with patch('circularity_nexus.blockchain.hts_service.Hbar') as hbar_cls:
+            result = await hts_service._execute_high_volume(transaction, rebuild)
+        
+        assert result == ("response", "receipt")
+        transaction.setHighVolume.assert_called_once_with(True)
+        transaction.setMaxTransactionFee.assert_called_once_with(hbar_cls.fromTinybars.return_value)
+        rebuild.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_fee_above_cap_falls_back_and_backs_off(self, hts_service):
+        """Test a capped-out high-volume transaction is resent on standard throttles"""
+        standard = Mock()
+        rebuild = AsyncMock(return_value=standard)
+        hts_service._execute.side_effect = [
+            BlockchainError("PrecheckStatusException: INSUFFICIENT_TX_FEE"),
+            ("response", "receipt"),
+            ("response", "receipt")
+        ]
+        
+        with patch('circularity_nexus.blockchain.hts_service.Hbar'):
+            assert await hts_service._execute_high_volume(Mock(), rebuild) == ("response", "receipt")
+            later = Mock()
+            await hts_service._execute_high_volume(later, rebuild)
+        
+        assert hts_service._execute.call_args_list[1].args[0] is standard
+        later.setHighVolume.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_sdk_without_high_volume_uses_standard_path(self, hts_service):
+        """Test SDKs predating HIP-1313 submit normally"""
+        transaction = Mock(spec=["freezeWith"])
+        
+        await hts_service._execute_high_volume(transaction, AsyncMock())
+        
+        hts_service._execute.assert_awaited_once_with(transaction, True)
+
+
+class TestHTSServiceTransferMany:
+    """Test cases for concurrent fan-out transfers"""
+    
+    @pytest.fixture
+    def pooled_clients(self):
+        """Patch the shared client pool with two mock clients"""
+        clients = [Mock(name=f"client{i}") for i in range(2)]
+        with patch('circularity_nexus.blockchain.hts_service.get_hedera_client_pool') as get_pool:
+            pool = get_pool.return_value
+            pool.max_clients = len(clients)
+            pool.acquire.side_effect = clients
+            yield pool, clients
+    
+    @pytest.fixture
+    def hts_service(self):
+        """HTSService instance with a mocked default client"""
+        return HTSService(hedera_client=Mock())
+    
+    @pytest.mark.asyncio
+    async def test_transfer_many_round_robins_pool(self, hts_service, pooled_clients):
+        """Test transfers are spread over pooled clients and leases are returned"""
+        pool, clients = pooled_clients
+        built = []
+        
+        async def build(*args):
+            transaction = Mock()
+            signed = transaction.freezeWith.return_value.sign.return_value
+            response = Mock(transactionId=f"0.0.123456@{len(built)}")
+            response.getReceipt = AsyncMock()
+            signed.execute = AsyncMock(return_value=response)
+            built.append(transaction)
+            return transaction
+        
+        hts_service._build_transfer_transaction = AsyncMock(side_effect=build)
+        specs = [
+            TransferSpec("0.0.1001", "0.0.123456", f"0.0.{2000 + i}", amount=10)
+            for i in range(4)
+        ]
+        
+        results = await hts_service.transfer_many(specs)
+        
+        assert results.to_accounts == [spec.to_account for spec in specs]
+        assert results.statuses == ["success"] * 4
+        assert results.transaction_ids == [f"0.0.123456@{i}" for i in range(4)]
+        frozen_with = [t.freezeWith.call_args[0][0] for t in built]
+        assert frozen_with == [clients[0].client, clients[1].client] * 2
+        assert [c.args[0] for c in pool.release.call_args_list] == clients
+    
+    @pytest.mark.asyncio
+    async def test_transfer_many_isolates_failures(self, hts_service, pooled_clients):
+        """Test one failed transfer is reported without aborting the rest"""
+        async def build(token_id, from_account, to_account, *args):
+            if to_account == "0.0.2001":
+                raise BlockchainError("Amount required for fungible token transfer")
+            transaction = Mock()
+            response = Mock(transactionId="0.0.123456@1")
+            response.getReceipt = AsyncMock()
+            signed = transaction.freezeWith.return_value.sign.return_value
+            signed.execute = AsyncMock(return_value=response)
+            return transaction
+        
+        hts_service._build_transfer_transaction = AsyncMock(side_effect=build)
+        
+        results = await hts_service.transfer_many([
+            TransferSpec("0.0.1001", "0.0.123456", "0.0.2000", amount=10),
+            TransferSpec("0.0.1001", "0.0.123456", "0.0.2001")
+        ])
+        
+        assert results.statuses == ["success", "failed"]
+        assert results.succeeded == 1
+        assert results.errors[0] is None
+        assert "Amount required" in results.errors[1]
+        assert pooled_clients[0].release.call_count == 2
+        
+        rows = results.to_aos()
+        assert rows[0]["to_account"] == "0.0.2000"
+        assert rows[0]["transaction_id"] == "0.0.123456@1"
+        assert "error" not in rows[0]
+        assert rows[1]["status"] == "failed"
+        assert "Amount required" in rows[1]["error"]
+
+
+class TestHTSServiceTokenCache:
+    """Test cases for cached token metadata"""
+    
+    @pytest.fixture
+    def mock_token_info_query(self):
+        """Patch TokenInfoQuery to return a fungible token"""
+        with patch('circularity_nexus.blockchain.hts_service.TokenId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenInfoQuery') as query_cls:
+            query = query_cls.return_value.setTokenId.return_value
+            info = Mock()
+            info.name = "Waste Token"
+            info.symbol = "WASTE"
+            info.decimals = 2
+            info.totalSupply = 1000
+            query.execute = AsyncMock(return_value=info)
+            yield query
+    
+    @pytest.fixture
+    def hts_service(self):
+        """HTSService instance with a mocked client"""
+        return HTSService(hedera_client=Mock())
+    
+    @pytest.mark.asyncio
+    async def test_get_token_info_cache_hit_skips_query(self, hts_service, mock_token_info_query):
+        """Test cached tokens are answered without re-querying supply"""
+        first = await hts_service.get_token_info("0.0.1001")
+        second = await hts_service.get_token_info("0.0.1001")
+        
+        assert second == first
+        assert second["symbol"] == "WASTE"
+        assert mock_token_info_query.execute.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_get_token_info_refresh_supply(self, hts_service, mock_token_info_query):
+        """Test refresh_supply re-reads the total supply of a cached token"""
+        await hts_service.get_token_info("0.0.1001")
+        mock_token_info_query.execute.return_value.totalSupply = 1500
+        
+        result = await hts_service.get_token_info("0.0.1001", refresh_supply=True)
+        
+        assert result["total_supply"] == 1500
+        assert result["last_updated"].endswith("Z")
+        assert mock_token_info_query.execute.await_count == 2
+        
+        # A second refresh within the supply TTL reuses the fresh value
+        again = await hts_service.get_token_info("0.0.1001", refresh_supply=True)
+        assert again["total_supply"] == 1500
+        assert mock_token_info_query.execute.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_token_cache_is_bounded(self, mock_token_info_query):
+        """Test the token caches evict least recently used entries"""
+        with patch.object(HTSService, "TOKEN_CACHE_SIZE", 2):
+            hts_service = HTSService(hedera_client=Mock())
+        
+        for token_id in ("0.0.1", "0.0.2", "0.0.3"):
+            await hts_service.get_token_info(token_id)
+        
+        assert list(hts_service.token_cache) == ["0.0.2", "0.0.3"]
+        assert "0.0.1" not in hts_service._meta_cache
+    
+    @pytest.mark.asyncio
+    async def test_mints_look_up_token_type_once(self, hts_service, mock_token_info_query):
+        """Test repeated operations on a token query its type only once"""
+        with patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction') as mint_cls:
+            mint = mint_cls.return_value.setTokenId.return_value
+            for _ in range(3):
+                await hts_service._build_mint_transaction("0.0.1001", 10, None)
+        
+        assert mint.setAmount.call_count == 3
+        assert mock_token_info_query.execute.await_count == 1
+        assert hts_service._meta_cache["0.0.1001"].token_type == "fungible"
+    
+    @pytest.mark.asyncio
+    async def test_mint_receipt_updates_cached_supply(self, hts_service, mock_token_info_query):
+        """Test a mint refreshes the cached supply from its receipt"""
+        await hts_service.get_token_info("0.0.1001")
+        receipt = Mock(totalSupply=1500, serials=[])
+        hts_service._execute = AsyncMock(return_value=(Mock(transactionId="0.0.123456@1"), receipt))
+        
+        with patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction'):
+            await hts_service.mint_tokens("0.0.1001", 500)
+        
+        info = await hts_service.get_token_info("0.0.1001")
+        refreshed = await hts_service.get_token_info("0.0.1001", refresh_supply=True)
+        
+        assert info["total_supply"] == 1500
+        assert refreshed["total_supply"] == 1500
+        assert mock_token_info_query.execute.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_mint_from_template_resolves_token_once(self, hts_service):
+        """Test repeated template mints check the token type only once"""
+        hts_service._get_token_type = AsyncMock(return_value="fungible")
+        receipt = Mock(totalSupply=1100)
+        hts_service._execute = AsyncMock(return_value=(Mock(transactionId="0.0.123456@1"), receipt))
+        
+        with patch('circularity_nexus.blockchain.hts_service.TokenId') as token_id_cls, \
+             patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction') as mint_cls:
+            for amount in (100, 200):
+                result = await hts_service.mint_from_template("0.0.1001", amount)
+        
+        assert result["amount_minted"] == 200
+        assert result["new_total_supply"] == 1100
+        hts_service._get_token_type.assert_awaited_once()
+        token_id_cls.fromString.assert_called_once_with("0.0.1001")
+        set_amount = mint_cls.return_value.setTokenId.return_value.setAmount
+        assert [c.args[0] for c in set_amount.call_args_list] == [100, 200]
+    
+    @pytest.mark.asyncio
+    async def test_template_rejects_nft(self, hts_service):
+        """Test templates refuse NFT collections"""
+        hts_service._get_token_type = AsyncMock(return_value="nft")
+        
+        with pytest.raises(BlockchainError, match="only support fungible"):
+            await hts_service.transfer_from_template("0.0.2002", "0.0.123456", "0.0.2000", 1)
+    
+    @pytest.mark.asyncio
+    async def test_mint_after_create_needs_no_query(self, hts_service, mock_token_info_query):
+        """Test the first mint into a just-created collection skips the info query"""
+        create_receipt = Mock(tokenId="0.0.3003")
+        mint_receipt = Mock(totalSupply=1, serials=[1])
+        hts_service._execute = AsyncMock(side_effect=[
+            (Mock(transactionId="0.0.123456@1"), create_receipt),
+            (Mock(transactionId="0.0.123456@2"), mint_receipt)
+        ])
+        
+        with patch('circularity_nexus.blockchain.hts_service.TokenCreateTransaction'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenType'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenSupplyType'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction') as mint_cls:
+            created = await hts_service.create_nft_collection("Certificates", "CERT")
+            assert (await hts_service.get_token_info("0.0.3003"))["total_supply"] == 0
+            await hts_service.mint_tokens("0.0.3003", 1, metadata=[b"cert-1"])
+        
+        mint_cls.return_value.setTokenId.return_value.setMetadata.assert_called_once_with([b"cert-1"])
+        assert (await hts_service.get_token_info("0.0.3003"))["total_supply"] == 1
+        assert "total_supply" not in created
+        mock_token_info_query.execute.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_writes_without_supply_receipt_invalidate(self, hts_service, mock_token_info_query):
+        """Test pending and batched mints drop the cached supply but keep the meta"""
+        await hts_service.get_token_info("0.0.1001")
+        hts_service._execute = AsyncMock(return_value=(Mock(transactionId="0.0.123456@1"), None))
+        
+        with patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction'):
+            await hts_service.mint_tokens("0.0.1001", 500, wait_for_receipt=False)
+        
+        assert "0.0.1001" not in hts_service.token_cache
+        assert "0.0.1001" not in hts_service._supply_cache
+        assert hts_service._meta_cache["0.0.1001"].token_type == "fungible"
+        
+        await hts_service.get_token_info("0.0.1001")
+        hts_service.batch_execute = AsyncMock(return_value={"status": "success"})
+        with patch('circularity_nexus.blockchain.hts_service.TokenBurnTransaction'):
+            async with hts_service.batch() as batch_ctx:
+                await hts_service.burn_tokens("0.0.1001", 100, batch_ctx=batch_ctx)
+                assert "0.0.1001" in hts_service.token_cache
+        
+        assert "0.0.1001" not in hts_service.token_cache
+        assert mock_token_info_query.execute.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_created_token_type_needs_no_query(self, hts_service, mock_token_info_query):
+        """Test tokens created by the service are typed without a query"""
+        hts_service._cache_token("0.0.2002", {"token_id": "0.0.2002", "symbol": "CERT", "token_type": "nft"})
+        
+        assert await hts_service._get_token_type("0.0.2002") == "nft"
+        mock_token_info_query.execute.assert_not_awaited()
+    
+    @pytest.mark.asyncio
+    async def test_account_token_balance_single_query(self, hts_service, mock_token_info_query):
+        """Test a balance lookup for a known token issues only the balance query"""
+        await hts_service.get_token_info("0.0.1001")
+        hts_service.hedera_client.get_account_balance = AsyncMock()
+        
+        with patch('circularity_nexus.blockchain.hts_service.AccountId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenBalanceQuery') as balance_cls:
+            query = balance_cls.return_value.setAccountId.return_value.setTokenId.return_value
+            query.execute = AsyncMock(return_value=1234)
+            
+            result = await hts_service.get_account_token_balance("0.0.123456", "0.0.1001")
+        
+        assert result["balance"] == 1234
+        assert result["formatted_balance"] == Decimal("12.34")
+        assert result["token_symbol"] == "WASTE"
+        query.execute.assert_awaited_once()
+        hts_service.hedera_client.get_account_balance.assert_not_awaited()
+        assert mock_token_info_query.execute.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_account_token_balance_keeps_precision(self, hts_service, mock_token_info_query):
+        """Test balances above 2**53 are formatted without float rounding"""
+        await hts_service.get_token_info("0.0.1001")
+        balance = 2 ** 60 + 1
+        
+        with patch('circularity_nexus.blockchain.hts_service.AccountId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenBalanceQuery') as balance_cls:
+            query = balance_cls.return_value.setAccountId.return_value.setTokenId.return_value
+            query.execute = AsyncMock(return_value=balance)
+            
+            result = await hts_service.get_account_token_balance("0.0.123456", "0.0.1001")
+        
+        assert result["formatted_balance"] == Decimal("11529215046068469.77")
+        assert hts_service._meta_cache["0.0.1001"].scale == Decimal(100)
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_query(self, hts_service, mock_token_info_query):
+        """Test concurrent lookups of an uncached token issue a single query"""
+        info = mock_token_info_query.execute.return_value
+        
+        async def slow_query(client):
+            await asyncio.sleep(0)
+            return info
+        
+        mock_token_info_query.execute = AsyncMock(side_effect=slow_query)
+        
+        results = await asyncio.gather(
+            *(hts_service._get_token_type("0.0.1001") for _ in range(50)),
+            hts_service.get_token_info("0.0.1001")
+        )
+        
+        assert results[:50] == ["fungible"] * 50
+        assert results[50]["symbol"] == "WASTE"
+        assert mock_token_info_query.execute.await_count == 1
+        assert not hts_service._inflight
+    
+    @pytest.mark.asyncio
+    async def test_shared_query_failure_is_not_cached(self, hts_service, mock_token_info_query):
+        """Test a failed shared query reaches every caller and is retried later"""
+        mock_token_info_query.execute.side_effect = [RuntimeError("BUSY"), Mock(symbol="WASTE", decimals=2)]
+        
+        results = await asyncio.gather(
+            hts_service.get_token_info("0.0.1001"),
+            hts_service.get_token_info("0.0.1001"),
+            return_exceptions=True
+        )
+        
+        assert all(isinstance(result, BlockchainError) for result in results)
+        assert (await hts_service.get_token_info("0.0.1001"))["symbol"] == "WASTE"
+        assert mock_token_info_query.execute.await_count == 2
+
+
+class TestHTSServiceIdCache:
+    """Test cases for interned token and account IDs"""
+    
+    @pytest.mark.asyncio
+    async def test_repeated_ids_parsed_once(self):
+        """Test airdrop-style transfers reuse the parsed sender and token IDs"""
+        service = HTSService(hedera_client=Mock())
+        service._get_token_type = AsyncMock(return_value="fungible")
+        
+        with patch('circularity_nexus.blockchain.hts_service.TokenId') as token_id_cls, \
+             patch('circularity_nexus.blockchain.hts_service.AccountId') as account_id_cls, \
+             patch('circularity_nexus.blockchain.hts_service.TokenTransferTransaction'):
+            for i in range(3):
+                await service._build_transfer_transaction(
+                    "0.0.1001", "0.0.123456", f"0.0.{2000 + i}", 10, None, None
+                )
+        
+        token_id_cls.fromString.assert_called_once_with("0.0.1001")
+        assert account_id_cls.fromString.call_count == 4
+        assert _account_id("0.0.123456") is _account_id("0.0.123456")
+    
+    @pytest.mark.asyncio
+    async def test_nft_transfer_adds_every_serial(self):
+        """Test NFT transfers add one transfer per serial with the parsed IDs"""
+        service = HTSService(hedera_client=Mock())
+        service._get_token_type = AsyncMock(return_value="nft")
+        serials = list(range(1, 1001))
+        
+        with patch('circularity_nexus.blockchain.hts_service.TokenId') as token_id_cls, \
+             patch('circularity_nexus.blockchain.hts_service.AccountId') as account_id_cls, \
+             patch('circularity_nexus.blockchain.hts_service.TokenTransferTransaction') as transfer_cls:
+            account_id_cls.fromString.side_effect = lambda account_id: account_id
+            transaction = await service._build_transfer_transaction(
+                "0.0.2002", "0.0.123456", "0.0.789012", None, serials, None
+            )
+        
+        token = token_id_cls.fromString.return_value
+        assert transaction is transfer_cls.return_value
+        assert [c.args for c in transaction.addNftTransfer.call_args_list] == [
+            (token, serial, "0.0.123456", "0.0.789012") for serial in serials
+        ]
+
+
+class TestHTSServiceNftMint:
+    """Test cases for NFT mint metadata"""
+    
+    @pytest.fixture
+    def hts_service(self):
+        """HTSService whose token lookups report an NFT collection"""
+        service = HTSService(hedera_client=Mock())
+        service._get_token_type = AsyncMock(return_value="nft")
+        return service
+    
+    @pytest.mark.asyncio
+    async def test_default_metadata(self, hts_service):
+        """Test NFTs minted without metadata are numbered from 1"""
+        with patch('circularity_nexus.blockchain.hts_service.TokenId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction') as mint_cls:
+            transaction = await hts_service._build_mint_transaction("0.0.2002", 3, None)
+        
+        assert transaction is mint_cls.return_value.setTokenId.return_value
+        transaction.setMetadata.assert_called_once_with([b"NFT #1", b"NFT #2", b"NFT #3"])
+    
+    @pytest.mark.asyncio
+    async def test_oversized_mint_fails_fast(self, hts_service):
+        """Test batched mints above the per-transaction NFT limit are rejected"""
+        with patch('circularity_nexus.blockchain.hts_service.TokenId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction') as mint_cls:
+            with pytest.raises(BlockchainError, match="limit is 10"):
+                await hts_service.mint_tokens("0.0.2002", 10_000, batch_ctx=HTSBatch())
+        
+        mint_cls.return_value.setTokenId.return_value.setMetadata.assert_not_called()
+
+
+    @pytest.mark.asyncio
+    async def test_large_mint_is_chunked(self, hts_service):
+        """Test large NFT mints are split into concurrent chunks and merged in order"""
+        async def execute(transaction, wait_for_receipt=True):
+            chunk = transaction.setMetadata.call_args[0][0]
+            serials = [int(item.split(b"#")[1]) for item in chunk]
+            # Later chunks land first
+            await asyncio.sleep(0.001 * (30 - serials[0]))
+            receipt = Mock(serials=serials, totalSupply=serials[-1])
+            return Mock(transactionId=f"tx-{serials[0]}"), receipt
+        
+        hts_service._execute = AsyncMock(side_effect=execute)
+        
+        with patch('circularity_nexus.blockchain.hts_service.TokenId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction') as mint_cls:
+            mint_cls.return_value.setTokenId.side_effect = lambda token: Mock()
+            result = await hts_service.mint_tokens("0.0.2002", 25)
+        
+        assert hts_service._execute.await_count == 3
+        assert result["total_chunks"] == 3
+        assert result["amount_minted"] == 25
+        assert result["serial_numbers"] == list(range(1, 26))
+        assert result["transaction_ids"] == ["tx-1", "tx-11", "tx-21"]
+        assert result["new_total_supply"] == 25
+        assert result["failed_chunks"] == []
+        assert result["status"] == "success"
+    
+    @pytest.mark.asyncio
+    async def test_failed_chunk_keeps_minted_serials(self, hts_service):
+        """Test one failed chunk does not cancel the others or lose their serials"""
+        async def execute(transaction, wait_for_receipt=True):
+            chunk = transaction.setMetadata.call_args[0][0]
+            serials = [int(item.split(b"#")[1]) for item in chunk]
+            if serials[0] == 11:
+                raise RuntimeError("BUSY")
+            # The failing chunk lands first
+            await asyncio.sleep(0.001 * serials[0])
+            return Mock(transactionId=f"tx-{serials[0]}"), Mock(serials=serials, totalSupply=serials[-1])
+        
+        hts_service._execute = AsyncMock(side_effect=execute)
+        
+        with patch('circularity_nexus.blockchain.hts_service.TokenId'), \
+             patch('circularity_nexus.blockchain.hts_service.TokenMintTransaction') as mint_cls:
+            mint_cls.return_value.setTokenId.side_effect = lambda token: Mock()
+            result = await hts_service.mint_tokens("0.0.2002", 25)
+        
+        assert hts_service._execute.await_count == 3
+        assert result["status"] == "partial"
+        assert result["amount_minted"] == 15
+        assert result["serial_numbers"] == list(range(1, 11)) + list(range(21, 26))
+        assert result["transaction_ids"] == ["tx-1", "tx-21"]
+        assert [(c["chunk_number"], c["metadata_offset"], c["chunk_size"]) for c in result["failed_chunks"]] == [(2, 10, 10)]
+        assert "BUSY" in result["failed_chunks"][0]["error"]
+
+
+class TestHTSServiceTokenKeys:
+    """Test cases for token key assignment"""
+    
+    def test_default_keys_derive_operator_key_once(self):
+        """Test admin and supply keys default to one derived operator public key"""
+        hedera_client = Mock()
+        service = HTSService(hedera_client=hedera_client)
+        transaction = Mock()
+        freeze_key = Mock()
+        
+        service._set_token_keys(transaction, None, None, freeze_key, None, None)
+        
+        operator_key = hedera_client.operator_private_key.getPublicKey.return_value
+        hedera_client.operator_private_key.getPublicKey.assert_called_once_with()
+        transaction.setAdminKey.assert_called_once_with(operator_key)
+        transaction.setSupplyKey.assert_called_once_with(operator_key)
+        transaction.setFreezeKey.assert_called_once_with(freeze_key)
+        transaction.setWipeKey.assert_not_called()
+        transaction.setKycKey.assert_not_called()
+    
+    def test_explicit_keys_skip_operator_key(self):
+        """Test supplying admin and supply keys avoids deriving the operator key"""
+        hedera_client = Mock()
+        service = HTSService(hedera_client=hedera_client)
+        transaction = Mock()
+        admin_key, supply_key = Mock(), Mock()
+        
+        service._set_token_keys(transaction, admin_key, supply_key, None, None, None)
+        
+        hedera_client.operator_private_key.getPublicKey.assert_not_called()
+        transaction.setAdminKey.assert_called_once_with(admin_key)
+        transaction.setSupplyKey.assert_called_once_with(supply_key)
+
+
+class TestHTSServiceClientPool:
+    """Test cases for per-operation client leasing"""
+    
+    @pytest.mark.asyncio
+    async def test_writes_use_least_loaded_pooled_client(self):
+        """Test each write executes on a client leased for that operation"""
+        pool = HederaClientPool(max_clients=2, factory=Mock)
+        
+        with patch('circularity_nexus.blockchain.hts_service.get_hedera_client_pool', return_value=pool):
+            service = HTSService()
+            home_client = service.hedera_client
+            
+            transaction = Mock()
+            signed = transaction.freezeWith.return_value.sign.return_value
+            response = Mock()
+            response.getReceipt = AsyncMock()
+            signed.execute = AsyncMock(return_value=response)
+            
+            await service._execute(transaction)
+            
+            # The service's own lease keeps home_client busy, so a second client serves the write
+            operation_client = signed.execute.call_args[0][0]
+            assert operation_client is not home_client.client
+            assert pool.get_pool_status() == {"clients": 2, "max_clients": 2, "leases": 1}
+            
+            service.close()
+            assert pool.get_pool_status()["leases"] == 0
+
+
+class TestOptimisticSubmitter:
+    """Test cases for windowed optimistic submission"""
+    
+    @pytest.mark.asyncio
+    async def test_submit_applies_backpressure(self):
+        """Test submissions beyond the window wait until a slot frees up"""
+        service = HTSService(hedera_client=Mock())
+        gates = {}
+        
+        async def execute(transaction, wait_for_receipt=True):
+            gates[transaction] = asyncio.Event()
+            await gates[transaction].wait()
+            return transaction, "receipt"
+        
+        service._execute = AsyncMock(side_effect=execute)
+        submitter = OptimisticSubmitter(service, max_in_flight=2)
+        
+        first = await submitter.submit("tx1")
+        await submitter.submit("tx2")
+        third = asyncio.ensure_future(submitter.submit("tx3"))
+        await asyncio.sleep(0)
+        
+        assert submitter.in_flight == 2
+        assert not third.done()
+        
+        gates["tx1"].set()
+        assert await first == ("tx1", "receipt")
+        third_task = await third
+        assert submitter.in_flight == 2
+        
+        gates["tx2"].set()
+        gates["tx3"].set()
+        await submitter.drain()
+        assert await third_task == ("tx3", "receipt")
+        assert submitter.in_flight == 0
@@ -2,9 +2,10 @@
 Unit tests for Blockchain Token Manager
 """
 
+import json
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
-from circularity_nexus.blockchain.token_manager import TokenManager, TokenCategory, WasteTokenType
+from circularity_nexus.blockchain.token_manager import TokenManager, TokenCategory, WasteTokenType, compute_token_amounts
 from circularity_nexus.core.exceptions import BlockchainError, ValidationError
 
 
@@ -33,6 +34,10 @@ class TestTokenManager:
         manager = TokenManager()
         manager.hts_service = mock_hts_service
         manager.hedera_client = mock_hedera_client
+        manager.redis = Mock(
+            hset=AsyncMock(),
+            hmget=AsyncMock(side_effect=lambda key, token_ids: [None] * len(token_ids))
+        )
         return manager
     
     @pytest.mark.asyncio
@@ -145,12 +150,11 @@ class TestTokenManager:
         }
         
         # Mock HTS responses
-        mock_hts_service.mint_tokens.return_value = {
+        mock_hts_service.mint_and_transfer.return_value = {
             "token_id": "0.0.123456",
             "amount_minted": 240,  # 1.0 kg * 0.08 * 0.8 * 100 (decimals) * 3.75 (quality)
             "status": "success"
         }
-        mock_hts_service.transfer_tokens.return_value = {"status": "success"}
         
         # Test minting
         result = await token_manager.mint_waste_tokens(
@@ -169,8 +173,8 @@ class TestTokenManager:
         assert "token_amount_formatted" in result
         
         # Verify services were called
-        mock_hts_service.mint_tokens.assert_called_once()
-        mock_hts_service.transfer_tokens.assert_called_once()
+        mock_hts_service.mint_and_transfer.assert_called_once()
+        mock_hts_service.mint_tokens.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_mint_waste_tokens_invalid_token(self, token_manager):
@@ -183,6 +187,20 @@ class TestTokenManager:
         
         assert "Invalid waste token ID" in str(exc_info.value)
     
+    @pytest.mark.asyncio
+    async def test_mint_rejects_token_of_other_category(self, token_manager):
+        """Test a registered token of another category is rejected without a registry round trip"""
+        token_manager.token_registry["0.0.555555"] = {
+            "category": TokenCategory.WASTE_TOKEN.value,
+            "treasury_account": "0.0.789012"
+        }
+        
+        with pytest.raises(ValidationError) as exc_info:
+            await token_manager.mint_carbon_credits("0.0.555555", 10.0, {})
+        
+        assert "Invalid carbon credit token ID" in str(exc_info.value)
+        token_manager.redis.hmget.assert_not_called()
+    
     @pytest.mark.asyncio
     async def test_mint_carbon_credits_success(self, token_manager, mock_hts_service):
         """Test successful carbon credit minting"""
@@ -194,12 +212,11 @@ class TestTokenManager:
         }
         
         # Mock HTS responses
-        mock_hts_service.mint_tokens.return_value = {
+        mock_hts_service.mint_and_transfer.return_value = {
             "token_id": "0.0.654321",
             "amount_minted": 2500,  # 2.5 kg CO2 / 1000 * 1000 (decimals)
             "status": "success"
         }
-        mock_hts_service.transfer_tokens.return_value = {"status": "success"}
         
         # Test minting
         result = await token_manager.mint_carbon_credits(
@@ -217,8 +234,8 @@ class TestTokenManager:
         assert "verification_data" in result
         
         # Verify services were called
-        mock_hts_service.mint_tokens.assert_called_once()
-        mock_hts_service.transfer_tokens.assert_called_once()
+        mock_hts_service.mint_and_transfer.assert_called_once()
+        mock_hts_service.mint_tokens.assert_not_called()
     
     @pytest.mark.asyncio
     async def test_mint_recycling_certificate_success(self, token_manager, mock_hts_service):
@@ -230,13 +247,12 @@ class TestTokenManager:
         }
         
         # Mock HTS responses
-        mock_hts_service.mint_tokens.return_value = {
+        mock_hts_service.mint_and_transfer.return_value = {
             "token_id": "0.0.987654",
             "amount_minted": 1,
             "serial_numbers": [1],
             "status": "success"
         }
-        mock_hts_service.transfer_tokens.return_value = {"status": "success"}
         
         certificate_data = {
             "certificate_id": "CERT-001",
@@ -269,15 +285,15 @@ class TestTokenManager:
     @pytest.mark.asyncio
     async def test_get_account_portfolio_success(self, token_manager, mock_hedera_client, mock_hts_service):
         """Test successful account portfolio retrieval"""
-        # Mock account balance
-        mock_hedera_client.get_account_balance.return_value = {
+        # Mock account snapshot
+        mock_hedera_client.get_account_token_snapshot = AsyncMock(return_value={
             "hbar_balance": 25.5,
             "tokens": {
-                "0.0.123456": 500,  # Waste tokens
-                "0.0.654321": 1500,  # Carbon credits
-                "0.0.987654": 3  # NFT certificates
+                "0.0.123456": {"balance": 500, "decimals": 2},  # Waste tokens
+                "0.0.654321": {"balance": 1500, "decimals": 3},  # Carbon credits
+                "0.0.987654": {"balance": 3, "decimals": 0}  # NFT certificates
             }
-        }
+        })
         
         # Mock token info responses
         mock_hts_service.get_token_info.side_effect = [
@@ -330,6 +346,222 @@ class TestTokenManager:
         assert waste_token["balance_formatted"] == 5.0  # 500 / 100 (decimals)
         assert waste_token["category"] == TokenCategory.WASTE_TOKEN.value
     
+    @pytest.mark.asyncio
+    async def test_get_account_portfolio_skips_failed_lookups(self, token_manager, mock_hedera_client, mock_hts_service):
+        """Test token info is fetched concurrently and a failed lookup is skipped"""
+        mock_hedera_client.get_account_token_snapshot = AsyncMock(return_value={
+            "hbar_balance": 10.0,
+            "tokens": {
+                "0.0.123456": {"balance": 500, "decimals": None},
+                "0.0.654321": {"balance": 1500, "decimals": None},
+                "0.0.555555": {"balance": 0, "decimals": None}
+            }
+        })
+        
+        async def get_token_info(token_id):
+            if token_id == "0.0.654321":
+                raise BlockchainError("Token info query failed: BUSY")
+            return {"symbol": "PET-GLOBAL", "name": "PET Plastic Token", "decimals": 2, "token_type": "fungible"}
+        
+        mock_hts_service.get_token_info = AsyncMock(side_effect=get_token_info)
+        
+        result = await token_manager.get_account_portfolio("0.0.111111")
+        
+        assert list(result["tokens"]) == ["0.0.123456"]
+        assert result["tokens"]["0.0.123456"]["balance_formatted"] == 5.0
+        assert result["summary"]["total_tokens"] == 1
+        assert mock_hts_service.get_token_info.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_carbon_credit_scale_registered_once(self, token_manager, mock_hts_service):
+        """Test the registered scale converts credits to raw units on mint"""
+        mock_hts_service.create_fungible_token = AsyncMock(return_value={
+            "token_id": "0.0.654321",
+            "decimals": 3,
+            "treasury_account": "0.0.789012",
+            "status": "success"
+        })
+        mock_hts_service.mint_tokens = AsyncMock(return_value={"token_id": "0.0.654321", "status": "success"})
+        
+        token_info = await token_manager.create_carbon_credit_token(vintage_year=2024)
+        result = await token_manager.mint_carbon_credits("0.0.654321", 2500.0, {"auditor": "VCS"})
+        
+        assert token_info["scale"] == 1000
+        assert result["token_amount_raw"] == 2500
+        mock_hts_service.mint_tokens.assert_awaited_once_with(token_id="0.0.654321", amount=2500, high_volume=False)
+    
+    @pytest.mark.asyncio
+    async def test_registry_shared_across_workers(self, token_manager, mock_hts_service):
+        """Test tokens registered by one worker are found by another through Redis"""
+        mock_hts_service.create_fungible_token = AsyncMock(return_value={
+            "token_id": "0.0.654321",
+            "decimals": 3,
+            "treasury_account": "0.0.789012",
+            "status": "success"
+        })
+        await token_manager.create_carbon_credit_token(vintage_year=2024)
+        key, token_id, payload = token_manager.redis.hset.call_args.args
+        
+        other_worker = TokenManager()
+        other_worker.redis = Mock(hmget=AsyncMock(return_value=[payload]))
+        token_info = await other_worker._get_registry("0.0.654321")
+        
+        assert key == "circ:token_registry"
+        assert token_id == "0.0.654321"
+        assert token_info["category"] == TokenCategory.CARBON_CREDIT.value
+        assert token_info["scale"] == 1000
+        assert await other_worker._get_registry("0.0.654321") is token_info
+        other_worker.redis.hmget.assert_awaited_once_with("circ:token_registry", ["0.0.654321"])
+    
+    @pytest.mark.asyncio
+    async def test_sharded_waste_token_mints_and_aggregates(self, token_manager, mock_hedera_client, mock_hts_service):
+        """Test a sharded waste token mints per-recipient shards and sums them in portfolios"""
+        async def create_fungible_token(**kwargs):
+            index = kwargs["symbol"].rsplit("-", 1)[1]
+            return {
+                "token_id": f"0.0.50{index}",
+                "name": kwargs["name"],
+                "symbol": kwargs["symbol"],
+                "decimals": 2,
+                "token_type": "fungible",
+                "max_supply": kwargs["max_supply"],
+                "treasury_account": "0.0.789012",
+                "status": "success"
+            }
+        
+        mock_hts_service.create_fungible_token = AsyncMock(side_effect=create_fungible_token)
+        mock_hts_service.mint_and_transfer = AsyncMock(side_effect=lambda **kwargs: {"token_id": kwargs["token_id"]})
+        
+        token_info = await token_manager.create_waste_token(
+            WasteTokenType.PET_PLASTIC, max_supply=1000, shards=4
+        )
+        first = await token_manager.mint_waste_tokens("0.0.500", 1.0, recipient_account="0.0.111111")
+        second = await token_manager.mint_waste_tokens("0.0.500", 2.0, recipient_account="0.0.111111")
+        
+        assert token_info["token_id"] == "0.0.500"
+        assert token_info["symbol"] == "PET-GLOBAL"
+        assert token_info["shards"] == ["0.0.500", "0.0.501", "0.0.502", "0.0.503"]
+        assert token_info["max_supply"] == 250
+        assert first["token_id"] == second["token_id"]
+        assert first["token_id"] in token_info["shards"]
+        assert first["logical_token_id"] == "0.0.500"
+        
+        mock_hedera_client.get_account_token_snapshot = AsyncMock(return_value={
+            "hbar_balance": 1.0,
+            "tokens": {"0.0.501": {"balance": 300, "decimals": 2}, "0.0.503": {"balance": 200, "decimals": 2}}
+        })
+        mock_hts_service.get_token_info = AsyncMock()
+        portfolio = await token_manager.get_account_portfolio("0.0.111111")
+        
+        # Registered tokens are described by the registry, not an HTS query
+        mock_hts_service.get_token_info.assert_not_called()
+        
+        assert list(portfolio["tokens"]) == ["0.0.500"]
+        assert portfolio["tokens"]["0.0.500"]["symbol"] == "PET-GLOBAL"
+        assert portfolio["tokens"]["0.0.500"]["balance_raw"] == 500
+        assert portfolio["tokens"]["0.0.500"]["balance_formatted"] == 5.0
+        assert portfolio["summary"]["waste_tokens"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_sharded_waste_token_caps_sum_to_max_supply(self, token_manager, mock_hts_service):
+        """Test shard caps add up to max_supply exactly, with the remainder on the first shards"""
+        mock_hts_service.create_fungible_token = AsyncMock(
+            side_effect=lambda **kwargs: {"token_id": f"0.0.50{kwargs['symbol'][-1]}", "status": "success"}
+        )
+        
+        await token_manager.create_waste_token(WasteTokenType.PET_PLASTIC, max_supply=10, shards=3)
+        
+        caps = [c.kwargs["max_supply"] for c in mock_hts_service.create_fungible_token.call_args_list]
+        assert caps == [4, 3, 3]
+        
+        with pytest.raises(ValidationError):
+            await token_manager.create_waste_token(WasteTokenType.PET_PLASTIC, max_supply=2, shards=3)
+    
+    @pytest.mark.asyncio
+    async def test_sharded_waste_token_registers_created_shards_on_failure(self, token_manager, mock_hts_service):
+        """Test shards that were created are registered and failures reported when one shard fails"""
+        async def create_fungible_token(**kwargs):
+            index = kwargs["symbol"][-1]
+            if index == "1":
+                raise BlockchainError("TOKEN_CREATE failed")
+            return {"token_id": f"0.0.50{index}", "symbol": kwargs["symbol"], "status": "success"}
+        
+        mock_hts_service.create_fungible_token = AsyncMock(side_effect=create_fungible_token)
+        
+        token_info = await token_manager.create_waste_token(WasteTokenType.PET_PLASTIC, shards=3)
+        
+        assert token_info["token_id"] == "0.0.500"
+        assert token_info["shards"] == ["0.0.500", "0.0.502"]
+        assert token_info["status"] == "partial"
+        assert token_info["failed_shards"] == [{"symbol": "PET-GLOBAL-1", "error": "TOKEN_CREATE failed"}]
+        assert token_manager.token_registry["0.0.502"]["shard_of"] == "0.0.500"
+    
+    @pytest.mark.asyncio
+    async def test_certificate_metadata_encoded_once(self, token_manager, mock_hts_service):
+        """Test certificate metadata is minted as compact JSON bytes"""
+        token_manager.token_registry["0.0.987654"] = {
+            "category": TokenCategory.RECYCLING_CERTIFICATE.value,
+            "treasury_account": "0.0.789012"
+        }
+        mock_hts_service.mint_and_transfer = AsyncMock(return_value={"token_id": "0.0.987654", "status": "success"})
+        
+        result = await token_manager.mint_recycling_certificate(
+            "0.0.987654", {"certificate_id": "CERT-002", "waste_type": "GLASS"}, "0.0.333333"
+        )
+        
+        metadata = mock_hts_service.mint_and_transfer.call_args.kwargs["metadata"]
+        assert len(metadata) == 1 and isinstance(metadata[0], bytes)
+        assert json.loads(metadata[0]) == result["metadata"]
+        issue_date = next(a for a in result["metadata"]["attributes"] if a["trait_type"] == "Issue Date")
+        assert issue_date["value"].endswith("Z")
+    
+    @pytest.mark.asyncio
+    async def test_mint_waste_tokens_batch(self, token_manager, mock_hts_service):
+        """Test batch minting computes every row and reports failures per row"""
+        token_manager.token_registry["0.0.123456"] = {
+            "category": TokenCategory.WASTE_TOKEN.value,
+            "base_value_per_unit": 0.5,
+            "decimals": 2,
+            "scale": 100,
+            "treasury_account": "0.0.789012"
+        }
+        mock_hts_service.mint_and_transfer = AsyncMock(side_effect=[
+            {"token_id": "0.0.123456", "status": "success"},
+            BlockchainError("INSUFFICIENT_TX_FEE")
+        ])
+        mock_hts_service.mint_tokens = AsyncMock(return_value={"token_id": "0.0.123456", "status": "success"})
+        
+        results = await token_manager.mint_waste_tokens_batch(
+            "0.0.123456", [2.0, 1.0, 4.0], ["EXCELLENT", "GOOD", "POOR"], ["0.0.1", "0.0.2", None]
+        )
+        
+        assert [r["token_amount_raw"] for r in results] == [100, 40, 60]
+        assert [r["status"] for r in results] == ["success", "failed", "success"]
+        assert "INSUFFICIENT_TX_FEE" in results[1]["error"]
+        assert results[2]["recipient_account"] is None
+        mock_hts_service.mint_tokens.assert_awaited_once_with(token_id="0.0.123456", amount=60, high_volume=False)
+    
+    @pytest.mark.asyncio
+    async def test_mint_waste_tokens_batch_length_mismatch(self, token_manager):
+        """Test batch minting rejects rows of different lengths"""
+        with pytest.raises(ValidationError):
+            await token_manager.mint_waste_tokens_batch("0.0.123456", [1.0], [], [None])
+    
+    def test_compute_token_amounts_matches_single_mint(self):
+        """Test batched amounts round the same way as a single mint"""
+        weights = [0.1, 1.7, 12.345]
+        multipliers = [1.0, 0.8, 0.3]
+        
+        assert compute_token_amounts(weights, multipliers, 0.08, 100) == [
+            int(w * 0.08 * m * 100) for w, m in zip(weights, multipliers)
+        ]
+    
+    def test_waste_token_configs_precompute_scale(self, token_manager):
+        """Test every waste token config carries its raw-unit scale"""
+        for config in token_manager.waste_token_configs.values():
+            assert config["scale"] == 10 ** config["decimals"]
+        assert TokenManager().waste_token_configs is token_manager.waste_token_configs
+    
     def test_get_quality_multiplier(self, token_manager):
         """Test quality multiplier calculation"""
         assert token_manager._get_quality_multiplier("EXCELLENT") == 1.0
@@ -377,7 +609,7 @@ class TestTokenManager:
     
     def test_load_waste_token_configs(self, token_manager):
         """Test waste token configurations loading"""
-        configs = token_manager._load_waste_token_configs()
+        configs = token_manager.waste_token_configs
         
         # Check all waste types are configured
         expected_types = [
@@ -429,6 +661,7 @@ class TestTokenManager:
             await token_manager.create_waste_token(WasteTokenType.PET_PLASTIC)
         
         assert "Waste token creation failed" in str(exc_info.value)
+        assert str(exc_info.value.__cause__) == "HTS API error"
     
     @pytest.mark.asyncio
     async def test_mint_tokens_without_recipient(self, token_manager, mock_hts_service):
@@ -6,7 +6,7 @@ import pytest
 from unittest.mock import patch
 from pydantic import ValidationError
 
-from circularity_nexus.core.config import Settings
+from circularity_nexus.core.config import Settings, ensure_upload_dir, get_settings
 
 
 class TestSettings:
@@ -65,6 +65,20 @@ class TestSettings:
             expected_extensions = ['.jpg', '.png', '.gif', '.bmp']
             assert settings.ALLOWED_EXTENSIONS == expected_extensions
     
+    def test_json_list_parsing(self):
+        """Test list settings still accept JSON arrays"""
+        with patch.dict('os.environ', {
+            'SECRET_KEY': 'test-secret-key-32-characters-long',
+            'DATABASE_URL': 'sqlite+aiosqlite:///./test.db',
+            'HEDERA_ACCOUNT_ID': '0.0.123456',
+            'HEDERA_PRIVATE_KEY': 'test-private-key',
+            'HEDERA_PUBLIC_KEY': 'test-public-key',
+            'CORS_METHODS': '["GET", "POST"]'
+        }):
+            settings = Settings()
+            
+            assert settings.CORS_METHODS == ['GET', 'POST']
+    
     def test_groq_configuration(self):
         """Test Groq AI configuration"""
         with patch.dict('os.environ', {
@@ -181,8 +195,30 @@ class TestSettings:
                 settings = Settings()
                 
                 assert settings.UPLOAD_DIR == upload_path
+                assert not os.path.exists(upload_path)
+                
+                ensure_upload_dir(settings)
                 assert os.path.exists(upload_path)
     
+    def test_get_settings_is_cached(self):
+        """Test settings are parsed once until the cache is cleared"""
+        get_settings.cache_clear()
+        try:
+            with patch.dict('os.environ', {
+                'SECRET_KEY': 'test-secret-key-32-characters-long',
+                'DATABASE_URL': 'sqlite+aiosqlite:///./test.db',
+                'HEDERA_ACCOUNT_ID': '0.0.123456',
+                'HEDERA_PRIVATE_KEY': 'test-private-key',
+                'HEDERA_PUBLIC_KEY': 'test-public-key',
+                'APP_NAME': 'Cached Settings'
+            }):
+                first = get_settings()
+            
+            assert get_settings() is first
+            assert first.APP_NAME == 'Cached Settings'
+        finally:
+            get_settings.cache_clear()
+    
     def test_development_vs_production_settings(self):
         """Test different settings for development vs production"""
         # Development settings
@@ -0,0 +1,54 @@
+"""
+Unit tests for event loop configuration
+"""
+
+import asyncio
+import sys
+import pytest
+from unittest.mock import Mock, patch
+from circularity_nexus.core.event_loop import install_uvloop, http_parser
+
+
+class TestInstallUvloop:
+    """Test uvloop installation"""
+    
+    @pytest.fixture(autouse=True)
+    def restore_policy(self):
+        """Restore the event loop policy after each test"""
+        policy = asyncio.get_event_loop_policy()
+        yield
+        asyncio.set_event_loop_policy(policy)
+    
+    def test_install_uvloop_sets_policy(self):
+        """Test uvloop policy is installed when uvloop is importable"""
+        mock_uvloop = Mock()
+        mock_uvloop.EventLoopPolicy.return_value = asyncio.DefaultEventLoopPolicy()
+        
+        with patch.dict(sys.modules, {"uvloop": mock_uvloop}):
+            assert install_uvloop() is True
+        
+        mock_uvloop.EventLoopPolicy.assert_called_once()
+        assert asyncio.get_event_loop_policy() is mock_uvloop.EventLoopPolicy.return_value
+    
+    def test_install_uvloop_missing(self):
+        """Test fallback to the default loop when uvloop is unavailable"""
+        policy = asyncio.get_event_loop_policy()
+        
+        with patch.dict(sys.modules, {"uvloop": None}):
+            assert install_uvloop() is False
+        
+        assert asyncio.get_event_loop_policy() is policy
+
+
+class TestHttpParser:
+    """Test HTTP parser selection"""
+    
+    def test_http_parser_prefers_httptools(self):
+        """Test httptools is chosen when importable"""
+        with patch.dict(sys.modules, {"httptools": Mock()}):
+            assert http_parser() == "httptools"
+    
+    def test_http_parser_missing(self):
+        """Test fallback to h11 when httptools is unavailable"""
+        with patch.dict(sys.modules, {"httptools": None}):
+            assert http_parser() == "h11"
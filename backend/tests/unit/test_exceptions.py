@@ -2,6 +2,7 @@
 Unit tests for custom exceptions
 """
 
+import orjson
 import pytest
 from circularity_nexus.core.exceptions import (
     CircularityNexusException,
@@ -275,3 +276,31 @@ class TestExceptionInheritance:
         
         for exc in exceptions:
             assert 400 <= exc.status_code < 600  # Valid HTTP error range
+
+
+class TestExceptionJsonBody:
+    """Test serialized error payloads"""
+    
+    def test_default_instances_reuse_prebuilt_body(self):
+        """Test no-argument exceptions return the body built at class creation"""
+        first = NotFoundError().json_body()
+        second = NotFoundError().json_body()
+        
+        assert first is second
+        assert orjson.loads(first) == {"detail": "Resource not found", "error_code": "NOT_FOUND_ERROR"}
+    
+    def test_custom_detail_is_serialized(self):
+        """Test a custom detail bypasses the prebuilt body"""
+        body = NotFoundError("Bin 42 not found").json_body()
+        
+        assert body is not NotFoundError._default_payload[2]
+        assert orjson.loads(body) == {"detail": "Bin 42 not found", "error_code": "NOT_FOUND_ERROR"}
+    
+    def test_required_detail_has_no_prebuilt_body(self):
+        """Test exceptions without a default detail serialize every time"""
+        assert ValidationError._default_payload is None
+        assert CircularityNexusException._default_payload is None
+        assert orjson.loads(ValidationError("Bad weight").json_body()) == {
+            "detail": "Bad weight",
+            "error_code": "VALIDATION_ERROR"
+        }
@@ -4,7 +4,10 @@ Unit tests for Groq service
 
 import pytest
 from unittest.mock import Mock, patch, AsyncMock
-from circularity_nexus.services.groq_service import GroqService
+import asyncio
+import threading
+import json
+from circularity_nexus.services.groq_service import GroqService, BatchedGroqClient, get_groq_service
 from circularity_nexus.core.exceptions import AIProcessingError
 
 
@@ -22,11 +25,14 @@ class TestGroqService:
     @pytest.fixture
     def groq_service(self, mock_groq_client):
         """GroqService instance with mocked client"""
-        with patch('circularity_nexus.services.groq_service.settings') as mock_settings:
+        with patch('circularity_nexus.services.groq_service.get_settings') as get_settings:
+            mock_settings = get_settings.return_value
             mock_settings.GROQ_API_KEY = "test-key"
             mock_settings.GROQ_MODEL = "llama3-8b-8192"
+            mock_settings.REDIS_URL = "redis://localhost:6379/0"
             service = GroqService()
             service.client = mock_groq_client
+            service.redis = Mock(get=AsyncMock(return_value=None), set=AsyncMock())
             return service
     
     @pytest.mark.asyncio
@@ -59,6 +65,8 @@ class TestGroqService:
         assert result["estimated_weight_kg"] == 0.5
         assert "Clean thoroughly" in result["recommendations"]
         mock_groq_client.chat.completions.create.assert_called_once()
+        call_kwargs = mock_groq_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["response_format"] == {"type": "json_object"}
     
     @pytest.mark.asyncio
     async def test_classify_waste_json_parse_error(self, groq_service, mock_groq_client):
@@ -137,12 +145,182 @@ class TestGroqService:
         
         assert "Failed to classify waste" in str(exc_info.value)
     
+    @pytest.mark.asyncio
+    async def test_classification_shared_through_redis(self, groq_service, mock_groq_client):
+        """Test a parsed classification is cached and served without a Groq call"""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = '{"detected_type": "PET", "confidence": 0.92}'
+        mock_groq_client.chat.completions.create.return_value = mock_response
+        
+        result = await groq_service.classify_waste_from_description("Plastic bottle ", 0.5)
+        
+        key, raw = groq_service.redis.set.call_args.args
+        assert groq_service.redis.set.call_args.kwargs["ex"] == GroqService.CLASSIFICATION_CACHE_TTL_SECONDS
+        assert key == groq_service._classification_key("plastic bottle", 0.501, None)
+        
+        groq_service.redis.get = AsyncMock(return_value=raw.decode())
+        cached = await groq_service.classify_waste_from_description("plastic bottle", 0.5)
+        
+        assert cached == result
+        mock_groq_client.chat.completions.create.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_classification_fallback_not_cached(self, groq_service, mock_groq_client):
+        """Test unparseable responses are not cached"""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "Invalid JSON response"
+        mock_groq_client.chat.completions.create.return_value = mock_response
+        
+        await groq_service.classify_waste_from_description("Some waste", 1.0)
+        
+        groq_service.redis.set.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_tips_and_carbon_impact_cached(self, groq_service, mock_groq_client):
+        """Test repeated tips and carbon impact requests reuse the first answer"""
+        tips_response = Mock()
+        tips_response.choices = [Mock()]
+        tips_response.choices[0].message.content = '["Rinse thoroughly"]'
+        carbon_response = Mock()
+        carbon_response.choices = [Mock()]
+        carbon_response.choices[0].message.content = '{"co2_saved_kg": 1.5}'
+        mock_groq_client.chat.completions.create.side_effect = [tips_response, carbon_response]
+        
+        tips = await groq_service.generate_recycling_tips("PET")
+        tips.append("mutated by caller")
+        impact = await groq_service.calculate_carbon_impact("PET", 1.0)
+        
+        assert await groq_service.generate_recycling_tips("PET") == ["Rinse thoroughly"]
+        assert await groq_service.calculate_carbon_impact("PET", 1.0) == impact
+        assert mock_groq_client.chat.completions.create.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_classifications_batched(self, groq_service, mock_groq_client):
+        """Test concurrent classifications share one Groq call and get their own result"""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = json.dumps([
+            {"detected_type": "PET", "confidence": 0.9},
+            {"detected_type": "GLASS", "confidence": 0.8},
+            {"detected_type": "PAPER", "confidence": 0.7}
+        ])
+        mock_groq_client.chat.completions.create.return_value = mock_response
+        
+        groq_service.start_batching(max_wait_ms=50)
+        try:
+            results = await asyncio.gather(
+                groq_service.classify_waste_from_description("bottle", 0.5),
+                groq_service.classify_waste_from_description("jar", 0.3),
+                groq_service.classify_waste_from_description("newspaper", 1.0)
+            )
+        finally:
+            await groq_service.stop_batching()
+        
+        assert [r["detected_type"] for r in results] == ["PET", "GLASS", "PAPER"]
+        mock_groq_client.chat.completions.create.assert_called_once()
+        prompt = mock_groq_client.chat.completions.create.call_args.kwargs["messages"][1]["content"]
+        assert "1) Description: bottle" in prompt and "3) Description: newspaper" in prompt
+        # JSON mode only allows objects; batches answer with an array
+        assert "response_format" not in mock_groq_client.chat.completions.create.call_args.kwargs
+    
+    @pytest.mark.asyncio
+    async def test_stop_fails_requests_being_batched(self, groq_service, mock_groq_client):
+        """Test requests already pulled into a forming batch fail on stop instead of hanging"""
+        groq_service.start_batching(max_wait_ms=10_000)
+        batcher = groq_service.batcher
+        calls = [
+            asyncio.create_task(batcher.classify("bottle", 0.5)),
+            asyncio.create_task(batcher.classify("jar", 0.3))
+        ]
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert batcher._queue.empty()
+        
+        await groq_service.stop_batching()
+        
+        for call in calls:
+            with pytest.raises(AIProcessingError, match="batching stopped"):
+                await asyncio.wait_for(call, 1)
+        mock_groq_client.chat.completions.create.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_completions_run_off_the_event_loop(self, groq_service, mock_groq_client):
+        """Test a slow Groq call leaves the event loop free for other work"""
+        release = threading.Event()
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = '{"detected_type": "PET"}'
+        
+        def slow_create(**kwargs):
+            release.wait(5)
+            return mock_response
+        
+        mock_groq_client.chat.completions.create.side_effect = slow_create
+        
+        call = asyncio.ensure_future(groq_service._request_classification("bottle", 0.5, None))
+        await asyncio.sleep(0.05)
+        
+        assert not call.done()
+        release.set()
+        assert await asyncio.wait_for(call, 1) == {"detected_type": "PET"}
+    
+    @pytest.mark.asyncio
+    async def test_unusable_batch_reply_retried_individually(self, groq_service, mock_groq_client):
+        """Test a batch reply of the wrong length falls back to one call per item"""
+        def reply(content):
+            response = Mock()
+            response.choices = [Mock()]
+            response.choices[0].message.content = content
+            return response
+        
+        mock_groq_client.chat.completions.create.side_effect = [
+            reply('[{"detected_type": "PET"}]'),
+            reply('{"detected_type": "PET"}'),
+            reply('{"detected_type": "GLASS"}')
+        ]
+        
+        results = await groq_service._request_classifications([("bottle", 0.5, None), ("jar", 0.3, None)])
+        
+        assert [r["detected_type"] for r in results] == ["PET", "GLASS"]
+        assert mock_groq_client.chat.completions.create.call_count == 3
+    
+    @pytest.mark.asyncio
+    async def test_batcher_stop_fails_queued_requests(self, groq_service):
+        """Test requests still queued when batching stops are failed, not left hanging"""
+        batcher = BatchedGroqClient(groq_service)
+        pending = asyncio.ensure_future(batcher.classify("bottle", 0.5))
+        await asyncio.sleep(0)
+        
+        await batcher.stop()
+        
+        with pytest.raises(AIProcessingError):
+            await pending
+    
     def test_groq_service_initialization_without_api_key(self):
         """Test GroqService initialization without API key"""
-        with patch('circularity_nexus.services.groq_service.settings') as mock_settings:
+        with patch('circularity_nexus.services.groq_service.get_settings') as get_settings:
+            mock_settings = get_settings.return_value
             mock_settings.GROQ_API_KEY = None
             
             with pytest.raises(AIProcessingError) as exc_info:
                 GroqService()
             
             assert "Groq API key not configured" in str(exc_info.value)
+    
+    def test_get_groq_service_built_once_on_first_use(self, mock_groq_client):
+        """Test the shared service reads settings lazily and is only built once"""
+        get_groq_service.cache_clear()
+        try:
+            with patch('circularity_nexus.services.groq_service.get_settings') as get_settings:
+                mock_settings = get_settings.return_value
+                mock_settings.GROQ_API_KEY = "test-key"
+                mock_settings.REDIS_URL = "redis://localhost:6379/0"
+                
+                service = get_groq_service()
+                
+                assert isinstance(service, GroqService)
+                assert get_groq_service() is service
+        finally:
+            get_groq_service.cache_clear()
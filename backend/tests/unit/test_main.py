@@ -0,0 +1,144 @@
+"""
+Unit tests for application entry points
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from fastapi.testclient import TestClient
+from loguru import logger
+
+from circularity_nexus.core.config import get_settings
+from circularity_nexus.main import create_app, gunicorn_options, main, GZIP_MINIMUM_SIZE
+
+
+@pytest.fixture
+def settings():
+    """The settings instance the entry points read when they run"""
+    return get_settings()
+
+
+class TestGunicornOptions:
+    """Test Gunicorn settings for production serving"""
+    
+    def test_workers_default_to_cpu_formula(self, settings):
+        """Test worker count defaults to 2 * CPU cores + 1"""
+        with patch.object(settings, 'GUNICORN_WORKERS', None), \
+             patch('circularity_nexus.main.os.cpu_count', return_value=2):
+            options = gunicorn_options()
+        
+        assert options["workers"] == 5
+        assert options["worker_class"] == "uvicorn_worker.UvicornWorker"
+        assert options["bind"] == f"{settings.HOST}:{settings.PORT}"
+    
+    def test_workers_setting_overrides_formula(self, settings):
+        """Test an explicit GUNICORN_WORKERS wins"""
+        with patch.object(settings, 'GUNICORN_WORKERS', 2):
+            assert gunicorn_options()["workers"] == 2
+
+
+class TestCreateApp:
+    """Test application middleware configuration"""
+    
+    def test_cors_preflight_is_cacheable(self, settings):
+        """Test preflight responses let browsers cache them for CORS_MAX_AGE"""
+        client = TestClient(create_app(), base_url="http://localhost")
+        
+        response = client.options("/health", headers={
+            "Origin": settings.CORS_ORIGINS[0],
+            "Access-Control-Request-Method": "GET"
+        })
+        
+        assert response.status_code == 200
+        assert response.headers["access-control-max-age"] == str(settings.CORS_MAX_AGE)
+    
+    def test_large_responses_are_gzipped(self):
+        """Test responses above GZIP_MINIMUM_SIZE are compressed, small ones are not"""
+        app = create_app()
+        
+        @app.get("/large")
+        async def large():
+            return {"items": ["x" * 100] * (GZIP_MINIMUM_SIZE // 50)}
+        
+        client = TestClient(app, base_url="http://localhost")
+        
+        large_response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+        small_response = client.get("/health", headers={"Accept-Encoding": "gzip"})
+        
+        assert large_response.headers["content-encoding"] == "gzip"
+        assert len(large_response.json()["items"]) == GZIP_MINIMUM_SIZE // 50
+        assert "content-encoding" not in small_response.headers
+    
+    def test_requests_are_access_logged(self, settings):
+        """Test the access log middleware records method, path, status and duration"""
+        with patch.object(settings, 'DEBUG', False):
+            client = TestClient(create_app(), base_url="http://localhost")
+        
+        records = []
+        sink_id = logger.add(lambda message: records.append(message.record), level="INFO")
+        try:
+            client.get("/health")
+        finally:
+            logger.remove(sink_id)
+        
+        access = [r for r in records if r["message"].startswith("GET /health ")]
+        assert len(access) == 1
+        extra = access[0]["extra"]
+        # Readable without {extra} in the format, structured for JSON output
+        assert access[0]["message"] == f"GET /health 200 {extra['dur_ms']}ms"
+        assert extra["method"] == "GET"
+        assert extra["path"] == "/health"
+        assert extra["status"] == 200
+        assert extra["dur_ms"] >= 0
+
+
+class TestMain:
+    """Test the uvicorn entry point"""
+    
+    def test_server_access_log_only_in_debug(self, settings):
+        """Test uvicorn's own access log is turned off outside DEBUG"""
+        for debug in (False, True):
+            with patch.object(settings, 'DEBUG', debug), \
+                 patch('circularity_nexus.main.uvicorn.run') as run:
+                main()
+            
+            assert run.call_args.kwargs["access_log"] is debug
+
+
+class TestExceptionMapping:
+    """Test application errors are mapped to JSON responses"""
+    
+    def test_application_errors_become_json(self, settings):
+        """Test CircularityNexusException subclasses map to status, detail and error_code"""
+        from circularity_nexus.core.exceptions import NotFoundError
+        
+        app = create_app()
+        
+        @app.get("/missing")
+        async def missing():
+            raise NotFoundError("Submission not found")
+        
+        client = TestClient(app, base_url="http://localhost")
+        response = client.get("/missing", headers={"Origin": settings.CORS_ORIGINS[0]})
+        
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Submission not found", "error_code": "NOT_FOUND_ERROR"}
+        assert response.headers["access-control-allow-origin"] == settings.CORS_ORIGINS[0]
+    
+    def test_http_exceptions_keep_headers(self):
+        """Test HTTPException responses use the default handler and keep their headers"""
+        from fastapi import HTTPException
+        
+        app = create_app()
+        
+        @app.get("/private")
+        async def private():
+            raise HTTPException(status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"})
+        
+        client = TestClient(app, base_url="http://localhost")
+        response = client.get("/private")
+        
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Not authenticated"}
+        assert response.headers["www-authenticate"] == "Bearer"
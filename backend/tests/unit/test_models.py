@@ -309,3 +309,56 @@ class TestModelRelationships:
         assert Transaction.__tablename__ == "transactions"
         assert SmartBin.__tablename__ == "smart_bins"
         assert RecyclingVault.__tablename__ == "recycling_vaults"
+    
+    def test_query_indexes(self):
+        """Test composite and partial indexes are created"""
+        from sqlalchemy import create_engine, inspect
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.schema import CreateIndex
+        from circularity_nexus.core.database import Base
+        
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        inspector = inspect(engine)
+        
+        vault_indexes = {ix["name"]: ix["column_names"] for ix in inspector.get_indexes("recycling_vaults")}
+        assert vault_indexes["ix_vault_user_status"] == ["user_id", "status"]
+        assert vault_indexes["ix_vault_active_user_type"] == ["user_id", "vault_type"]
+        submission_indexes = {ix["name"]: ix["column_names"] for ix in inspector.get_indexes("waste_submissions")}
+        assert submission_indexes["ix_ws_user_status_created"] == ["user_id", "status", "created_at"]
+        transaction_indexes = {ix["name"]: ix["column_names"] for ix in inspector.get_indexes("transactions")}
+        assert transaction_indexes["ix_tx_user_created"] == ["user_id", "created_at"]
+        
+        pending_index = next(ix for ix in WasteSubmission.__table__.indexes if ix.name == "ix_ws_pending_created")
+        ddl = str(CreateIndex(pending_index).compile(dialect=postgresql.dialect()))
+        assert "WHERE status = 'PENDING'" in ddl
+    
+    @pytest.mark.asyncio
+    async def test_image_urls_round_trip_as_list(self):
+        """Test image URLs are stored and loaded as a native list"""
+        from sqlalchemy import select
+        from sqlalchemy.dialects import postgresql
+        from sqlalchemy.ext.asyncio import create_async_engine
+        from circularity_nexus.core.database import Base, engine_options
+        
+        database_url = "sqlite+aiosqlite:///:memory:"
+        engine = create_async_engine(database_url, **engine_options(database_url))
+        urls = ["https://example.com/a.jpg", "https://example.com/b.jpg"]
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                
+                table = WasteSubmission.__table__
+                await conn.execute(table.insert().values(
+                    user_id=1,
+                    waste_type=WasteType.GLASS,
+                    estimated_weight_kg=2.0,
+                    image_urls=urls
+                ))
+                stored = (await conn.execute(select(table.c.image_urls))).scalar_one()
+        finally:
+            await engine.dispose()
+        
+        assert stored == urls
+        column_type = WasteSubmission.__table__.c.image_urls.type
+        assert str(column_type.compile(dialect=postgresql.dialect())) == "JSONB"
@@ -0,0 +1,23 @@
+"""
+Unit tests for response classes
+"""
+
+from circularity_nexus.core.responses import ORJSONResponse
+
+
+class TestORJSONResponse:
+    """Test orjson-backed JSON responses"""
+    
+    def test_renders_compact_json(self):
+        """Test bodies are compact JSON with the JSON media type"""
+        response = ORJSONResponse({"status": "healthy", "version": "1.0.0"})
+        
+        assert response.body == b'{"status":"healthy","version":"1.0.0"}'
+        assert response.media_type == "application/json"
+    
+    def test_renders_non_string_keys(self):
+        """Test integer keys are serialized as strings"""
+        response = ORJSONResponse({1: "one"}, status_code=404)
+        
+        assert response.body == b'{"1":"one"}'
+        assert response.status_code == 404
@@ -0,0 +1,31 @@
+"""
+Unit tests for UTC timestamp helpers
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+from circularity_nexus.core.timestamps import utc_now_iso, to_iso
+
+
+class TestTimestamps:
+    """Test timestamp formatting"""
+    
+    def test_utc_now_iso_format(self):
+        """Test timestamps match the isoformat() + "Z" layout"""
+        with patch('circularity_nexus.core.timestamps.time.time_ns', return_value=1700000000_250000000):
+            assert utc_now_iso() == "2023-11-14T22:13:20.250000Z"
+    
+    def test_utc_now_iso_reformats_on_new_second(self):
+        """Test the cached prefix is refreshed when the second changes"""
+        with patch('circularity_nexus.core.timestamps.time.time_ns', return_value=1700000000_500000000):
+            first = utc_now_iso()
+        with patch('circularity_nexus.core.timestamps.time.time_ns', return_value=1700000061_000001000):
+            second = utc_now_iso()
+        
+        assert first == "2023-11-14T22:13:20.500000Z"
+        assert second == "2023-11-14T22:14:21.000001Z"
+    
+    def test_to_iso(self):
+        """Test datetime formatting always includes microseconds"""
+        assert to_iso(datetime(2025, 1, 2, 3, 4, 5)) == "2025-01-02T03:04:05.000000Z"
+        assert to_iso(datetime(2025, 1, 2, 3, 4, 5, 123)) == "2025-01-02T03:04:05.000123Z"